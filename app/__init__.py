@@ -11,8 +11,16 @@ from app.config import Config
 from app.routes.index import index_bp
 from app.routes.api import api_bp
 from app.routes.contact import contact_bp
+from app.routes.fragments import fragments_bp
+from app.routes.admin import admin_bp
 from app.logger import setup_logging
 from app.extensions import limiter
+from app.preload import warm_up
+from app.tenants import init_tenants
+from app.health import init_health
+from app.templating import configure_bytecode_cache
+from app.assets import init_assets
+from app.diagnostics import start_tracing
 
 
 def create_app() -> Flask:
@@ -27,6 +35,11 @@ def create_app() -> Flask:
     app.config.from_object(Config)
 
     setup_logging(app)
+    # Trace from the start, so the warm-up allocations show up in reports too
+    if app.config.get("TRACEMALLOC_FRAMES"):
+        start_tracing(app.config["TRACEMALLOC_FRAMES"])
+    configure_bytecode_cache(app)
+    init_assets(app)
     # Only log in the worker that serves (avoid duplicate when Flask reloader runs two processes)
     if not app.debug or os.environ.get("WERKZEUG_RUN_MAIN") == "true":
         app.logger.info(
@@ -38,5 +51,13 @@ def create_app() -> Flask:
     app.register_blueprint(index_bp)
     app.register_blueprint(api_bp)
     app.register_blueprint(contact_bp)
+    app.register_blueprint(fragments_bp)
+    app.register_blueprint(admin_bp)
     limiter.init_app(app)
+    init_tenants(app)
+    init_health(app)
+
+    # Warm caches last, once everything that allocates long-lived state is registered
+    if app.config.get("PRELOAD_APP"):
+        warm_up(app)
     return app
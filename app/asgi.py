@@ -0,0 +1,180 @@
+"""
+ASGI Application
+
+Runs the contact pipeline natively on the event loop, so an in-flight
+submission waiting on SMTP costs a coroutine instead of a thread. Every other
+request is handed to the Flask (WSGI) app through asgiref's thread-pool
+adapter.
+
+Serve it with an ASGI server, e.g.:
+    uvicorn asgi:app --workers 4
+"""
+
+import asyncio
+import io
+import json
+from typing import Any, Awaitable, Callable, Dict, List, Mapping, Optional, Tuple
+from asgiref.wsgi import WsgiToAsgi
+from flask import Flask
+from werkzeug.wrappers import Request
+from app.exceptions import ValidationError
+from app.logger import get_logger
+from app.routes.contact import (
+    CONTACT_RATE_LIMIT, NOT_CONFIGURED_MESSAGE, SUCCESS_MESSAGE, hit_contact_rate_limit,
+    parse_contact_form, send_failed_message, unexpected_error_message
+)
+from app.services.email_service import AsyncEmailService, is_email_configured
+from app.services.digest_service import queue_for_digest
+from app.services.dedupe_service import get_dedupe_guard, submission_fingerprint
+from app.tenants import TenantRegistry, config_for_tenant, resolve_tenant
+
+logger = get_logger(__name__)
+
+Scope = Dict[str, Any]
+Receive = Callable[[], Awaitable[Dict[str, Any]]]
+Send = Callable[[Dict[str, Any]], Awaitable[None]]
+
+# Upper bound on a contact form body; the field limits keep real forms far below it
+MAX_CONTACT_BODY_BYTES = 64 * 1024
+
+
+class AsyncContactApp:
+    """ASGI app serving POST /contact asynchronously in front of the Flask app"""
+
+    def __init__(self, flask_app: Flask) -> None:
+        """
+        Args:
+            flask_app: Application created by create_app()
+        """
+        self.flask_app: Flask = flask_app
+        self.wsgi_app = WsgiToAsgi(flask_app)
+        self.tenants: Optional[TenantRegistry] = flask_app.extensions.get('tenant_registry')
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] == 'http' and scope['method'] == 'POST':
+            target = self._contact_target(scope)
+            if target is not None:
+                await self._handle_contact(scope, receive, send, *target)
+                return
+        await self.wsgi_app(scope, receive, send)
+
+    def _contact_target(self, scope: Scope) -> Optional[Tuple[Mapping[str, Any], str]]:
+        """Return (config to send with, tenant slug) for a contact request, else None."""
+        path: str = scope['path']
+        tenant = None
+        if self.tenants is not None:
+            tenant, path = resolve_tenant(self.tenants, path, _header(scope, b'host'))
+        if path != '/contact':
+            return None
+        return config_for_tenant(tenant, self.flask_app.config), tenant.slug if tenant else ''
+
+    async def _handle_contact(
+        self, scope: Scope, receive: Receive, send: Send, config: Mapping[str, Any], tenant_slug: str
+    ) -> None:
+        """Validate a submission and send it without blocking a thread."""
+        client = scope.get('client')
+        client_ip: str = client[0] if client else 'unknown'
+        logger.info(f"Contact form submission attempt from IP: {client_ip} (async)")
+
+        # Rate limit and dedupe storage calls are blocking (network I/O with
+        # Redis storage), so they run in the default thread pool
+        if not await asyncio.to_thread(hit_contact_rate_limit, client_ip, self.flask_app.config):
+            logger.warning(f"Rate limit exceeded for contact form from IP {client_ip}")
+            await _send_json(send, 429, {
+                'success': False,
+                'message': f'Too many requests. Limit is {CONTACT_RATE_LIMIT}.'
+            })
+            return
+
+        try:
+            body = await _read_body(receive)
+            form = Request({
+                'REQUEST_METHOD': 'POST',
+                'CONTENT_TYPE': _header(scope, b'content-type'),
+                'CONTENT_LENGTH': str(len(body)),
+                'wsgi.input': io.BytesIO(body),
+            }).form
+
+            dedupe_guard = get_dedupe_guard()
+            fingerprint = submission_fingerprint(form, tenant_slug)
+            if await asyncio.to_thread(dedupe_guard.seen, fingerprint):
+                logger.info(f"Suppressed duplicate contact form submission from IP {client_ip}")
+                await _send_json(send, 200, {'success': True, 'message': SUCCESS_MESSAGE})
+                return
+
+            submission = parse_contact_form(form)
+            name, email = submission['name'], submission['email']
+
+            if not is_email_configured(config):
+                logger.warning(f"Email not configured - contact form submission from {name} ({email}) cannot be sent")
+                await _send_json(send, 503, {'success': False, 'message': NOT_CONFIGURED_MESSAGE})
+                return
+
+            if not await asyncio.to_thread(dedupe_guard.claim, fingerprint):
+                logger.info(f"Suppressed concurrent duplicate contact form submission from {name} ({email})")
+                await _send_json(send, 200, {'success': True, 'message': SUCCESS_MESSAGE})
+                return
+
+            try:
+                # Queueing for a digest only takes a lock, so it is safe on the event loop
+                if not queue_for_digest(submission, config, tenant_slug):
+                    await AsyncEmailService(config).send_contact_form_email_async(**submission)
+            except Exception as email_error:
+                await asyncio.to_thread(dedupe_guard.release, fingerprint)
+                logger.error(f"Email sending failed for contact form from {name} ({email}): {str(email_error)}")
+                await _send_json(send, 503, {'success': False, 'message': send_failed_message(config)})
+                return
+
+            logger.info(f"Contact form submitted successfully from {name} ({email})")
+            await _send_json(send, 200, {'success': True, 'message': SUCCESS_MESSAGE})
+
+        except ValidationError as e:
+            logger.warning(f"Validation error in contact form from IP {client_ip}: {e.message}")
+            await _send_json(send, 400, {'success': False, 'message': f'Error: {e.message}'})
+        except Exception as e:
+            logger.error(f"Unexpected error processing contact form from IP {client_ip}: {str(e)}", exc_info=True)
+            await _send_json(send, 500, {'success': False, 'message': unexpected_error_message(config)})
+
+
+def _header(scope: Scope, name: bytes) -> str:
+    """Return a request header value (latin-1 decoded), or ''."""
+    for key, value in scope.get('headers', []):
+        if key == name:
+            return value.decode('latin-1')
+    return ''
+
+
+async def _read_body(receive: Receive) -> bytes:
+    """
+    Read the request body.
+
+    Raises:
+        ValidationError: If the body exceeds MAX_CONTACT_BODY_BYTES
+    """
+    chunks: List[bytes] = []
+    size = 0
+    while True:
+        message = await receive()
+        chunk = message.get('body', b'')
+        size += len(chunk)
+        if size > MAX_CONTACT_BODY_BYTES:
+            raise ValidationError('Submission is too large')
+        chunks.append(chunk)
+        if not message.get('more_body', False):
+            return b''.join(chunks)
+
+
+async def _send_json(send: Send, status: int, body: Dict[str, Any]) -> None:
+    """Send a complete JSON response."""
+    payload = json.dumps(body).encode('utf-8')
+    headers: List[Tuple[bytes, bytes]] = [
+        (b'content-type', b'application/json'),
+        (b'content-length', str(len(payload)).encode('ascii')),
+    ]
+    await send({'type': 'http.response.start', 'status': status, 'headers': headers})
+    await send({'type': 'http.response.body', 'body': payload})
+
+
+def create_asgi_app(flask_app: Flask) -> AsyncContactApp:
+    """Wrap a Flask app created by create_app() for serving under ASGI."""
+    return AsyncContactApp(flask_app)
@@ -0,0 +1,295 @@
+"""
+Static Asset Pipeline
+
+Build step (`python scripts/build_assets.py`) and runtime support for the
+first-party assets:
+
+- Bundles are minified, content-hashed files under static/dist, written
+  with precompressed .gz and .br siblings. manifest.json maps each bundle
+  to its file. A build adds its files next to the previous build's and
+  swaps the manifest in last, so running workers and cached pages keep
+  working until the previous build's files are pruned by the next build.
+- Critical CSS, the stylesheet rules the above-the-fold markup needs, can be
+  inlined into the page. The full stylesheet then loads without blocking
+  rendering.
+- The static route serves a precompressed sibling when the client accepts
+  its encoding. Hashed bundle files are cached by clients for a year.
+
+Without a build, or when a source changed after the build, pages reference
+the source files as before.
+"""
+
+import gzip
+import hashlib
+import json
+import mimetypes
+import os
+import tempfile
+import time
+from typing import Any, Dict, List, Optional, Set, Tuple
+from flask import Flask, Response, current_app, render_template, request, send_from_directory, url_for
+from markupsafe import Markup
+from werkzeug.exceptions import NotFound
+from werkzeug.security import safe_join
+from app.data.snapshot import get_snapshot
+from app.logger import get_logger
+from app.minify import extract_critical_css, minify_css, minify_js
+
+try:
+    import brotli
+except ImportError:
+    brotli = None  # .br siblings are not written without the brotli package
+
+logger = get_logger(__name__)
+
+# Bundle name -> first-party sources (relative to the static folder), in order
+BUNDLES: Dict[str, Tuple[str, ...]] = {
+    'app.css': ('css/style.css',),
+    'app.js': ('js/script.js',),
+}
+
+# Build output directory and manifest, relative to the static folder
+DIST_DIR = 'dist'
+MANIFEST_NAME = 'manifest.json'
+
+# Content-Encoding -> sibling suffix, in order of preference
+PRECOMPRESSED: Tuple[Tuple[str, str], ...] = (('br', '.br'), ('gzip', '.gz'))
+
+# Hashed bundle files never change, so clients may keep them for a year
+IMMUTABLE_MAX_AGE = 365 * 24 * 3600
+
+# Page rendered to find the above-the-fold markup for the critical CSS
+CRITICAL_TEMPLATE = 'index.html'
+
+
+def _read(path: str) -> bytes:
+    with open(path, 'rb') as handle:
+        return handle.read()
+
+
+def _source_hash(data: bytes) -> str:
+    return hashlib.sha1(data).hexdigest()[:12]
+
+
+def _write_atomic(path: str, data: bytes) -> None:
+    """Write a file via a temporary file and a rename, so readers never see it half written."""
+    descriptor, temporary = tempfile.mkstemp(dir=os.path.dirname(path), prefix='.tmp-')
+    try:
+        with os.fdopen(descriptor, 'wb') as handle:
+            handle.write(data)
+        os.chmod(temporary, 0o644)
+        os.replace(temporary, path)
+    except BaseException:
+        os.unlink(temporary)
+        raise
+
+
+def _write_compressed(path: str, data: bytes) -> Dict[str, int]:
+    """Write a file and its precompressed siblings; return the size of each variant."""
+    sizes = {'min': len(data)}
+    _write_atomic(path, data)
+    # mtime=0 keeps the .gz byte-identical across builds of the same content
+    compressed = gzip.compress(data, compresslevel=9, mtime=0)
+    _write_atomic(path + '.gz', compressed)
+    sizes['gzip'] = len(compressed)
+    if brotli is not None:
+        compressed = brotli.compress(data, quality=11)
+        _write_atomic(path + '.br', compressed)
+        sizes['br'] = len(compressed)
+    return sizes
+
+
+def _manifest_files(manifest: Optional[Dict[str, Any]]) -> Set[str]:
+    """Return the files (relative to the static folder) a manifest references."""
+    if not manifest:
+        return set()
+    files = set(manifest.get('bundles', {}).values())
+    if manifest.get('critical_css'):
+        files.add(manifest['critical_css'])
+    return files
+
+
+def _prune(dist_path: str, keep: Set[str]) -> List[str]:
+    """Delete the files in dist_path not named in keep (nor their .gz/.br siblings); return their names."""
+    keep = keep | {name + suffix for name in keep for _, suffix in PRECOMPRESSED} | {MANIFEST_NAME}
+    pruned: List[str] = []
+    for entry in os.scandir(dist_path):
+        if entry.is_file() and entry.name not in keep:
+            os.unlink(entry.path)
+            pruned.append(entry.name)
+    return pruned
+
+
+def _render_fold_page(app: Flask) -> str:
+    """Render the built-in homepage, for critical CSS extraction."""
+    with app.test_request_context('/'):
+        return render_template(CRITICAL_TEMPLATE, stats=get_snapshot().resources['stats'])
+
+
+def build_assets(app: Flask, critical: bool = True, fold_id: str = 'home') -> Dict[str, Any]:
+    """
+    Minify, bundle and precompress the first-party assets into static/dist.
+
+    Nothing in use is deleted. New files are written next to the previous
+    build's, and the manifest is swapped in atomically last. So workers
+    still running with the previous manifest, and pages or CDNs holding its
+    immutable URLs, keep working after a deploy. Files of builds before the
+    previous one are pruned.
+
+    Args:
+        app: Application whose static folder holds the sources
+        critical: Also extract the critical CSS of the homepage
+        fold_id: Id of the last element above the fold
+
+    Returns:
+        The written manifest, plus a 'report' of sizes per bundle
+        (raw sources, minified, gzip and brotli bytes)
+    """
+    static_folder = app.static_folder
+    dist_path = os.path.join(static_folder, DIST_DIR)
+    manifest_path = os.path.join(dist_path, MANIFEST_NAME)
+    os.makedirs(dist_path, exist_ok=True)
+    try:
+        with open(manifest_path, encoding='utf-8') as handle:
+            previous: Optional[Dict[str, Any]] = json.load(handle)
+    except (OSError, ValueError):
+        previous = None
+
+    manifest: Dict[str, Any] = {'built_at': time.time(), 'bundles': {}, 'sources': {}, 'critical_css': None}
+    report: Dict[str, Dict[str, int]] = {}
+    minified_css = ''
+    for bundle, sources in BUNDLES.items():
+        raw = [_read(os.path.join(static_folder, source)) for source in sources]
+        for source, data in zip(sources, raw):
+            manifest['sources'][source] = _source_hash(data)
+        texts = [data.decode('utf-8') for data in raw]
+        if bundle.endswith('.css'):
+            output = '\n'.join(minify_css(text) for text in texts)
+            minified_css += output
+        else:
+            # A semicolon between scripts keeps one from continuing the other's last statement
+            output = ';\n'.join(minify_js(text) for text in texts)
+        data = output.encode('utf-8')
+
+        stem, extension = os.path.splitext(bundle)
+        filename = f'{DIST_DIR}/{stem}.{_source_hash(data)}.min{extension}'
+        report[bundle] = {'raw': sum(len(item) for item in raw), 'sources': len(sources)}
+        report[bundle].update(_write_compressed(os.path.join(static_folder, filename), data))
+        manifest['bundles'][bundle] = filename
+
+    if critical and minified_css:
+        critical_css = extract_critical_css(minified_css, _render_fold_page(app), fold_id)
+        filename = f'{DIST_DIR}/critical.{_source_hash(critical_css.encode("utf-8"))}.css'
+        _write_atomic(os.path.join(static_folder, filename), critical_css.encode('utf-8'))
+        manifest['critical_css'] = filename
+        report['critical.css'] = {'raw': len(minified_css.encode('utf-8')), 'min': len(critical_css.encode('utf-8'))}
+
+    _write_atomic(manifest_path, json.dumps(manifest, indent=2).encode('utf-8'))
+    keep = {os.path.basename(name) for name in _manifest_files(previous) | _manifest_files(manifest)}
+    pruned = _prune(dist_path, keep)
+    logger.info(f"Built {len(manifest['bundles'])} asset bundles into {dist_path} (pruned {len(pruned)} old files)")
+    return {**manifest, 'report': report}
+
+
+def load_manifest(static_folder: str) -> Optional[Dict[str, Any]]:
+    """
+    Load the build manifest if it matches the current sources.
+
+    Returns:
+        The manifest (with the critical CSS text under 'critical_css_text'),
+        or None if there is no build, it is unreadable, or a source changed
+        after it was built
+    """
+    path = os.path.join(static_folder, DIST_DIR, MANIFEST_NAME)
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, encoding='utf-8') as handle:
+            manifest: Dict[str, Any] = json.load(handle)
+        for source, digest in manifest['sources'].items():
+            if _source_hash(_read(os.path.join(static_folder, source))) != digest:
+                logger.warning(f"Built assets are stale ({source} changed); serving sources. Rerun build_assets.py")
+                return None
+        if set(manifest['bundles']) != set(BUNDLES):
+            logger.warning("Built assets do not match the configured bundles; serving sources")
+            return None
+        manifest['critical_css_text'] = ''
+        if manifest.get('critical_css'):
+            with open(os.path.join(static_folder, manifest['critical_css']), encoding='utf-8') as handle:
+                manifest['critical_css_text'] = handle.read()
+    except (OSError, ValueError, KeyError) as manifest_error:
+        logger.warning(f"Ignoring unreadable asset manifest {path}: {manifest_error}")
+        return None
+    return manifest
+
+
+def asset_urls(bundle: str) -> List[str]:
+    """Return the URLs a page includes for a bundle: its built file, or its sources."""
+    manifest = current_app.extensions.get('asset_manifest')
+    if manifest is not None:
+        return [url_for('static', filename=manifest['bundles'][bundle])]
+    return [url_for('static', filename=source) for source in BUNDLES[bundle]]
+
+
+def critical_css() -> Markup:
+    """Return the critical CSS to inline, or '' when it is disabled or not built."""
+    manifest = current_app.extensions.get('asset_manifest')
+    if manifest is None or not current_app.config.get('ASSET_CRITICAL_CSS'):
+        return Markup('')
+    return Markup(manifest['critical_css_text'])
+
+
+def send_static_asset(filename: str) -> Response:
+    """
+    Serve a static file, using a precompressed sibling the client accepts.
+
+    Replaces Flask's static view. Files that have .br/.gz siblings are
+    served with Content-Encoding and Vary: Accept-Encoding; hashed bundle
+    files are marked immutable.
+    """
+    static_folder = current_app.static_folder
+    max_age = current_app.get_send_file_max_age(filename)
+    immutable = filename.startswith(f'{DIST_DIR}/') and '.min.' in filename
+    if immutable:
+        max_age = IMMUTABLE_MAX_AGE
+
+    encoding: Optional[str] = None
+    sibling: Optional[str] = None
+    has_siblings = False
+    for candidate, suffix in PRECOMPRESSED:
+        path = safe_join(static_folder, filename + suffix)
+        if path is None or not os.path.isfile(path):
+            continue
+        has_siblings = True
+        if encoding is None and request.accept_encodings.quality(candidate) > 0:
+            encoding, sibling = candidate, filename + suffix
+
+    if sibling is None:
+        response = send_from_directory(static_folder, filename, max_age=max_age)
+    else:
+        mimetype = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+        try:
+            response = send_from_directory(static_folder, sibling, mimetype=mimetype, max_age=max_age)
+        except NotFound:  # sibling removed by a concurrent rebuild
+            response = send_from_directory(static_folder, filename, max_age=max_age)
+            encoding = None
+        if encoding is not None:
+            response.headers['Content-Encoding'] = encoding
+    if has_siblings:
+        response.vary.add('Accept-Encoding')
+    if immutable:
+        response.cache_control.immutable = True
+    return response
+
+
+def init_assets(app: Flask) -> None:
+    """
+    Serve built assets: load the manifest, expose the template helpers and
+    replace the static view with one that serves precompressed siblings.
+    """
+    manifest = load_manifest(app.static_folder) if app.config.get('ASSET_BUNDLES') else None
+    app.extensions['asset_manifest'] = manifest
+    app.jinja_env.globals.update(asset_urls=asset_urls, critical_css=critical_css)
+    app.view_functions['static'] = send_static_asset
+    if manifest is not None:
+        logger.info(f"Serving built assets from {DIST_DIR}/ (critical CSS: {bool(manifest['critical_css_text'])})")
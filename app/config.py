@@ -27,6 +27,8 @@ class Config:
     MAX_EMAIL_LENGTH: int = int(os.getenv('MAX_EMAIL_LENGTH', '254'))
     MAX_SUBJECT_LENGTH: int = int(os.getenv('MAX_SUBJECT_LENGTH', '200'))
     MAX_MESSAGE_LENGTH: int = int(os.getenv('MAX_MESSAGE_LENGTH', '5000'))
+    # Email validation results kept per worker (0 disables the cache)
+    EMAIL_VALIDATION_CACHE_SIZE: int = int(os.getenv('EMAIL_VALIDATION_CACHE_SIZE', '10000'))
 
     # Email (SMTP) – used by contact form and EmailService
     SMTP_SERVER: str = os.getenv('SMTP_SERVER', '')
@@ -34,6 +36,67 @@ class Config:
     SMTP_USERNAME: str = os.getenv('SMTP_USERNAME', '')
     SMTP_PASSWORD: str = os.getenv('SMTP_PASSWORD', '')
     RECIPIENT_EMAIL: str = os.getenv('RECIPIENT_EMAIL', '')
+    # Upgrade the SMTP connection with STARTTLS (disable only for local relays)
+    SMTP_STARTTLS: bool = os.getenv('SMTP_STARTTLS', 'true').lower() == 'true'
+
+    # Digest mode: batch contact submissions into one email per window or
+    # count; submissions mentioning a priority keyword are sent immediately
+    # (visitors write the text, so anyone can skip batching that way).
+    # Queued submissions live in per-process memory and are only flushed at
+    # exit by atexit: a worker killed by OOM, the gunicorn timeout or
+    # SIGKILL loses them
+    DIGEST_MODE: bool = os.getenv('DIGEST_MODE', 'false').lower() == 'true'
+    DIGEST_WINDOW_SECONDS: int = int(os.getenv('DIGEST_WINDOW_SECONDS', '900'))
+    DIGEST_MAX_SUBMISSIONS: int = int(os.getenv('DIGEST_MAX_SUBMISSIONS', '50'))
+    DIGEST_MAX_PENDING: int = int(os.getenv('DIGEST_MAX_PENDING', '1000'))
+    DIGEST_PRIORITY_KEYWORDS: str = os.getenv('DIGEST_PRIORITY_KEYWORDS', 'urgent,job offer,interview')
+
+    # Duplicate/replay suppression: identical submissions within the window
+    # are dropped before validation and SMTP (0 disables); the local LRU bound
+    # applies when the rate limiter storage is per-process (memory://)
+    DEDUPE_WINDOW_SECONDS: int = int(os.getenv('DEDUPE_WINDOW_SECONDS', '600'))
+    DEDUPE_MAX_ENTRIES: int = int(os.getenv('DEDUPE_MAX_ENTRIES', '10000'))
+
+    # Preload: warm data/template caches and freeze the GC heap in create_app,
+    # so pre-forked workers share them copy-on-write
+    PRELOAD_APP: bool = os.getenv('PRELOAD_APP', 'true').lower() == 'true'
+
+    # Compiled template bytecode kept on disk across worker starts (empty disables)
+    TEMPLATE_CACHE_DIR: str = os.getenv(
+        'TEMPLATE_CACHE_DIR',
+        os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), '.jinja_cache')
+    )
+
+    # Built assets (scripts/build_assets.py): serve the minified bundles when a
+    # current build exists, and inline its critical CSS into the homepage
+    ASSET_BUNDLES: bool = os.getenv('ASSET_BUNDLES', 'true').lower() == 'true'
+    ASSET_CRITICAL_CSS: bool = os.getenv('ASSET_CRITICAL_CSS', 'true').lower() == 'true'
+
+    # Change feed: number of record-level changes kept for /api/changes
+    CHANGE_LOG_MAX_ENTRIES: int = int(os.getenv('CHANGE_LOG_MAX_ENTRIES', '1000'))
+    # Seconds between checks, on access, for a modified data source (tenant
+    # portfolio.json) or a new month; the snapshot is rebuilt when either changed
+    SNAPSHOT_CHECK_INTERVAL: float = float(os.getenv('SNAPSHOT_CHECK_INTERVAL', '5'))
+
+    # Multi-tenant serving: directory with one sub-directory per tenant
+    # (empty serves only the built-in portfolio) and the memory budget for
+    # tenant data snapshots held by each worker
+    TENANTS_DIR: str = os.getenv('TENANTS_DIR', '')
+    TENANT_CACHE_MAX_BYTES: int = int(os.getenv('TENANT_CACHE_MAX_BYTES', str(64 * 1024 * 1024)))
+
+    # Rendered section fragments kept per worker (5 per tenant data version)
+    FRAGMENT_CACHE_MAX_ENTRIES: int = int(os.getenv('FRAGMENT_CACHE_MAX_ENTRIES', '500'))
+
+    # Readiness probes (/ready): seconds between background checks of each dependency
+    HEALTH_SMTP_INTERVAL: int = int(os.getenv('HEALTH_SMTP_INTERVAL', '60'))
+    HEALTH_STORAGE_INTERVAL: int = int(os.getenv('HEALTH_STORAGE_INTERVAL', '10'))
+    HEALTH_SNAPSHOT_INTERVAL: int = int(os.getenv('HEALTH_SNAPSHOT_INTERVAL', '30'))
+    HEALTH_OUTBOX_INTERVAL: int = int(os.getenv('HEALTH_OUTBOX_INTERVAL', '5'))
+
+    # Admin diagnostics (/admin/*): bearer token, empty disables the endpoints;
+    # tracemalloc frames to record from startup (0 = start on demand)
+    ADMIN_TOKEN: str = os.getenv('ADMIN_TOKEN', '')
+    TRACEMALLOC_FRAMES: int = int(os.getenv('TRACEMALLOC_FRAMES', '0'))
 
     # Rate Limiting Configuration
     RATE_LIMIT_DEFAULTS: str = os.getenv('RATE_LIMIT_DEFAULTS', '5 per minute')
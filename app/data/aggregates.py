@@ -0,0 +1,160 @@
+"""
+Derived Portfolio Aggregates
+Statistics and the skill co-occurrence graph, computed from the content
+"""
+
+import re
+from datetime import date
+from itertools import combinations
+from typing import Any, Dict, List, Optional, Tuple
+from app.models.models import PortfolioStats
+from app.models.serializers import Serializers
+
+_MONTHS = {
+    name: number for number, name in enumerate(
+        ('jan', 'feb', 'mar', 'apr', 'may', 'jun', 'jul', 'aug', 'sep', 'oct', 'nov', 'dec'), start=1
+    )
+}
+_PERIOD_SEPARATOR = re.compile(r'\s*[-–—]\s*')
+_SKILL_KEY_STRIP = re.compile(r'[^a-z0-9+#]')
+_ACRONYM_PLURAL = re.compile(r'(?<=[A-Z])s\b')
+
+
+def _parse_month(text: str, end: bool, today: date) -> Optional[int]:
+    """Parse 'Aug 2024', '2019' or 'Present' into a month index (year * 12 + month - 1)."""
+    text = text.strip().lower()
+    if text in ('present', 'current', 'now'):
+        return today.year * 12 + today.month - 1
+    parts = text.split()
+    try:
+        year = int(parts[-1])
+    except (IndexError, ValueError):
+        return None
+    month = _MONTHS.get(parts[0][:3]) if len(parts) > 1 else None
+    if month is None:
+        # A bare year covers January to December
+        month = 12 if end else 1
+    return year * 12 + month - 1
+
+
+def experience_months(periods: List[str], today: Optional[date] = None) -> int:
+    """
+    Return the months covered by a list of periods, counting overlaps once.
+
+    Periods look like 'Aug 2024 - Present' or '2019 – 2023'; both ends are
+    inclusive. Unparseable periods are ignored.
+    """
+    today = today or date.today()
+    spans: List[Tuple[int, int]] = []
+    for period in periods:
+        bounds = _PERIOD_SEPARATOR.split(period.strip(), maxsplit=1)
+        start = _parse_month(bounds[0], end=False, today=today)
+        finish = _parse_month(bounds[-1], end=True, today=today)
+        if start is not None and finish is not None and finish >= start:
+            spans.append((start, finish))
+
+    months = 0
+    covered_until = -1
+    for start, finish in sorted(spans):
+        if finish > covered_until:
+            months += finish - max(start, covered_until + 1) + 1
+            covered_until = finish
+    return months
+
+
+def derive_stats(resources: Dict[str, Any], today: Optional[date] = None) -> Dict[str, Any]:
+    """
+    Compute the portfolio statistics from the content resources.
+
+    Args:
+        resources: Serialized resources (projects, skills, experience, ...)
+        today: Date that 'Present' refers to (defaults to today). Snapshots
+            pass the first day of the month they are built in, so the stats,
+            and the ETags and fingerprint derived from them, only change
+            when the month does (the snapshot is then rebuilt)
+
+    Returns:
+        Serialized PortfolioStats
+    """
+    projects = resources.get('projects', [])
+    link_types = [{link.get('type') for link in project.get('links', [])} for project in projects]
+    graph_nodes = _collect_skills(resources)[0]
+    stats = PortfolioStats(
+        github_projects=sum('github' in types for types in link_types),
+        live_projects=sum('live' in types for types in link_types),
+        years_experience=round(
+            experience_months([item.get('period', '') for item in resources.get('experience', [])], today) / 12, 1
+        ),
+        total_projects=len(projects),
+        technologies=len(graph_nodes),
+    )
+    return Serializers.stats_to_dict(stats)
+
+
+def skill_key(name: str) -> str:
+    """Normalize a skill name so spelling variants ('REST API'/'REST APIs', 'ReactJS'/'React.js') match."""
+    return _SKILL_KEY_STRIP.sub('', _ACRONYM_PLURAL.sub('', name).lower())
+
+
+def _collect_skills(
+    resources: Dict[str, Any]
+) -> Tuple[Dict[str, Dict[str, Any]], List[Tuple[str, str, List[str]]]]:
+    """Return skill nodes keyed by skill_key, and the (kind, context, keys) of each project/role."""
+    nodes: Dict[str, Dict[str, Any]] = {}
+
+    def node(name: str, category: Optional[str] = None) -> str:
+        key = skill_key(name)
+        entry = nodes.setdefault(key, {'id': key, 'name': name, 'category': category, 'projects': [], 'roles': []})
+        if entry['category'] is None:
+            entry['category'] = category
+        return key
+
+    # Skill categories come first, so their spelling and grouping win
+    for category in resources.get('skills', []):
+        for name in category.get('skills', []):
+            node(name, category.get('title'))
+
+    contexts: List[Tuple[str, str, List[str]]] = []
+    for project in resources.get('projects', []):
+        keys = sorted({node(tag) for tag in project.get('tags', [])})
+        for key in keys:
+            nodes[key]['projects'].append(project['title'])
+        contexts.append(('projects', project['title'], keys))
+    for item in resources.get('experience', []):
+        role = f"{item['title']} @ {item['company']}"
+        keys = sorted({node(tag) for tag in item.get('tags', [])})
+        for key in keys:
+            nodes[key]['roles'].append(role)
+        contexts.append(('roles', role, keys))
+    return nodes, contexts
+
+
+def build_skill_graph(resources: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Build the skill co-occurrence graph from the content resources.
+
+    Nodes are skills and technologies from skill categories, project tags and
+    role tags, merged across spelling variants. Two skills share an edge when
+    they are used together in a project or role; the edge weight counts those
+    projects/roles and names them.
+
+    Returns:
+        Dictionary with 'nodes' (sorted by usage, then name) and 'edges'
+        (sorted by weight, then ids)
+    """
+    nodes, contexts = _collect_skills(resources)
+    edges: Dict[Tuple[str, str], Dict[str, Any]] = {}
+    for kind, context, keys in contexts:
+        for source, target in combinations(keys, 2):
+            edge = edges.setdefault(
+                (source, target), {'source': source, 'target': target, 'weight': 0, 'projects': [], 'roles': []}
+            )
+            edge['weight'] += 1
+            edge[kind].append(context)
+
+    for entry in nodes.values():
+        entry['usage'] = len(entry['projects']) + len(entry['roles'])
+    return {
+        'nodes': sorted(nodes.values(), key=lambda entry: (-entry['usage'], entry['name'].lower())),
+        'edges': sorted(edges.values(), key=lambda edge: (-edge['weight'], edge['source'], edge['target'])),
+    }
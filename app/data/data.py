@@ -6,9 +6,10 @@ Portfolio data definitions and retrieval functions
 from typing import List, Dict, Any
 from app.models.models import (
     Project, ProjectLink, SkillCategory, ExperienceItem,
-    EducationItem, Certification, PortfolioStats
+    EducationItem, Certification
 )
 from app.models.serializers import Serializers
+from app.data.aggregates import derive_stats
 
 
 class Data:
@@ -285,15 +286,13 @@ class Data:
     @staticmethod
     def get_stats() -> Dict[str, Any]:
         """
-        Get portfolio statistics
+        Get portfolio statistics, derived from the projects, skills and experience
 
         Returns:
             Dictionary with portfolio statistics
         """
-        stats = PortfolioStats(
-            github_projects=14,
-            live_projects=2,
-            years_experience=1.6
-        )
-
-        return Serializers.stats_to_dict(stats)
\ No newline at end of file
+        return derive_stats({
+            'projects': Data.get_projects(),
+            'skills': Data.get_skills(),
+            'experience': Data.get_experience(),
+        })
@@ -0,0 +1,58 @@
+"""
+Payload Encoding
+Wire formats the API can serve, keyed by media type
+"""
+
+import json
+from typing import Any, Callable, Dict, List, Optional
+
+try:
+    import msgpack
+except ImportError:  # MessagePack responses disabled
+    msgpack = None
+
+try:
+    import cbor2
+except ImportError:  # CBOR responses disabled
+    cbor2 = None
+
+
+JSON_MEDIA_TYPE = 'application/json'
+MSGPACK_MEDIA_TYPE = 'application/msgpack'
+CBOR_MEDIA_TYPE = 'application/cbor'
+
+# Media types clients send that map onto a canonical one above
+MEDIA_TYPE_ALIASES: Dict[str, str] = {
+    'application/x-msgpack': MSGPACK_MEDIA_TYPE,
+}
+
+
+def encode_json(value: Any) -> bytes:
+    """Encode a value as compact UTF-8 JSON."""
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def _build_encoders() -> Dict[str, Callable[[Any], bytes]]:
+    """Return encoders for every available format, JSON first (the default)."""
+    encoders: Dict[str, Callable[[Any], bytes]] = {JSON_MEDIA_TYPE: encode_json}
+    if msgpack is not None:
+        encoders[MSGPACK_MEDIA_TYPE] = lambda value: msgpack.packb(value, use_bin_type=True)
+    if cbor2 is not None:
+        encoders[CBOR_MEDIA_TYPE] = cbor2.dumps
+    return encoders
+
+
+ENCODERS: Dict[str, Callable[[Any], bytes]] = _build_encoders()
+
+
+def offered_media_types() -> List[str]:
+    """Return every media type (canonical and alias) a client may ask for."""
+    return list(ENCODERS) + [alias for alias, target in MEDIA_TYPE_ALIASES.items() if target in ENCODERS]
+
+
+def canonical_media_type(media_type: Optional[str]) -> str:
+    """Map a negotiated media type onto the format it is served as."""
+    if not media_type:
+        return JSON_MEDIA_TYPE
+    media_type = MEDIA_TYPE_ALIASES.get(media_type, media_type)
+    return media_type if media_type in ENCODERS else JSON_MEDIA_TYPE
@@ -0,0 +1,539 @@
+"""
+Portfolio Data Snapshot
+Immutable, pre-encoded view of the portfolio data shared by all requests
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict, deque
+from datetime import date
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Tuple
+from app.config import Config
+from app.data.aggregates import build_skill_graph, derive_stats
+from app.data.data import Data
+from app.data.encoding import ENCODERS, JSON_MEDIA_TYPE, encode_json
+from app.logger import get_logger
+from app.tenants import current_tenant
+
+logger = get_logger(__name__)
+
+
+# Resource key -> Data accessor. Keys double as the /api/<key> route names.
+RESOURCES: Dict[str, Callable[[], Any]] = {
+    'projects': Data.get_projects,
+    'skills': Data.get_skills,
+    'experience': Data.get_experience,
+    'education': Data.get_education,
+    'certifications': Data.get_certifications,
+}
+
+# Resource key -> aggregate computed from the loaded resources and the snapshot's
+# as_of date ('Present' in experience periods), once per snapshot
+DERIVED_RESOURCES: Dict[str, Callable[[Dict[str, Any], date], Any]] = {
+    'stats': derive_stats,
+    'skill_graph': lambda resources, as_of: build_skill_graph(resources),
+}
+
+# Resources served without a 'count' field in the envelope
+UNCOUNTED_RESOURCES = frozenset({'stats', 'skill_graph'})
+
+# Fields that identify a record within a list resource (used by the change log)
+RECORD_ID_FIELDS: Dict[str, Tuple[str, ...]] = {
+    'projects': ('title',),
+    'skills': ('title',),
+    'experience': ('company', 'title', 'period'),
+    'education': ('institution', 'title'),
+    'certifications': ('issuer', 'title'),
+}
+
+
+def month_start() -> date:
+    """Return the first day of the current month, the date snapshots are built as of."""
+    return date.today().replace(day=1)
+
+
+def load_default_resources() -> Dict[str, Any]:
+    """Build every resource of the built-in portfolio from the data layer."""
+    return {key: accessor() for key, accessor in RESOURCES.items()}
+
+
+def record_id(resource: str, record: Dict[str, Any]) -> str:
+    """Return the stable identifier of a record within its resource."""
+    fields = RECORD_ID_FIELDS.get(resource)
+    if fields is None:  # single-object resource such as stats or skill_graph
+        return resource
+    return ' | '.join(str(record.get(name, '')) for name in fields)
+
+
+class DataSnapshot:
+    """Portfolio content built once, with the API envelopes already encoded"""
+
+    def __init__(
+        self,
+        version: int = 1,
+        generation: Optional[str] = None,
+        loader: Callable[[], Dict[str, Any]] = load_default_resources,
+        as_of: Optional[date] = None
+    ) -> None:
+        """
+        Build every resource and pre-encode its API payload in every format.
+
+        Args:
+            version: Monotonically increasing content version
+            generation: Fingerprint of the first snapshot in this version
+                sequence (this snapshot's own fingerprint if omitted)
+            loader: Returns the resources, keyed like RESOURCES; the
+                DERIVED_RESOURCES aggregates are computed from them
+            as_of: Date derived resources are computed as of (defaults to
+                month_start(), so rebuilding unchanged content within a
+                month yields the same snapshot)
+        """
+        self.version: int = version
+        self.built_at: float = time.time()
+        self.resources: Dict[str, Any] = loader()
+        self.as_of: date = as_of or month_start()
+        for key, derive in DERIVED_RESOURCES.items():
+            self.resources[key] = derive(self.resources, self.as_of)
+        self.payloads: Dict[Tuple[str, str], bytes] = {
+            (key, media_type): encode(self.envelope(key))
+            for key in self.resources
+            for media_type, encode in ENCODERS.items()
+        }
+
+        # Content-derived validators: identical content yields identical ETags in
+        # every worker and across restarts, unlike the process-local version
+        self.etags: Dict[Tuple[str, str], str] = {
+            variant: hashlib.sha1(payload).hexdigest()[:16] for variant, payload in self.payloads.items()
+        }
+        self.fingerprint: str = hashlib.sha1(
+            ''.join(self.etags[(key, JSON_MEDIA_TYPE)] for key in self.resources).encode('ascii')
+        ).hexdigest()[:16]
+        self.generation: str = generation or self.fingerprint
+
+        # Full-resync answer of /api/changes for clients that cannot catch up
+        self.resync_payload: bytes = encode_json({
+            'success': True,
+            'data': {
+                'version': version,
+                'generation': self.generation,
+                'fingerprint': self.fingerprint,
+                'resync': True,
+                'resources': self.resources,
+                'ids': {key: [record_id(key, record) for record in self.records(key)] for key in self.resources},
+            },
+        })
+
+        # Approximate memory footprint: encoded bytes plus the decoded
+        # resources, which take roughly three times their JSON size
+        encoded = sum(len(payload) for payload in self.payloads.values()) + len(self.resync_payload)
+        json_size = sum(len(self.payloads[(key, JSON_MEDIA_TYPE)]) for key in self.resources)
+        self.nbytes: int = encoded + 3 * json_size
+
+    def envelope(self, key: str) -> Dict[str, Any]:
+        """Return the API response envelope for a resource."""
+        data = self.resources[key]
+        if key in UNCOUNTED_RESOURCES:
+            return {'success': True, 'data': data}
+        return {'success': True, 'data': data, 'count': len(data)}
+
+    def payload(self, key: str, media_type: str = JSON_MEDIA_TYPE) -> bytes:
+        """Return the pre-encoded envelope for a resource in the given format."""
+        return self.payloads[(key, media_type)]
+
+    def etag(self, key: str, media_type: str = JSON_MEDIA_TYPE) -> str:
+        """Return the ETag of a resource's pre-encoded envelope."""
+        return self.etags[(key, media_type)]
+
+    def is_list(self, key: str) -> bool:
+        """Return True if the resource is a list of records."""
+        return key not in UNCOUNTED_RESOURCES
+
+    def iter_ndjson(self, key: str) -> Iterator[bytes]:
+        """Yield a list resource as newline-delimited JSON, one record per line."""
+        for record in self.resources[key]:
+            yield encode_json(record) + b'\n'
+
+    def records(self, key: str) -> List[Dict[str, Any]]:
+        """Return a resource as a list of records (single objects become one record)."""
+        data = self.resources[key]
+        return data if self.is_list(key) else [data]
+
+
+def diff_snapshots(old: DataSnapshot, new: DataSnapshot) -> List[Dict[str, Any]]:
+    """
+    Compute record-level changes between two snapshots.
+
+    Args:
+        old: Previous snapshot
+        new: Snapshot replacing it
+
+    Returns:
+        Change entries ({version, resource, op, id, index, record}) stamped
+        with the new snapshot's version; removals carry no record. Dropping
+        every record named in the changes, then inserting the added/updated
+        ones at their index in ascending order, reproduces the new list.
+    """
+    changes: List[Dict[str, Any]] = []
+    for resource in [*RESOURCES, *DERIVED_RESOURCES]:
+        old_list = old.records(resource) if resource in old.resources else []
+        new_list = new.records(resource) if resource in new.resources else []
+        old_records = {record_id(resource, record): record for record in old_list}
+        old_index = {identifier: index for index, identifier in enumerate(old_records)}
+        new_ids = [record_id(resource, record) for record in new_list]
+
+        # If surviving records were reordered, moved records are re-sent too so
+        # clients that insert changes by index end up with the server's order
+        surviving = set(new_ids) & old_records.keys()
+        reordered = (
+            [identifier for identifier in old_records if identifier in surviving]
+            != [identifier for identifier in new_ids if identifier in surviving]
+        )
+
+        for index, (identifier, record) in enumerate(zip(new_ids, new_list)):
+            previous = old_records.get(identifier)
+            if previous == record and not (reordered and old_index[identifier] != index):
+                continue
+            changes.append({
+                'version': new.version,
+                'resource': resource,
+                'op': 'added' if previous is None else 'updated',
+                'id': identifier,
+                'index': index,
+                'record': record,
+            })
+        for identifier in old_records.keys() - set(new_ids):
+            changes.append({
+                'version': new.version,
+                'resource': resource,
+                'op': 'removed',
+                'id': identifier,
+                'index': None,
+                'record': None,
+            })
+    return changes
+
+
+def compact_changes(changes: List[Dict[str, Any]], snapshot: DataSnapshot) -> List[Dict[str, Any]]:
+    """
+    Merge change entries spanning several versions into one entry per record.
+
+    Concatenated per-version diffs do not satisfy the diff_snapshots contract:
+    a record updated and later removed would be re-inserted, and one updated
+    twice would be inserted twice. The last op per (resource, id) is kept;
+    surviving records carry their index and content in `snapshot`, so the
+    contract holds for the merged list against that snapshot.
+
+    Args:
+        changes: Change entries in log order, all newer than the client's version
+        snapshot: Snapshot the changes lead up to
+
+    Returns:
+        Change entries in diff_snapshots order; records added and removed
+        again within the range are left out
+    """
+    first_ops: Dict[Tuple[str, str], str] = {}
+    latest: Dict[Tuple[str, str], Dict[str, Any]] = {}
+    for change in changes:
+        key = (change['resource'], change['id'])
+        first_ops.setdefault(key, change['op'])
+        latest[key] = change
+
+    positions: Dict[str, Dict[str, int]] = {}
+    compacted: List[Dict[str, Any]] = []
+    for key, change in latest.items():
+        resource, identifier = key
+        added = first_ops[key] == 'added'
+        if change['op'] == 'removed':
+            if not added:  # the client never saw records added after its version
+                compacted.append(change)
+            continue
+        if resource not in positions:
+            positions[resource] = {
+                record_id(resource, record): index for index, record in enumerate(snapshot.records(resource))
+            }
+        index = positions[resource][identifier]
+        compacted.append({
+            **change,
+            'op': 'added' if added else 'updated',
+            'index': index,
+            'record': snapshot.records(resource)[index],
+        })
+
+    order = {resource: position for position, resource in enumerate([*RESOURCES, *DERIVED_RESOURCES])}
+    return sorted(compacted, key=lambda change: (
+        order.get(change['resource'], len(order)), change['op'] == 'removed', change['index'] or 0
+    ))
+
+
+class SnapshotStore:
+    """Holds the current snapshot plus a bounded log of the changes between versions"""
+
+    def __init__(
+        self,
+        max_changes: int = 1000,
+        loader: Callable[[], Dict[str, Any]] = load_default_resources,
+        modified_at: Optional[Callable[[], float]] = None,
+        check_interval: float = 5.0
+    ) -> None:
+        """
+        Args:
+            max_changes: Maximum number of change entries kept in the log
+            loader: Returns the resources snapshots are built from
+            modified_at: Returns the modification time of the loader's source
+                (None if the source cannot change while the process runs)
+            check_interval: Minimum seconds between checks of the source's
+                modification time and of the month on access
+        """
+        self._loader: Callable[[], Dict[str, Any]] = loader
+        self._modified_at: Callable[[], float] = modified_at or (lambda: 0.0)
+        self.check_interval: float = check_interval
+        self._snapshot: Optional[DataSnapshot] = None
+        # Source modification time the current snapshot was built from, and
+        # the one a rebuild last failed on (not retried until it changes)
+        self._built_from: Optional[float] = None
+        self._failed_source: Optional[float] = None
+        self._next_check: float = 0.0
+        self._changes: Deque[Dict[str, Any]] = deque(maxlen=max_changes)
+        self._lock = threading.Lock()
+
+    def current(self) -> DataSnapshot:
+        """
+        Return the current snapshot, building it on first use.
+
+        At most every check_interval seconds, the snapshot is rebuilt if its
+        source was modified or the month changed since it was built.
+        """
+        snapshot = self._snapshot
+        if snapshot is None:
+            with self._lock:
+                snapshot = self._snapshot
+                if snapshot is None:
+                    snapshot = self._rebuild_locked()
+        elif time.monotonic() >= self._next_check:
+            snapshot = self.refresh()
+        return snapshot
+
+    def loaded(self) -> Optional[DataSnapshot]:
+        """Return the current snapshot if one has been built, without building it."""
+        return self._snapshot
+
+    def _build(self, version: int = 1, generation: Optional[str] = None) -> DataSnapshot:
+        return DataSnapshot(version, generation, loader=self._loader)
+
+    def refresh(self) -> DataSnapshot:
+        """
+        Rebuild the snapshot if its source was modified or the month changed.
+
+        A failed rebuild (e.g. a malformed tenant portfolio.json) is logged
+        and the previous snapshot kept; it is retried once the source is
+        modified again.
+
+        Returns:
+            The current snapshot
+        """
+        with self._lock:
+            self._next_check = time.monotonic() + self.check_interval
+            snapshot = self._snapshot
+            modified_at = self._modified_at()
+            if snapshot is not None and snapshot.as_of == month_start() and (
+                modified_at == self._built_from or modified_at == self._failed_source
+            ):
+                return snapshot
+            try:
+                return self._rebuild_locked()
+            except Exception as rebuild_error:
+                if snapshot is None:
+                    raise
+                self._failed_source = modified_at
+                logger.error(f"Keeping data snapshot version {snapshot.version}, rebuild failed: {rebuild_error}")
+                return snapshot
+
+    def rebuild(self) -> DataSnapshot:
+        """
+        Rebuild the snapshot from the data layer and record what changed.
+
+        The version only advances when the content differs; an identical
+        rebuild keeps the current snapshot.
+        """
+        with self._lock:
+            return self._rebuild_locked()
+
+    def _rebuild_locked(self) -> DataSnapshot:
+        previous = self._snapshot
+        # Read before loading, so an edit made during the load is caught by the next check
+        modified_at = self._modified_at()
+        if previous is None:
+            self._snapshot = self._build()
+            candidate, changes = self._snapshot, []
+        else:
+            candidate = self._build(previous.version + 1, previous.generation)
+            changes = diff_snapshots(previous, candidate)
+        self._built_from, self._failed_source = modified_at, None
+        self._next_check = time.monotonic() + self.check_interval
+        if previous is None or not changes:
+            return self._snapshot
+        self._changes.extend(changes)
+        self._snapshot = candidate
+        logger.info(f"Data snapshot advanced to version {candidate.version} ({len(changes)} changes)")
+        return candidate
+
+    def is_fresh(self) -> bool:
+        """
+        Return True if the current snapshot was built from the source as it
+        is now, in the current month (stats the modification time, builds nothing).
+        """
+        snapshot = self._snapshot
+        return (
+            snapshot is not None
+            and snapshot.as_of == month_start()
+            and self._modified_at() == self._built_from
+        )
+
+    def changes_since(self, since: int) -> Optional[List[Dict[str, Any]]]:
+        """
+        Return the changes made after a version.
+
+        Args:
+            since: Version the client currently holds
+
+        Returns:
+            Change entries newer than `since`, compacted to one per record
+            (empty if up to date), or None if that version is unknown or has
+            dropped out of the log and the client must resync from the full
+            snapshot
+        """
+        with self._lock:
+            snapshot = self._snapshot
+            current = snapshot.version if snapshot is not None else 1
+            changes = list(self._changes)
+            truncated = len(changes) == self._changes.maxlen
+        # Entries of the oldest retained version may have been partly evicted
+        floor = changes[0]['version'] if truncated else 1
+        if since < floor or since > current:
+            return None
+        newer = [change for change in changes if change['version'] > since]
+        return compact_changes(newer, snapshot) if newer else []
+
+
+class SnapshotCache:
+    """Bounded LRU of snapshot stores, evicted by approximate memory use"""
+
+    def __init__(self, max_bytes: int, max_changes: int = 1000, check_interval: float = 5.0) -> None:
+        """
+        Args:
+            max_bytes: Memory budget for all cached snapshots; the least
+                recently used stores are dropped once it is exceeded
+            max_changes: Change log size of each store
+            check_interval: Source check interval of each store
+        """
+        self.max_bytes: int = max_bytes
+        self.max_changes: int = max_changes
+        self.check_interval: float = check_interval
+        self._stores: 'OrderedDict[str, SnapshotStore]' = OrderedDict()
+        self._sizes: Dict[str, int] = {}
+        self.nbytes: int = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._stores)
+
+    def items(self) -> List[Tuple[str, SnapshotStore]]:
+        """Return the cached (key, store) pairs, least recently used first."""
+        with self._lock:
+            return list(self._stores.items())
+
+    def get(
+        self, key: str, loader: Callable[[], Dict[str, Any]], modified_at: Callable[[], float]
+    ) -> SnapshotStore:
+        """
+        Return the store for a key, loading its first snapshot on a miss.
+
+        On a hit the store's snapshot is refreshed if its source changed (see
+        SnapshotStore.current), and the cache's size accounting follows it.
+
+        Args:
+            key: Cache key (tenant slug)
+            loader: Returns the resources for this key
+            modified_at: Returns the modification time of the loader's source
+        """
+        with self._lock:
+            store = self._stores.get(key)
+            if store is not None:
+                self._stores.move_to_end(key)
+        if store is not None:
+            # Refresh outside the lock so a slow rebuild does not stall other keys
+            size = store.current().nbytes
+            with self._lock:
+                if key in self._sizes:
+                    self.nbytes += size - self._sizes[key]
+                    self._sizes[key] = size
+            return store
+
+        # Build outside the lock so a slow load does not stall other keys
+        store = SnapshotStore(
+            max_changes=self.max_changes, loader=loader, modified_at=modified_at, check_interval=self.check_interval
+        )
+        size = store.current().nbytes
+        with self._lock:
+            existing = self._stores.get(key)
+            if existing is not None:
+                self._stores.move_to_end(key)
+                return existing
+            self._stores[key] = store
+            self._sizes[key] = size
+            self.nbytes += size
+            while self.nbytes > self.max_bytes and len(self._stores) > 1:
+                evicted, _ = self._stores.popitem(last=False)
+                self.nbytes -= self._sizes.pop(evicted)
+                logger.debug(f"Evicted snapshot store {evicted!r} from cache")
+        return store
+
+
+_store = SnapshotStore(max_changes=Config.CHANGE_LOG_MAX_ENTRIES, check_interval=Config.SNAPSHOT_CHECK_INTERVAL)
+_tenant_stores = SnapshotCache(
+    max_bytes=Config.TENANT_CACHE_MAX_BYTES,
+    max_changes=Config.CHANGE_LOG_MAX_ENTRIES,
+    check_interval=Config.SNAPSHOT_CHECK_INTERVAL
+)
+
+
+def get_snapshot_store() -> SnapshotStore:
+    """Return the current tenant's snapshot store (the built-in portfolio's outside tenant requests)."""
+    tenant = current_tenant()
+    if tenant is None:
+        return _store
+    return _tenant_stores.get(tenant.slug, tenant.load_resources, tenant.modified_at)
+
+
+def snapshot_stores() -> List[Tuple[str, SnapshotStore]]:
+    """Return this worker's snapshot stores: the built-in one (key '') and every cached tenant's."""
+    return [('', _store), *_tenant_stores.items()]
+
+
+def build_snapshot() -> DataSnapshot:
+    """Rebuild the snapshot from the data layer and install it as the current one."""
+    snapshot = _store.rebuild()
+    logger.debug(f"Built data snapshot version {snapshot.version} with {len(snapshot.resources)} resources")
+    return snapshot
+
+
+def get_snapshot() -> DataSnapshot:
+    """Return the current tenant's snapshot, building it on first use."""
+    return get_snapshot_store().current()
+
+
+def snapshot_cache_stats() -> Dict[str, Dict[str, int]]:
+    """Return entry counts and approximate sizes of the built-in and tenant snapshots."""
+    snapshot = _store.loaded()
+    return {
+        'api_payloads': {
+            'entries': len(snapshot.payloads) if snapshot is not None else 0,
+            'bytes': snapshot.nbytes if snapshot is not None else 0,
+        },
+        'tenant_snapshots': {
+            'entries': len(_tenant_stores),
+            'bytes': _tenant_stores.nbytes,
+            'max_bytes': _tenant_stores.max_bytes,
+        },
+    }
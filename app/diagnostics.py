@@ -0,0 +1,205 @@
+"""
+Memory Diagnostics
+
+Per-process memory accounting for the admin diagnostics endpoints: RSS,
+tracemalloc allocation sites, the size of each in-process cache, and diffs
+between tracemalloc snapshots to find leaks in long-running workers.
+
+Every figure describes the worker process that serves the request (its pid
+is included in each report).
+"""
+
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+from flask import Flask
+from app.data.snapshot import snapshot_cache_stats
+from app.extensions import limiter
+from app.preload import get_rss_bytes
+from app.routes.fragments import fragment_cache_stats
+from app.routes.hints import hint_cache_stats
+from app.services.dedupe_service import get_dedupe_guard
+from app.services.digest_service import get_digest_queue
+from app.services.validation_service import get_email_validation_cache
+
+# Snapshots kept per worker for diffing (each holds every traced allocation)
+MAX_SNAPSHOTS = 4
+
+# Frames in our own tracing machinery are hidden from reports
+_TRACE_FILTERS = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+    tracemalloc.Filter(False, '<frozen importlib._bootstrap_external>'),
+)
+
+# snapshot id -> (taken at, snapshot), oldest first
+_snapshots: 'OrderedDict[int, Tuple[float, tracemalloc.Snapshot]]' = OrderedDict()
+_snapshot_ids = iter(range(1, sys.maxsize))
+_snapshot_lock = threading.Lock()
+
+
+def start_tracing(frames: int = 1) -> bool:
+    """Start tracemalloc in this process if it is not running; return True if started."""
+    if tracemalloc.is_tracing():
+        return False
+    tracemalloc.start(max(1, frames))
+    return True
+
+
+def stop_tracing() -> None:
+    """Stop tracemalloc and drop stored snapshots (frees the tracing overhead)."""
+    tracemalloc.stop()
+    with _snapshot_lock:
+        _snapshots.clear()
+
+
+def _approx_size(mapping: Dict[Any, Any]) -> int:
+    """
+    Shallow size of a dict and its keys/values (nested objects not followed).
+
+    Iterates a copy: the limits in-memory storage (which also holds shared
+    dedupe fingerprints) has only per-key locks, so its dicts change under
+    us. dict.copy() completes without releasing the GIL, so the copy is
+    consistent.
+    """
+    items = dict.copy(mapping)
+    return sys.getsizeof(items) + sum(sys.getsizeof(key) + sys.getsizeof(value) for key, value in items.items())
+
+
+def cache_stats(app: Flask) -> Dict[str, Dict[str, Any]]:
+    """
+    Return the entry count and size of every in-process cache.
+
+    Byte figures are encoded sizes where the cache knows them and shallow
+    estimates otherwise.
+    """
+    caches: Dict[str, Dict[str, Any]] = dict(snapshot_cache_stats())
+    caches['fragments'] = fragment_cache_stats()
+    caches['asset_hints'] = hint_cache_stats()
+
+    template_cache = app.jinja_env.cache
+    caches['templates'] = {
+        'entries': len(template_cache) if template_cache is not None else 0,
+        'max_entries': template_cache.capacity if template_cache is not None else 0,
+    }
+
+    storage = limiter.storage
+    if hasattr(storage, 'storage') and hasattr(storage, 'events'):
+        # In-memory limits storage: counters plus moving-window event lists
+        caches['limiter_storage'] = {
+            'backend': type(storage).__name__,
+            'entries': len(storage.storage) + len(storage.events),
+            'bytes': _approx_size(storage.storage) + _approx_size(storage.expirations) + _approx_size(storage.events),
+        }
+    else:
+        caches['limiter_storage'] = {'backend': type(storage).__name__, 'entries': None, 'bytes': None}
+
+    dedupe = get_dedupe_guard().stats()
+    caches['dedupe'] = {
+        key: dedupe[key] for key in ('entries', 'max_entries', 'backend', 'window_seconds', 'checked', 'suppressed')
+    }
+    caches['digest_outbox'] = {'entries': get_digest_queue().pending()}
+    validation = get_email_validation_cache().stats()
+    caches['email_validation'] = {'entries': validation['entries'], 'max_entries': validation['max_entries']}
+    return caches
+
+
+def _format_trace(statistic: Any) -> Dict[str, Any]:
+    frame = statistic.traceback[0]
+    return {
+        'site': f'{frame.filename}:{frame.lineno}',
+        'size_bytes': statistic.size,
+        'count': statistic.count,
+    }
+
+
+def memory_report(app: Flask, top: int = 20) -> Dict[str, Any]:
+    """Return RSS, tracemalloc totals and top allocation sites, and per-cache accounting."""
+    report: Dict[str, Any] = {
+        'pid': os.getpid(),
+        'rss_bytes': get_rss_bytes(),
+        'caches': cache_stats(app),
+        'tracemalloc': {'tracing': tracemalloc.is_tracing()},
+    }
+    if tracemalloc.is_tracing():
+        current, peak = tracemalloc.get_traced_memory()
+        statistics = tracemalloc.take_snapshot().filter_traces(_TRACE_FILTERS).statistics('lineno')
+        report['tracemalloc'].update({
+            'current_bytes': current,
+            'peak_bytes': peak,
+            'top': [_format_trace(statistic) for statistic in statistics[:top]],
+        })
+    with _snapshot_lock:
+        report['snapshots'] = [
+            {'id': snapshot_id, 'taken_at': taken_at} for snapshot_id, (taken_at, _) in _snapshots.items()
+        ]
+    return report
+
+
+def take_snapshot() -> Dict[str, Any]:
+    """
+    Store a tracemalloc snapshot for later diffing (starts tracing if needed).
+
+    Only allocations made after tracing started are visible, so take a
+    baseline snapshot first and compare later ones against it.
+    """
+    started = start_tracing()
+    snapshot = tracemalloc.take_snapshot().filter_traces(_TRACE_FILTERS)
+    with _snapshot_lock:
+        snapshot_id = next(_snapshot_ids)
+        _snapshots[snapshot_id] = (time.time(), snapshot)
+        while len(_snapshots) > MAX_SNAPSHOTS:
+            _snapshots.popitem(last=False)
+    return {
+        'pid': os.getpid(),
+        'id': snapshot_id,
+        'tracing_started': started,
+        'traced_bytes': sum(statistic.size for statistic in snapshot.statistics('filename')),
+    }
+
+
+def diff_snapshots(old_id: int, new_id: Optional[int] = None, top: int = 20) -> Optional[Dict[str, Any]]:
+    """
+    Compare two stored snapshots (or one against the current heap) by allocation site.
+
+    Args:
+        old_id: Baseline snapshot id
+        new_id: Later snapshot id; None compares against a fresh snapshot
+        top: Number of sites with the largest growth to return
+
+    Returns:
+        Diff report, or None if a snapshot id is unknown in this process
+    """
+    with _snapshot_lock:
+        old = _snapshots.get(old_id)
+        new = _snapshots.get(new_id) if new_id is not None else None
+    if old is None or (new_id is not None and new is None):
+        return None
+    if new is None:
+        if not tracemalloc.is_tracing():
+            return None
+        new = (time.time(), tracemalloc.take_snapshot().filter_traces(_TRACE_FILTERS))
+
+    differences = new[1].compare_to(old[1], 'lineno')
+    sites: List[Dict[str, Any]] = []
+    for difference in differences[:top]:
+        frame = difference.traceback[0]
+        sites.append({
+            'site': f'{frame.filename}:{frame.lineno}',
+            'size_diff_bytes': difference.size_diff,
+            'size_bytes': difference.size,
+            'count_diff': difference.count_diff,
+            'count': difference.count,
+        })
+    return {
+        'pid': os.getpid(),
+        'from': old_id,
+        'to': new_id if new_id is not None else 'now',
+        'elapsed_seconds': round(new[0] - old[0], 1),
+        'total_diff_bytes': sum(difference.size_diff for difference in differences),
+        'top': sites,
+    }
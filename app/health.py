@@ -0,0 +1,210 @@
+"""
+Readiness Probes
+
+Dependency checks for /ready, run in background threads so that health
+checks never do network I/O on the request path. Each probe runs at its own
+interval and caches its last result; /ready only reads those results.
+
+Probe statuses:
+    ok        dependency is working
+    degraded  working with reduced function (e.g. email delivery down)
+    failing   dependency is down; a critical failing probe makes /ready 503
+    pending   no result yet (worker just started)
+"""
+
+import os
+import smtplib
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+from flask import Flask
+from app.data.snapshot import snapshot_stores
+from app.extensions import limiter
+from app.logger import get_logger
+from app.services.digest_service import get_digest_queue
+
+logger = get_logger(__name__)
+
+OK = 'ok'
+DEGRADED = 'degraded'
+FAILING = 'failing'
+PENDING = 'pending'
+
+# A result older than this many intervals is treated as failing (probe thread stuck)
+STALE_AFTER_INTERVALS = 3
+
+
+@dataclass
+class Probe:
+    """Probe model"""
+    name: str
+    check: Callable[[], Tuple[str, str]]
+    interval: float
+    critical: bool = True
+
+
+@dataclass
+class ProbeResult:
+    """ProbeResult model"""
+    status: str
+    detail: str
+    checked_at: float
+    duration_ms: float
+
+
+class HealthMonitor:
+    """Runs probes on their own intervals and serves their cached results"""
+
+    def __init__(self, probes: List[Probe]) -> None:
+        self.probes: List[Probe] = probes
+        self._results: Dict[str, ProbeResult] = {}
+        self._pid: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def ensure_running(self) -> None:
+        """Start the probe threads in this process if not running (e.g. after a fork)."""
+        if self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+            self._pid = os.getpid()
+            # One thread per probe, so a slow probe (SMTP timeout) cannot delay the others
+            for probe in self.probes:
+                threading.Thread(
+                    target=self._run, args=(probe,), name=f'probe-{probe.name}', daemon=True
+                ).start()
+
+    def report(self) -> Tuple[Dict[str, Any], bool]:
+        """
+        Summarize the cached probe results (no I/O).
+
+        Returns:
+            Tuple of (report dictionary, ready flag)
+        """
+        now = time.time()
+        ready = True
+        degraded = False
+        probes: Dict[str, Any] = {}
+        for probe in self.probes:
+            result = self._results.get(probe.name)
+            if result is None:
+                status, detail, age, duration = PENDING, 'not checked yet', None, None
+            else:
+                status, detail = result.status, result.detail
+                age, duration = round(now - result.checked_at, 1), result.duration_ms
+                if age > STALE_AFTER_INTERVALS * probe.interval:
+                    status, detail = FAILING, f'result is stale ({age:.0f}s old)'
+            if status in (FAILING, PENDING) and probe.critical:
+                ready = False
+            elif status != OK:
+                degraded = True
+            probes[probe.name] = {
+                'status': status,
+                'detail': detail,
+                'critical': probe.critical,
+                'age_seconds': age,
+                'duration_ms': duration,
+            }
+        overall = 'not_ready' if not ready else ('degraded' if degraded else 'ready')
+        return {'status': overall, 'probes': probes}, ready
+
+    def run_probe(self, probe: Probe) -> ProbeResult:
+        """Run one probe now and cache its result (called from the probe's thread)."""
+        started = time.perf_counter()
+        try:
+            status, detail = probe.check()
+        except Exception as probe_error:
+            status, detail = FAILING, f'{type(probe_error).__name__}: {probe_error}'
+        result = ProbeResult(status, detail, time.time(), round((time.perf_counter() - started) * 1000, 2))
+        previous = self._results.get(probe.name)
+        if previous is None or previous.status != result.status:
+            log = logger.info if result.status == OK else logger.warning
+            log(f"Readiness probe {probe.name}: {result.status} ({result.detail})")
+        self._results[probe.name] = result
+        return result
+
+    def _run(self, probe: Probe) -> None:
+        while True:
+            started = time.monotonic()
+            self.run_probe(probe)
+            time.sleep(max(0.0, probe.interval - (time.monotonic() - started)))
+
+
+def smtp_probe(config: Mapping[str, Any]) -> Callable[[], Tuple[str, str]]:
+    """Check that the SMTP server accepts connections (greeting + NOOP, no login or TLS)."""
+    def check() -> Tuple[str, str]:
+        server, port = config.get('SMTP_SERVER'), config.get('SMTP_PORT')
+        if not server:
+            return OK, 'email not configured'
+        try:
+            with smtplib.SMTP(server, int(port), timeout=5) as connection:
+                code, _ = connection.noop()
+        except (OSError, smtplib.SMTPException) as smtp_error:
+            # The site keeps serving; the contact form reports the failure itself
+            return DEGRADED, f'{server}:{port} unreachable: {smtp_error}'
+        if code != 250:
+            return DEGRADED, f'{server}:{port} answered NOOP with {code}'
+        return OK, f'{server}:{port} reachable'
+    return check
+
+
+def limiter_storage_probe() -> Tuple[str, str]:
+    """Check the rate limiter storage (every request goes through it)."""
+    if limiter.storage.check():
+        return OK, f'{type(limiter.storage).__name__} reachable'
+    return FAILING, f'{type(limiter.storage).__name__} check failed'
+
+
+def snapshot_probe() -> Tuple[str, str]:
+    """
+    Check that the built-in and the cached tenant snapshots match their sources.
+
+    Probes run without a request, so every store this worker holds is
+    checked. Each is refreshed first, which picks up a portfolio.json
+    edited since the tenant's last request; a store that is still stale
+    failed to rebuild (the error is logged) and keeps serving old content.
+    """
+    stale: List[str] = []
+    stores = snapshot_stores()
+    for key, store in stores:
+        store.refresh()
+        if not store.is_fresh():
+            snapshot = store.loaded()
+            stale.append(f"{key or 'built-in'} (version {snapshot.version if snapshot else 0})")
+    if stale:
+        return DEGRADED, f"{len(stale)} of {len(stores)} snapshots out of date with their source: {', '.join(stale)}"
+    built_in = stores[0][1].current()
+    age = time.time() - built_in.built_at
+    return OK, f'{len(stores)} snapshots current; built-in version {built_in.version}, built {age:.0f}s ago'
+
+
+def outbox_probe(config: Mapping[str, Any]) -> Callable[[], Tuple[str, str]]:
+    """Check the digest outbox is not backing up (degraded once a batch reaches 80% of its DIGEST_MAX_PENDING)."""
+    def check() -> Tuple[str, str]:
+        queue = get_digest_queue()
+        # The bound applies per batch (worker and tenant), so compare the fullest one
+        pending, limit = queue.fullest_batch() or (0, int(config.get('DIGEST_MAX_PENDING', 1)))
+        detail = f'{pending}/{limit} pending in the fullest batch, {queue.failed_digests} failed digests'
+        return (DEGRADED if pending >= 0.8 * limit else OK), detail
+    return check
+
+
+def init_health(app: Flask) -> HealthMonitor:
+    """
+    Create the readiness monitor with the default probes and register it on the app.
+
+    Probe threads start with the first request each worker process serves,
+    so pre-forked workers run their own probes.
+    """
+    config = app.config
+    monitor = HealthMonitor([
+        Probe('smtp', smtp_probe(config), config['HEALTH_SMTP_INTERVAL'], critical=False),
+        Probe('limiter_storage', limiter_storage_probe, config['HEALTH_STORAGE_INTERVAL']),
+        Probe('snapshot', snapshot_probe, config['HEALTH_SNAPSHOT_INTERVAL']),
+        Probe('outbox', outbox_probe(config), config['HEALTH_OUTBOX_INTERVAL'], critical=False),
+    ])
+    app.extensions['health_monitor'] = monitor
+    app.before_request(monitor.ensure_running)
+    return monitor
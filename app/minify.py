@@ -0,0 +1,290 @@
+"""
+Asset Minification
+
+Dependency-free minifiers for the first-party stylesheet and script, and
+critical CSS extraction (the rules the above-the-fold markup needs). They
+are conservative: string literals are copied verbatim, and JavaScript keeps
+the line breaks automatic semicolon insertion may rely on.
+"""
+
+import re
+from html.parser import HTMLParser
+from typing import Iterator, List, Optional, Set, Tuple
+
+# A quoted string (with escapes) or a block comment
+_CSS_TOKEN = re.compile(r'"(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\'|/\*.*?\*/', re.S)
+_JS_STRING = re.compile(r'"(?:\\.|[^"\\\n])*"|\'(?:\\.|[^\'\\\n])*\'|`(?:\\.|[^`\\])*`')
+_JS_COMMENT = re.compile(r'/\*.*?\*/|//[^\n]*', re.S)
+_JS_REGEX = re.compile(r'/(?![*/])(?:\\.|\[(?:\\.|[^\]\\\n])*\]|[^/\\\n\[])+/[a-z]*')
+# A '/' after one of these characters or keywords starts a regex literal, not a division
+_REGEX_PRECEDERS = frozenset('(,=:[!&|?{};+-*%<>~^')
+_REGEX_KEYWORDS = frozenset({'return', 'typeof', 'case', 'do', 'else', 'in', 'of', 'new', 'delete', 'void', 'throw'})
+_JS_IDENTIFIER_END = re.compile(r'[\w$]+$')
+
+_CSS_SPACE_AROUND = re.compile(r'\s*([{};,>])\s*')
+_CSS_SPACE_AFTER_COLON = re.compile(r':\s+')
+_JS_SPACE_AROUND = re.compile(r'[ \t]*([{}()\[\];,:=<>!&|?])[ \t]*')
+_JS_JOIN_AFTER = re.compile(r'([{;,])\n+')
+_JS_JOIN_BEFORE = re.compile(r'\n+([})\]])')
+
+# Void elements never get an end tag, so they do not open a nesting level
+_VOID_ELEMENTS = frozenset({
+    'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link', 'meta', 'source', 'track', 'wbr'
+})
+_PSEUDO = re.compile(r'::?[\w-]+(?:\((?:[^()]|\([^()]*\))*\))?')
+_ATTRIBUTE = re.compile(r'\[[^\]]*\]')
+_SELECTOR_CLASS = re.compile(r'\.([\w-]+)')
+_SELECTOR_ID = re.compile(r'#([\w-]+)')
+_SELECTOR_TAG = re.compile(r'(?:^|[\s>+~])([a-zA-Z][\w-]*)')
+_ANIMATION_NAME = re.compile(r'animation(?:-name)?:([^;}]+)')
+
+
+def _split_css(source: str) -> Iterator[Tuple[bool, str]]:
+    """Yield (is_code, text) pieces, separating strings and comments from code."""
+    position = 0
+    for match in _CSS_TOKEN.finditer(source):
+        if match.start() > position:
+            yield True, source[position:match.start()]
+        yield False, match.group()
+        position = match.end()
+    if position < len(source):
+        yield True, source[position:]
+
+
+def minify_css(source: str) -> str:
+    """
+    Minify a stylesheet: drop comments and collapse whitespace.
+
+    Spaces before '(' and around '+'/'-' are kept, since `and (` in media
+    queries and operators in calc() need them. Comments starting with /*!
+    (licenses) are kept.
+    """
+    pieces: List[Tuple[bool, str]] = []
+    for is_code, text in _split_css(source):
+        if text.startswith('/*') and not text.startswith('/*!'):
+            is_code, text = True, ' '
+        if is_code and pieces and pieces[-1][0]:
+            pieces[-1] = (True, pieces[-1][1] + text)
+        else:
+            pieces.append((is_code, text))
+    return ''.join(_compact_css(text) if is_code else text for is_code, text in pieces).replace(';}', '}').strip()
+
+
+def _compact_css(code: str) -> str:
+    """Collapse the whitespace of a stylesheet span (no strings or comments inside)."""
+    code = _CSS_SPACE_AROUND.sub(r'\1', re.sub(r'\s+', ' ', code))
+    return _CSS_SPACE_AFTER_COLON.sub(':', code)
+
+
+def _starts_regex(source: str, position: int) -> bool:
+    """Return True if the '/' at position begins a regex literal (judged by what precedes it)."""
+    index = position - 1
+    while index >= 0 and source[index] in ' \t\r\n':
+        index -= 1
+    if index < 0 or source[index] in _REGEX_PRECEDERS:
+        return True
+    word = _JS_IDENTIFIER_END.search(source, 0, index + 1)
+    return word is not None and word.group() in _REGEX_KEYWORDS
+
+
+def _split_js(source: str) -> Iterator[Tuple[str, str]]:
+    """Yield ('code' | 'literal' | 'comment', text) pieces of a script."""
+    position = code_start = 0
+    while position < len(source):
+        char = source[position]
+        kind, match = 'literal', None
+        if char in '"\'`':
+            match = _JS_STRING.match(source, position)
+        elif char == '/':
+            match = _JS_COMMENT.match(source, position)
+            if match is not None:
+                kind = 'comment'
+            elif _starts_regex(source, position):
+                match = _JS_REGEX.match(source, position)
+        if match is None:
+            position += 1
+            continue
+        if position > code_start:
+            yield 'code', source[code_start:position]
+        yield kind, match.group()
+        position = code_start = match.end()
+    if code_start < len(source):
+        yield 'code', source[code_start:]
+
+
+def minify_js(source: str) -> str:
+    """
+    Minify a script: drop comments, indentation and blank lines.
+
+    Line breaks are removed only where they cannot end a statement (after
+    '{', ';' or ',' and before a closing bracket). Names are not mangled,
+    and strings, template literals and regex literals are copied verbatim.
+    Comments starting with /*! (licenses) are kept.
+    """
+    # (is_code, text); comments become whitespace and merge into the code around them
+    pieces: List[Tuple[bool, str]] = []
+    for kind, text in _split_js(source):
+        if kind == 'comment' and not text.startswith('/*!'):
+            # A line comment ends its line; a block comment still separates tokens
+            kind, text = 'code', '\n' if text.startswith('//') else ' '
+        if kind == 'code' and pieces and pieces[-1][0]:
+            pieces[-1] = (True, pieces[-1][1] + text)
+        else:
+            pieces.append((kind == 'code', text))
+    return ''.join(_compact_js(text) if is_code else text for is_code, text in pieces).strip()
+
+
+def _compact_js(code: str) -> str:
+    """Collapse the whitespace of a code span (no literals or comments inside)."""
+    code = re.sub(r'[ \t]+', ' ', code)
+    code = re.sub(r' ?\n[ \n]*', '\n', code)
+    code = _JS_SPACE_AROUND.sub(r'\1', code)
+    code = _JS_JOIN_AFTER.sub(r'\1', code)
+    return _JS_JOIN_BEFORE.sub(r'\1', code)
+
+
+class _FoldParser(HTMLParser):
+    """Collects the tags, classes and ids used from <body> to the end of the fold element"""
+
+    def __init__(self, fold_id: str) -> None:
+        super().__init__()
+        self.fold_id = fold_id
+        self.tags: Set[str] = {'html', 'body'}
+        self.classes: Set[str] = set()
+        self.ids: Set[str] = set()
+        self._collecting = False
+        self._done = False
+        self._fold_depth: Optional[int] = None
+        self._depth = 0
+
+    def handle_starttag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]) -> None:
+        if tag == 'body':
+            self._collecting = True
+            return
+        if not self._collecting or self._done:
+            return
+        attributes = dict(attrs)
+        self.tags.add(tag)
+        self.classes.update((attributes.get('class') or '').split())
+        if attributes.get('id'):
+            self.ids.add(attributes['id'])
+        if tag in _VOID_ELEMENTS:
+            return
+        self._depth += 1
+        if self._fold_depth is None and attributes.get('id') == self.fold_id:
+            self._fold_depth = self._depth
+
+    def handle_endtag(self, tag: str) -> None:
+        if not self._collecting or self._done or tag in _VOID_ELEMENTS or tag == 'body':
+            return
+        if self._fold_depth is not None and self._depth == self._fold_depth:
+            self._done = True
+        self._depth -= 1
+
+
+def _css_blocks(css: str) -> Iterator[Tuple[str, str]]:
+    """Yield the (prelude, body) of each top-level block of minified CSS; statements have body ''."""
+    position = 0
+    while position < len(css):
+        brace = css.find('{', position)
+        semicolon = css.find(';', position)
+        if semicolon != -1 and (brace == -1 or semicolon < brace):
+            # Statement at-rule such as @import or @charset
+            yield css[position:semicolon + 1], ''
+            position = semicolon + 1
+            continue
+        if brace == -1:
+            return
+        depth = 0
+        for index in range(brace, len(css)):
+            if css[index] == '{':
+                depth += 1
+            elif css[index] == '}':
+                depth -= 1
+                if depth == 0:
+                    break
+        yield css[position:brace], css[brace + 1:index]
+        position = index + 1
+
+
+def _split_selectors(prelude: str) -> List[str]:
+    """Split a selector list at its top-level commas (not those inside :is(), :not(), ...)."""
+    selectors: List[str] = []
+    depth = start = 0
+    for index, char in enumerate(prelude):
+        if char in '([':
+            depth += 1
+        elif char in ')]':
+            depth -= 1
+        elif char == ',' and depth == 0:
+            selectors.append(prelude[start:index])
+            start = index + 1
+    selectors.append(prelude[start:])
+    return selectors
+
+
+def _selector_matches(selector: str, tags: Set[str], classes: Set[str], ids: Set[str]) -> bool:
+    """Return True if every tag, class and id a selector names occurs in the fold markup."""
+    simple = _ATTRIBUTE.sub('', _PSEUDO.sub('', selector.strip()))
+    return (
+        set(_SELECTOR_CLASS.findall(simple)) <= classes
+        and set(_SELECTOR_ID.findall(simple)) <= ids
+        and {tag.lower() for tag in _SELECTOR_TAG.findall(_SELECTOR_CLASS.sub('', _SELECTOR_ID.sub('', simple)))}
+        <= tags
+    )
+
+
+def _critical_rules(css: str, tags: Set[str], classes: Set[str], ids: Set[str]) -> str:
+    """Return the rules of minified CSS whose selectors can match the fold markup."""
+    kept: List[str] = []
+    for prelude, body in _css_blocks(css):
+        if prelude.startswith('@'):
+            if not body:
+                kept.append(prelude)
+            elif prelude.startswith(('@media', '@supports')):
+                inner = _critical_rules(body, tags, classes, ids)
+                if inner:
+                    kept.append(f'{prelude}{{{inner}}}')
+            elif prelude.startswith('@font-face'):
+                kept.append(f'{prelude}{{{body}}}')
+            # @keyframes are added afterwards, only if a kept rule uses them
+            continue
+        selectors = [
+            selector for selector in _split_selectors(prelude) if _selector_matches(selector, tags, classes, ids)
+        ]
+        if selectors:
+            kept.append(f"{','.join(selectors)}{{{body}}}")
+    return ''.join(kept)
+
+
+def extract_critical_css(css: str, html: str, fold_id: str) -> str:
+    """
+    Extract the CSS needed to render a page down to the end of its fold element.
+
+    A rule is kept when every class, id and tag its selector names occurs
+    between <body> and the end of the element with id `fold_id` (pseudo
+    classes and attribute selectors are ignored, so hover and focus styles
+    of those elements are kept too). Media and feature queries are filtered
+    recursively; @font-face and the @keyframes the kept rules use are kept.
+
+    Args:
+        css: Minified stylesheet
+        html: Rendered page
+        fold_id: Id of the last element shown above the fold
+
+    Returns:
+        Minified critical CSS
+    """
+    parser = _FoldParser(fold_id)
+    parser.feed(html)
+    parser.close()
+    critical = _critical_rules(css, parser.tags, parser.classes, parser.ids)
+
+    animations = {
+        name for value in _ANIMATION_NAME.findall(critical) for name in re.findall(r'[\w-]+', value)
+    }
+    keyframes = [
+        f'{prelude}{{{body}}}' for prelude, body in _css_blocks(css)
+        if prelude.startswith(('@keyframes', '@-webkit-keyframes')) and prelude.split()[-1] in animations
+    ]
+    return critical + ''.join(keyframes)
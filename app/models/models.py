@@ -67,4 +67,6 @@ class PortfolioStats:
     """Portfolio statistics model"""
     github_projects: int
     live_projects: int
-    years_experience: int
\ No newline at end of file
+    years_experience: float
+    total_projects: int
+    technologies: int
@@ -71,5 +71,7 @@ class Serializers:
         return {
             "github_projects": stats.github_projects,
             "live_projects": stats.live_projects,
-            "years_experience": stats.years_experience
+            "years_experience": stats.years_experience,
+            "total_projects": stats.total_projects,
+            "technologies": stats.technologies
         }
\ No newline at end of file
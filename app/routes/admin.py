@@ -0,0 +1,91 @@
+"""
+Admin Diagnostics Routes
+Memory instrumentation for operators (requires ADMIN_TOKEN)
+"""
+
+import hmac
+from functools import wraps
+from typing import Any, Callable, Tuple
+from flask import Blueprint, current_app, jsonify, request, Response
+from app.diagnostics import diff_snapshots, memory_report, start_tracing, stop_tracing, take_snapshot
+from app.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Create admin blueprint
+admin_bp = Blueprint('admin', __name__, url_prefix='/admin')
+
+
+def admin_required(view: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Require `Authorization: Bearer <ADMIN_TOKEN>`.
+
+    Without a configured ADMIN_TOKEN the admin surface does not exist (404).
+    """
+    @wraps(view)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        token: str = current_app.config.get('ADMIN_TOKEN') or ''
+        if not token:
+            return jsonify({'success': False, 'message': 'Not found'}), 404
+        scheme, _, supplied = request.headers.get('Authorization', '').partition(' ')
+        if scheme.lower() != 'bearer' or not hmac.compare_digest(supplied.encode(), token.encode()):
+            logger.warning(f"Rejected admin request to {request.path} from IP {request.remote_addr}")
+            response = jsonify({'success': False, 'message': 'Unauthorized'})
+            response.headers['WWW-Authenticate'] = 'Bearer'
+            return response, 401
+        return view(*args, **kwargs)
+    return wrapper
+
+
+@admin_bp.route('/memory', methods=['GET'])
+@admin_required
+def get_memory() -> Tuple[Response, int]:
+    """Get RSS, top allocation sites and per-cache sizes of this worker"""
+    try:
+        top = request.args.get('top', 20, type=int)
+        return jsonify({'success': True, 'data': memory_report(current_app, top=top)}), 200
+    except Exception as e:
+        logger.error(f"Error building memory report: {str(e)}", exc_info=True)
+        return jsonify({'success': False, 'message': 'Failed to build memory report'}), 500
+
+
+@admin_bp.route('/memory/tracing', methods=['POST'])
+@admin_required
+def set_tracing() -> Tuple[Response, int]:
+    """Start (enabled=true, optional frames=N) or stop tracemalloc in this worker"""
+    enabled = request.values.get('enabled', 'true').lower() == 'true'
+    if enabled:
+        started = start_tracing(request.values.get('frames', 1, type=int))
+        return jsonify({'success': True, 'data': {'tracing': True, 'started': started}}), 200
+    stop_tracing()
+    return jsonify({'success': True, 'data': {'tracing': False}}), 200
+
+
+@admin_bp.route('/memory/snapshots', methods=['POST'])
+@admin_required
+def create_snapshot() -> Tuple[Response, int]:
+    """Store a tracemalloc snapshot of this worker for diffing"""
+    try:
+        return jsonify({'success': True, 'data': take_snapshot()}), 201
+    except Exception as e:
+        logger.error(f"Error taking memory snapshot: {str(e)}", exc_info=True)
+        return jsonify({'success': False, 'message': 'Failed to take memory snapshot'}), 500
+
+
+@admin_bp.route('/memory/diff', methods=['GET'])
+@admin_required
+def get_memory_diff() -> Tuple[Response, int]:
+    """Compare two snapshots (?from=<id>&to=<id>), or one against now (omit to)"""
+    old_id = request.args.get('from', type=int)
+    new_id = request.args.get('to', type=int)
+    if old_id is None:
+        return jsonify({'success': False, 'message': 'Query parameter from=<snapshot id> is required'}), 400
+
+    diff = diff_snapshots(old_id, new_id, top=request.args.get('top', 20, type=int))
+    if diff is None:
+        # Snapshots live in the worker that took them; another worker may have answered
+        return jsonify({
+            'success': False,
+            'message': 'Unknown snapshot id in this worker (or tracing stopped)'
+        }), 404
+    return jsonify({'success': True, 'data': diff}), 200
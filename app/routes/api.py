@@ -3,48 +3,76 @@ Portfolio API Routes
 RESTful API endpoints for portfolio data
 """
 
-from typing import Callable, Any, Tuple
-from flask import Blueprint, jsonify, Response
-from app.data.data import Data
+from typing import Tuple
+from flask import Blueprint, jsonify, request, Response
+from app.data.encoding import canonical_media_type, offered_media_types
+from app.data.snapshot import DataSnapshot, get_snapshot, get_snapshot_store
 from app.logger import get_logger
+from app.routes.caching import revalidatable
 
 logger = get_logger(__name__)
 
 # Create API blueprint
 api_bp = Blueprint('api', __name__, url_prefix='/api')
 
+NDJSON_MEDIA_TYPE = 'application/x-ndjson'
 
-def _handle_api_request(
-    service_method: Callable[[], Any],
-    resource_name: str,
-    include_count: bool = True
-) -> Tuple[Response, int]:
+
+def _stream_ndjson(snapshot: DataSnapshot, resource_key: str, resource_name: str) -> Tuple[Response, int]:
+    """
+    Stream a list resource as NDJSON, one record per line.
+
+    The body is a generator without a Content-Length, so the server sends it
+    chunked and only pulls the next record once the previous one is written.
+
+    Args:
+        snapshot: Data snapshot to stream from
+        resource_key: Snapshot resource key
+        resource_name: Name of the resource for logging
+
+    Returns:
+        Tuple of (streaming response, HTTP status code)
+    """
+    logger.debug(f"Streaming {resource_name} as NDJSON")
+    response = Response(snapshot.iter_ndjson(resource_key), mimetype=NDJSON_MEDIA_TYPE)
+    # Ask reverse proxies (nginx) not to buffer the whole stream
+    response.headers['X-Accel-Buffering'] = 'no'
+    return response, 200
+
+
+def _handle_api_request(resource_key: str, resource_name: str) -> Tuple[Response, int]:
     """
     Generic handler for API requests to reduce code duplication.
 
+    Serves the envelope pre-encoded in the current data snapshot, so no
+    serialization happens on the request path. The format (JSON, MessagePack
+    or CBOR) is negotiated from the Accept header, defaulting to JSON.
+    List resources can instead be streamed as NDJSON with ?stream=ndjson.
+
     Args:
-        service_method: Service method to call
+        resource_key: Snapshot resource key (see app.data.snapshot.RESOURCES and DERIVED_RESOURCES)
         resource_name: Name of the resource for logging/error messages
-        include_count: Whether to include count in response
 
     Returns:
         Tuple of (JSON response, HTTP status code)
     """
     try:
-        data = service_method()
-        if include_count:
-            logger.debug(f"Returning {len(data)} {resource_name}")
-            return jsonify({
-                'success': True,
-                'data': data,
-                'count': len(data)
-            }), 200
-        else:
-            logger.debug(f"Returning {resource_name}")
-            return jsonify({
-                'success': True,
-                'data': data
-            }), 200
+        snapshot = get_snapshot()
+        stream_mode = request.args.get('stream')
+        if stream_mode is not None:
+            if stream_mode != 'ndjson' or not snapshot.is_list(resource_key):
+                return jsonify({
+                    'success': False,
+                    'message': f'Streaming mode {stream_mode!r} is not supported for {resource_name}'
+                }), 400
+            return _stream_ndjson(snapshot, resource_key, resource_name)
+
+        media_type = canonical_media_type(request.accept_mimetypes.best_match(offered_media_types()))
+        payload = snapshot.payload(resource_key, media_type)
+        logger.debug(f"Returning {resource_name} as {media_type}")
+        response = Response(payload, mimetype=media_type)
+        response.vary.add('Accept')
+        return revalidatable(response, snapshot.etag(resource_key, media_type), snapshot)
     except Exception as e:
         logger.error(f"Error fetching {resource_name}: {str(e)}", exc_info=True)
         return jsonify({
@@ -57,7 +85,7 @@ def _handle_api_request(
 def get_projects() -> Tuple[Response, int]:
     """Get all projects"""
     return _handle_api_request(
-        Data.get_projects,
+        'projects',
         'projects'
     )
 
@@ -66,7 +94,7 @@ def get_projects() -> Tuple[Response, int]:
 def get_skills() -> Tuple[Response, int]:
     """Get all skills organized by category"""
     return _handle_api_request(
-        Data.get_skills,
+        'skills',
         'skill categories'
     )
 
@@ -75,7 +103,7 @@ def get_skills() -> Tuple[Response, int]:
 def get_experience() -> Tuple[Response, int]:
     """Get all experience items"""
     return _handle_api_request(
-        Data.get_experience,
+        'experience',
         'experience items'
     )
 
@@ -84,7 +112,7 @@ def get_experience() -> Tuple[Response, int]:
 def get_education() -> Tuple[Response, int]:
     """Get all education items"""
     return _handle_api_request(
-        Data.get_education,
+        'education',
         'education items'
     )
 
@@ -93,7 +121,7 @@ def get_education() -> Tuple[Response, int]:
 def get_certifications() -> Tuple[Response, int]:
     """Get all certifications"""
     return _handle_api_request(
-        Data.get_certifications,
+        'certifications',
         'certifications'
     )
 
@@ -102,7 +130,69 @@ def get_certifications() -> Tuple[Response, int]:
 def get_stats() -> Tuple[Response, int]:
     """Get portfolio statistics"""
     return _handle_api_request(
-        Data.get_stats,
-        'portfolio statistics',
-        include_count=False
-    )
\ No newline at end of file
+        'stats',
+        'portfolio statistics'
+    )
+
+
+@api_bp.route('/skills/graph', methods=['GET'])
+def get_skill_graph() -> Tuple[Response, int]:
+    """Get the skill co-occurrence graph (skills used together in projects and roles)"""
+    return _handle_api_request(
+        'skill_graph',
+        'skill graph'
+    )
+
+
+@api_bp.route('/changes', methods=['GET'])
+def get_changes() -> Tuple[Response, int]:
+    """
+    Get the record-level changes since a content version.
+
+    Query args:
+        since: Version the client holds (0 or omitted requests a full resync)
+        generation: Generation the client's version belongs to (required for deltas)
+
+    Clients whose version is unknown, that send no generation or another one
+    (e.g. a redeploy restarted the version sequence) or whose version has
+    dropped out of the bounded change log get the full resources with
+    resync=True instead of deltas.
+    Responses carry the snapshot fingerprint as ETag, so a client that is up
+    to date gets an empty 304.
+    """
+    try:
+        since = int(request.args.get('since', 0))
+    except ValueError:
+        return jsonify({
+            'success': False,
+            'message': 'Parameter since must be an integer version'
+        }), 400
+
+    try:
+        store = get_snapshot_store()
+        snapshot = store.current()
+        generation = request.args.get('generation')
+        changes = store.changes_since(since) if since and generation == snapshot.generation else None
+        if changes is None:
+            logger.debug(f"Change feed resync from version {since} to {snapshot.version}")
+            response = Response(snapshot.resync_payload, mimetype='application/json')
+            return revalidatable(response, snapshot.fingerprint, snapshot)
+
+        logger.debug(f"Returning {len(changes)} changes since version {since}")
+        response = jsonify({
+            'success': True,
+            'data': {
+                'version': snapshot.version,
+                'generation': snapshot.generation,
+                'fingerprint': snapshot.fingerprint,
+                'resync': False,
+                'changes': changes
+            }
+        })
+        return revalidatable(response, snapshot.fingerprint, snapshot)
+    except Exception as e:
+        logger.error(f"Error fetching changes since {since}: {str(e)}", exc_info=True)
+        return jsonify({
+            'success': False,
+            'message': 'Failed to fetch changes'
+        }), 500
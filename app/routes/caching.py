@@ -0,0 +1,30 @@
+"""
+HTTP Caching Helpers
+Validator headers and conditional responses for snapshot-derived content
+"""
+
+from typing import Tuple
+from flask import request, Response
+from app.data.snapshot import DataSnapshot
+
+
+def revalidatable(response: Response, etag: str, snapshot: DataSnapshot) -> Tuple[Response, int]:
+    """
+    Attach cache metadata and answer conditional requests.
+
+    Clients may store the response but must revalidate it (Cache-Control:
+    no-cache); a matching If-None-Match turns it into an empty 304.
+
+    Args:
+        response: Response carrying a pre-encoded payload
+        etag: Content-derived ETag of that payload
+        snapshot: Snapshot the payload was taken from
+
+    Returns:
+        Tuple of (response, HTTP status code: 200 or 304)
+    """
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = 'no-cache'
+    response.headers['X-Data-Version'] = str(snapshot.version)
+    response.make_conditional(request)
+    return response, response.status_code
@@ -3,14 +3,18 @@ Contact Form Routes
 Handle contact form submissions
 """
 
-from typing import Tuple
-from flask import Blueprint, request, jsonify, current_app, Response
-from email_validator import validate_email, EmailNotValidError
+from typing import Any, Dict, Mapping, Tuple
+from flask import Blueprint, request, jsonify, Response
+from limits import parse as parse_rate_limit
 from app.config import Config
 from app.logger import get_logger
 from app.exceptions import ValidationError
-from app.services.email_service import EmailService
+from app.services.email_service import EmailService, is_email_configured
+from app.services.digest_service import queue_for_digest
+from app.services.dedupe_service import get_dedupe_guard, submission_fingerprint
+from app.services.validation_service import validate_email_address
 from app.extensions import limiter
+from app.tenants import current_tenant, tenant_config
 
 logger = get_logger(__name__)
 
@@ -18,74 +22,141 @@ logger = get_logger(__name__)
 # Create blueprint
 contact_bp = Blueprint('contact', __name__)
 
+# User-facing messages shared by the sync view and the async (ASGI) handler
+SUCCESS_MESSAGE = 'Message sent successfully! I\'ll get back to you soon.'
+NOT_CONFIGURED_MESSAGE = 'Email service is not configured. Please contact me directly via email.'
+
+# Contact form rate limit: one bucket per client IP, shared by the sync view
+# and the async (ASGI) handler
+CONTACT_RATE_LIMIT = Config.RATE_LIMIT_DEFAULTS
+CONTACT_RATE_LIMIT_SCOPE = 'contact'
+
+
+def hit_contact_rate_limit(client_ip: str, app_config: Mapping[str, Any]) -> bool:
+    """
+    Count a submission handled outside Flask against the contact form rate limit.
+
+    Uses the same storage key as the view's shared_limit decorator, so both
+    paths draw on one budget.
+
+    Args:
+        client_ip: Client address (the limiter's key)
+        app_config: Flask app config (for RATELIMIT_KEY_PREFIX)
+
+    Returns:
+        False if the limit is exceeded
+    """
+    key = [client_ip, CONTACT_RATE_LIMIT_SCOPE]
+    if app_config.get('RATELIMIT_KEY_PREFIX'):
+        key.insert(0, app_config['RATELIMIT_KEY_PREFIX'])
+    return limiter.limiter.hit(parse_rate_limit(CONTACT_RATE_LIMIT), *key)
+
+
+def send_failed_message(config: Mapping[str, Any]) -> str:
+    """Message returned when the email could not be sent (config: the tenant's, from tenant_config())."""
+    return f'Unable to send email at this time. Please contact me directly at {config.get("RECIPIENT_EMAIL")}'
+
+
+def unexpected_error_message(config: Mapping[str, Any]) -> str:
+    """Message returned on unexpected errors (config: the tenant's, from tenant_config())."""
+    return f'An error occurred. Please try again or email me directly at {config.get("RECIPIENT_EMAIL")}'
+
+
+def parse_contact_form(form: Mapping[str, str]) -> Dict[str, str]:
+    """
+    Validate and normalize a contact form submission.
+
+    Args:
+        form: Submitted form fields
+
+    Returns:
+        Dictionary with name, email (normalized), subject and message
+
+    Raises:
+        ValidationError: If a field is missing, too long or invalid
+    """
+    name: str = form.get('name', '').strip()
+    email: str = form.get('email', '').strip()
+    subject: str = form.get('subject', '').strip()
+    message: str = form.get('message', '').strip()
+
+    # Validate required fields
+    for field_name, field_value in [('name', name), ('email', email), ('subject', subject), ('message', message)]:
+        if not field_value:
+            raise ValidationError(f'{field_name.capitalize()} is required and cannot be empty', field=field_name)
+
+    # Validate lengths
+    if len(name) > Config.MAX_NAME_LENGTH:
+        raise ValidationError(f'Name is too long (maximum {Config.MAX_NAME_LENGTH} characters)', field='name')
+    if len(email) > Config.MAX_EMAIL_LENGTH:
+        raise ValidationError(f'Email is too long (maximum {Config.MAX_EMAIL_LENGTH} characters)', field='email')
+    if len(subject) > Config.MAX_SUBJECT_LENGTH:
+        raise ValidationError(f'Subject is too long (maximum {Config.MAX_SUBJECT_LENGTH} characters)', field='subject')
+    if len(message) > Config.MAX_MESSAGE_LENGTH:
+        raise ValidationError(f'Message is too long (maximum {Config.MAX_MESSAGE_LENGTH} characters)', field='message')
+
+    # Validate and normalize email (cached per address)
+    email = validate_email_address(email)
+
+    return {'name': name, 'email': email, 'subject': subject, 'message': message}
+
 
 @contact_bp.route('/contact', methods=['POST'])
-@limiter.limit(Config.RATE_LIMIT_DEFAULTS)
+@limiter.shared_limit(CONTACT_RATE_LIMIT, scope=CONTACT_RATE_LIMIT_SCOPE)
 def submit_contact_form() -> Tuple[Response, int]:
     """Handle contact form submissions via AJAX"""
     client_ip: str = request.remote_addr or 'unknown'
     logger.info(f"Contact form submission attempt from IP: {client_ip}")
+    config = tenant_config()
 
     try:
+        # Drop replays of a recently sent payload before validating or sending
+        tenant = current_tenant()
+        dedupe_guard = get_dedupe_guard()
+        fingerprint = submission_fingerprint(request.form, tenant.slug if tenant else '')
+        if dedupe_guard.seen(fingerprint):
+            logger.info(f"Suppressed duplicate contact form submission from IP {client_ip}")
+            return jsonify({
+                'success': True,
+                'message': SUCCESS_MESSAGE
+            }), 200
+
         # Get and validate form data
-        name: str = request.form.get('name', '').strip()
-        email: str = request.form.get('email', '').strip()
-        subject: str = request.form.get('subject', '').strip()
-        message: str = request.form.get('message', '').strip()
-
-        # Validate required fields
-        for field_name, field_value in [('name', name), ('email', email), ('subject', subject), ('message', message)]:
-            if not field_value:
-                raise ValidationError(f'{field_name.capitalize()} is required and cannot be empty', field=field_name)
-
-        # Validate lengths
-        if len(name) > Config.MAX_NAME_LENGTH:
-            raise ValidationError(f'Name is too long (maximum {Config.MAX_NAME_LENGTH} characters)', field='name')
-        if len(email) > Config.MAX_EMAIL_LENGTH:
-            raise ValidationError(f'Email is too long (maximum {Config.MAX_EMAIL_LENGTH} characters)', field='email')
-        if len(subject) > Config.MAX_SUBJECT_LENGTH:
-            raise ValidationError(f'Subject is too long (maximum {Config.MAX_SUBJECT_LENGTH} characters)', field='subject')
-        if len(message) > Config.MAX_MESSAGE_LENGTH:
-            raise ValidationError(f'Message is too long (maximum {Config.MAX_MESSAGE_LENGTH} characters)', field='message')
-
-        # Validate and normalize email
-        try:
-            email_validation_info = validate_email(email, check_deliverability=False)
-            email = email_validation_info.normalized
-        except EmailNotValidError as validation_error:
-            raise ValidationError(
-                f'Invalid email address: {str(validation_error)}',
-                field='email'
-            )
+        submission = parse_contact_form(request.form)
+        name, email = submission['name'], submission['email']
 
         # Check if email is configured before attempting to send
-        if not Config.validate_email_config():
+        if not is_email_configured(config):
             logger.warning(f"Email not configured - contact form submission from {name} ({email}) cannot be sent")
             return jsonify({
                 'success': False,
-                'message': 'Email service is not configured. Please contact me directly via email.'
+                'message': NOT_CONFIGURED_MESSAGE
             }), 503  # Service Unavailable
 
-        # Send email
-        email_service: EmailService = EmailService(current_app.config)
+        # A concurrent identical submission may have claimed the fingerprint meanwhile
+        if not dedupe_guard.claim(fingerprint):
+            logger.info(f"Suppressed concurrent duplicate contact form submission from {name} ({email})")
+            return jsonify({
+                'success': True,
+                'message': SUCCESS_MESSAGE
+            }), 200
+
+        # Queue for the next digest, or send email now
         try:
-            email_service.send_contact_form_email(
-                name=name,
-                email=email,
-                subject=subject,
-                message=message
-            )
+            if not queue_for_digest(submission, config, tenant.slug if tenant else ''):
+                EmailService(config).send_contact_form_email(**submission)
             logger.info(f"Contact form submitted successfully from {name} ({email})")
             return jsonify({
                 'success': True,
-                'message': 'Message sent successfully! I\'ll get back to you soon.'
+                'message': SUCCESS_MESSAGE
             }), 200
         except Exception as email_error:
             # Catch email-specific errors and return user-friendly message
+            dedupe_guard.release(fingerprint)
             logger.error(f"Email sending failed for contact form from {name} ({email}): {str(email_error)}")
             return jsonify({
                 'success': False,
-                'message': f'Unable to send email at this time. Please contact me directly at {Config.RECIPIENT_EMAIL}'
+                'message': send_failed_message(config)
             }), 503  # Service Unavailable
 
     except ValidationError as e:
@@ -98,5 +169,5 @@ def submit_contact_form() -> Tuple[Response, int]:
         logger.error(f"Unexpected error processing contact form from IP {client_ip}: {str(e)}", exc_info=True)
         return jsonify({
             'success': False,
-            'message': f'An error occurred. Please try again or email me directly at {Config.RECIPIENT_EMAIL}'
-        }), 500
\ No newline at end of file
+            'message': unexpected_error_message(config)
+        }), 500
@@ -0,0 +1,109 @@
+"""
+Section Fragment Routes
+Server-rendered HTML for each data-driven section, loaded lazily by the page
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Dict, Tuple
+from flask import Blueprint, current_app, jsonify, render_template, Response
+from limits import parse_many
+from app.config import Config
+from app.data.snapshot import DataSnapshot, get_snapshot
+from app.extensions import limiter
+from app.logger import get_logger
+from app.routes.caching import revalidatable
+from app.tenants import current_tenant, tenant_templates
+
+logger = get_logger(__name__)
+
+# Create fragments blueprint
+fragments_bp = Blueprint('fragments', __name__, url_prefix='/fragments')
+
+# Sections with a partial in templates/partials/, keyed by snapshot resource
+SECTIONS = ('projects', 'skills', 'experience', 'education', 'certifications')
+
+# One page view requests every section from this single route, so it gets the
+# default per-route budget once per section
+FRAGMENT_RATE_LIMIT = ';'.join(
+    f'{item.amount * len(SECTIONS)} per {item.multiples} {item.GRANULARITY.name}'
+    for item in parse_many(Config.RATE_LIMIT_DEFAULTS)
+)
+
+# (tenant slug, snapshot fingerprint, section) -> (rendered HTML, ETag),
+# least recently used first
+_fragment_cache: 'OrderedDict[Tuple[str, str, str], Tuple[bytes, str]]' = OrderedDict()
+_fragment_lock = threading.Lock()
+
+
+def render_fragment(snapshot: DataSnapshot, section: str) -> Tuple[bytes, str]:
+    """
+    Render a section partial, cached per tenant and data snapshot.
+
+    Must be called inside an application context; inside a tenant request
+    the tenant's template override is used when it has one.
+
+    Args:
+        snapshot: Data snapshot to render from
+        section: Section name (one of SECTIONS)
+
+    Returns:
+        Tuple of (UTF-8 HTML, ETag)
+    """
+    tenant = current_tenant()
+    key = (tenant.slug if tenant else '', snapshot.fingerprint, section)
+    with _fragment_lock:
+        cached = _fragment_cache.get(key)
+        if cached is not None:
+            _fragment_cache.move_to_end(key)
+            return cached
+
+    template = tenant_templates(f'partials/{section}.html')
+    html = render_template(template, items=snapshot.resources[section]).encode('utf-8')
+    rendered = (html, hashlib.sha1(html).hexdigest()[:16])
+    with _fragment_lock:
+        _fragment_cache[key] = rendered
+        while len(_fragment_cache) > current_app.config['FRAGMENT_CACHE_MAX_ENTRIES']:
+            _fragment_cache.popitem(last=False)
+    logger.debug(f"Rendered {section} fragment for snapshot version {snapshot.version}")
+    return rendered
+
+
+def fragment_cache_stats() -> Dict[str, int]:
+    """Return the entry count and HTML size of the fragment cache."""
+    with _fragment_lock:
+        return {
+            'entries': len(_fragment_cache),
+            'bytes': sum(len(html) for html, _ in _fragment_cache.values()),
+            'max_entries': current_app.config['FRAGMENT_CACHE_MAX_ENTRIES'],
+        }
+
+
+def warm_fragments() -> None:
+    """Render every section fragment for the current snapshot (needs an app context)."""
+    snapshot = get_snapshot()
+    for section in SECTIONS:
+        render_fragment(snapshot, section)
+
+
+@fragments_bp.route('/<section>', methods=['GET'])
+@limiter.limit(FRAGMENT_RATE_LIMIT)
+def get_fragment(section: str) -> Tuple[Response, int]:
+    """Get the rendered HTML of a portfolio section"""
+    if section not in SECTIONS:
+        return jsonify({
+            'success': False,
+            'message': f'Unknown section {section!r}'
+        }), 404
+
+    try:
+        snapshot = get_snapshot()
+        html, etag = render_fragment(snapshot, section)
+        return revalidatable(Response(html, mimetype='text/html'), etag, snapshot)
+    except Exception as e:
+        logger.error(f"Error rendering {section} fragment: {str(e)}", exc_info=True)
+        return jsonify({
+            'success': False,
+            'message': f'Failed to render {section}'
+        }), 500
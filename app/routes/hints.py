@@ -0,0 +1,123 @@
+"""
+Resource Hint Helpers
+Link preload/preconnect headers and 103 Early Hints for the homepage assets
+"""
+
+import threading
+from collections import OrderedDict
+from html.parser import HTMLParser
+from typing import Dict, List, Optional, Tuple
+from flask import request
+from app.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Distinct (template, script root) pairs remembered; one per tenant at most
+MAX_HINT_ENTRIES = 1024
+
+# (template name, script root) -> Link header value, least recently used first
+_hints: 'OrderedDict[Tuple[str, str], str]' = OrderedDict()
+_hints_lock = threading.Lock()
+
+
+class AssetHintParser(HTMLParser):
+    """Collects the preconnect origins, stylesheets and scripts of a page's <head>"""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.preconnects: List[str] = []
+        self.preloads: List[str] = []
+        self._in_head = False
+
+    def handle_starttag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]) -> None:
+        attributes: Dict[str, Optional[str]] = dict(attrs)
+        if tag == 'head':
+            self._in_head = True
+        elif tag == 'body':
+            self._in_head = False
+        elif tag == 'link' and self._in_head and attributes.get('href'):
+            rel = (attributes.get('rel') or '').lower().split()
+            if 'preconnect' in rel:
+                self.preconnects.append(_link(attributes['href'], 'preconnect', attributes))
+            elif 'stylesheet' in rel:
+                self.preloads.append(_link(attributes['href'], 'preload', attributes, 'style'))
+        elif tag == 'script' and attributes.get('src'):
+            # Scripts are usually deferred at the end of <body>; they still belong in the hints
+            self.preloads.append(_link(attributes['src'], 'preload', attributes, 'script'))
+
+
+def _link(href: str, rel: str, attributes: Dict[str, Optional[str]], as_type: Optional[str] = None) -> str:
+    """Format one Link header entry, carrying the attributes the fetch must match."""
+    parts = [f'<{href}>', f'rel={rel}']
+    if as_type:
+        parts.append(f'as={as_type}')
+    if 'crossorigin' in attributes:
+        # A bare attribute means anonymous; the preload is reused only if the mode matches
+        crossorigin = attributes['crossorigin']
+        parts.append(f'crossorigin={crossorigin}' if crossorigin else 'crossorigin')
+    if attributes.get('integrity') and rel == 'preload':
+        parts.append(f'integrity="{attributes["integrity"]}"')
+    if attributes.get('referrerpolicy') and rel == 'preload':
+        parts.append(f'referrerpolicy={attributes["referrerpolicy"]}')
+    return '; '.join(parts)
+
+
+def extract_asset_hints(html: str) -> str:
+    """Return the Link header value hinting the assets a rendered page references."""
+    parser = AssetHintParser()
+    parser.feed(html)
+    parser.close()
+    # A <noscript> fallback repeats its stylesheets; hint each asset once
+    return ', '.join(dict.fromkeys(parser.preconnects + parser.preloads))
+
+
+def cached_asset_hints(template_name: str) -> Optional[str]:
+    """Return the Link value learned for a template under the current script root, or None."""
+    key = (template_name, request.script_root)
+    with _hints_lock:
+        link = _hints.get(key)
+        if link is not None:
+            _hints.move_to_end(key)
+        return link
+
+
+def learn_asset_hints(template_name: str, html: str) -> str:
+    """Compute and remember the Link value for a template from its rendered HTML."""
+    link = extract_asset_hints(html)
+    with _hints_lock:
+        _hints[(template_name, request.script_root)] = link
+        while len(_hints) > MAX_HINT_ENTRIES:
+            _hints.popitem(last=False)
+    logger.debug(f"Learned {link.count('<')} asset hints for {template_name}")
+    return link
+
+
+def hint_cache_stats() -> Dict[str, int]:
+    """Return the entry count and size of the learned Link header values."""
+    with _hints_lock:
+        return {
+            'entries': len(_hints),
+            'bytes': sum(len(link) for link in _hints.values()),
+            'max_entries': MAX_HINT_ENTRIES,
+        }
+
+
+def send_early_hints(link: str) -> bool:
+    """
+    Send a 103 Early Hints response when the server supports it.
+
+    Gunicorn exposes this to WSGI apps as environ['wsgi.early_hints'];
+    other servers (e.g. the Werkzeug dev server) do not, and nothing is sent.
+
+    Returns:
+        True if the hints were handed to the server
+    """
+    early_hints = request.environ.get('wsgi.early_hints')
+    if early_hints is None or not link:
+        return False
+    try:
+        early_hints([('Link', link)])
+    except Exception as hint_error:
+        logger.warning(f"Could not send 103 Early Hints: {hint_error}")
+        return False
+    return True
@@ -4,7 +4,11 @@ Index Routes
 Home page and health check endpoints for the portfolio website.
 """
 
-from flask import Blueprint, jsonify, render_template
+from flask import Blueprint, current_app, jsonify, make_response, render_template
+from app.data.snapshot import get_snapshot
+from app.extensions import limiter
+from app.routes.hints import cached_asset_hints, learn_asset_hints, send_early_hints
+from app.tenants import tenant_templates
 
 # Create a Blueprint for the index routes
 index_bp = Blueprint('index', __name__)
@@ -13,7 +17,22 @@ index_bp = Blueprint('index', __name__)
 @index_bp.route('/')
 def index():
     """Root endpoint to render the portfolio homepage."""
-    return render_template('index.html')
+    template = current_app.jinja_env.get_or_select_template(tenant_templates('index.html'))
+
+    # Let the browser fetch the page's assets while the page itself renders
+    link = cached_asset_hints(template.name)
+    if link is not None:
+        send_early_hints(link)
+
+    # Stats are rendered inline; the other sections are fetched as fragments
+    html = render_template(template, stats=get_snapshot().resources['stats'])
+    if link is None:
+        link = learn_asset_hints(template.name, html)
+
+    response = make_response(html)
+    if link:
+        response.headers['Link'] = link
+    return response
 
 
 @index_bp.route('/health')
@@ -22,4 +41,12 @@ def health():
     return jsonify({
         'message': 'Health check successful',
         'status': 'healthy'
-    }), 200
\ No newline at end of file
+    }), 200
+
+
+@index_bp.route('/ready')
+@limiter.exempt
+def ready():
+    """Readiness endpoint: cached results of the background dependency probes."""
+    report, is_ready = current_app.extensions['health_monitor'].report()
+    return jsonify(report), 200 if is_ready else 503
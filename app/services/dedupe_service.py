@@ -0,0 +1,144 @@
+"""
+Dedupe Service
+Suppress duplicate and replayed contact form submissions
+
+Each submission is reduced to a content fingerprint (tenant + normalized
+fields). A fingerprint seen within DEDUPE_WINDOW_SECONDS is dropped before
+email validation and before any SMTP I/O. Fingerprints are kept in a bounded
+per-process LRU, or in the rate limiter's storage when that is shared across
+workers (e.g. RATE_LIMIT_STORAGE_URI=redis://...).
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Mapping, Optional
+from app.config import Config
+from app.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Storage key namespace for fingerprints in the shared limiter storage
+SHARED_KEY_PREFIX = 'contact-dedupe/'
+
+
+def submission_fingerprint(form: Mapping[str, str], tenant_slug: str = '') -> str:
+    """
+    Return the content fingerprint of a contact form submission.
+
+    Works on the raw form, so it can run before validation: fields are
+    whitespace-collapsed and the email is case-folded, making trivially
+    different replays of the same payload collide.
+    """
+    parts = [tenant_slug]
+    for field_name in ('name', 'email', 'subject', 'message'):
+        value = ' '.join(str(form.get(field_name, '')).split())
+        parts.append(value.lower() if field_name == 'email' else value)
+    return hashlib.blake2b('\x1f'.join(parts).encode('utf-8'), digest_size=16).hexdigest()
+
+
+class DedupeGuard:
+    """Time-windowed set of recently sent submission fingerprints"""
+
+    def __init__(self, window_seconds: float, max_entries: int, storage: Optional[Any] = None) -> None:
+        """
+        Args:
+            window_seconds: How long a fingerprint suppresses identical submissions
+                (0 disables suppression)
+            max_entries: Bound on fingerprints kept by the local LRU
+            storage: Optional limits storage shared across workers; when given
+                it is used instead of the local LRU
+        """
+        self.window_seconds: float = window_seconds
+        self.max_entries: int = max_entries
+        self.storage = storage
+        # fingerprint -> expiry (monotonic), oldest first
+        self._seen: 'OrderedDict[str, float]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.checked: int = 0
+        self.suppressed: int = 0
+
+    def seen(self, fingerprint: str) -> bool:
+        """Return True (and count a suppressed send) if the fingerprint is within its window."""
+        if self.window_seconds <= 0:
+            return False
+        if self.storage is not None:
+            duplicate = self.storage.get(SHARED_KEY_PREFIX + fingerprint) > 0
+        else:
+            with self._lock:
+                expires_at = self._seen.get(fingerprint)
+                duplicate = expires_at is not None and expires_at > time.monotonic()
+        self._count(duplicate)
+        return duplicate
+
+    def claim(self, fingerprint: str) -> bool:
+        """
+        Atomically record a fingerprint before sending.
+
+        Returns:
+            True if the caller should send, False if a concurrent identical
+            submission already claimed it (counted as suppressed)
+        """
+        if self.window_seconds <= 0:
+            return True
+        if self.storage is not None:
+            claimed = self.storage.incr(SHARED_KEY_PREFIX + fingerprint, self.window_seconds) == 1
+        else:
+            now = time.monotonic()
+            with self._lock:
+                expires_at = self._seen.get(fingerprint)
+                claimed = expires_at is None or expires_at <= now
+                if claimed:
+                    self._seen[fingerprint] = now + self.window_seconds
+                    self._seen.move_to_end(fingerprint)
+                    while len(self._seen) > self.max_entries:
+                        self._seen.popitem(last=False)
+        if not claimed:
+            self._count(True, checked=False)
+        return claimed
+
+    def release(self, fingerprint: str) -> None:
+        """Forget a fingerprint whose send failed, so the visitor can retry."""
+        if self.storage is not None:
+            self.storage.clear(SHARED_KEY_PREFIX + fingerprint)
+        else:
+            with self._lock:
+                self._seen.pop(fingerprint, None)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return suppression counters (per process) and the local LRU size."""
+        with self._lock:
+            return {
+                'backend': 'shared' if self.storage is not None else 'local',
+                'checked': self.checked,
+                'suppressed': self.suppressed,
+                'entries': len(self._seen),
+                'max_entries': self.max_entries,
+                'window_seconds': self.window_seconds,
+            }
+
+    def _count(self, suppressed: bool, checked: bool = True) -> None:
+        with self._lock:
+            self.checked += int(checked)
+            self.suppressed += int(suppressed)
+
+
+_guard: Optional[DedupeGuard] = None
+_guard_lock = threading.Lock()
+
+
+def get_dedupe_guard() -> DedupeGuard:
+    """Return the process-wide dedupe guard, created on first use."""
+    global _guard
+    if _guard is None:
+        with _guard_lock:
+            if _guard is None:
+                storage = None
+                if not Config.RATE_LIMIT_STORAGE_URI.startswith('memory://'):
+                    # Limiter storage is shared across workers; reuse it for fingerprints
+                    from app.extensions import limiter
+                    storage = limiter.storage
+                _guard = DedupeGuard(Config.DEDUPE_WINDOW_SECONDS, Config.DEDUPE_MAX_ENTRIES, storage)
+                logger.info(f"Contact dedupe window {Config.DEDUPE_WINDOW_SECONDS}s ({_guard.stats()['backend']} backend)")
+    return _guard
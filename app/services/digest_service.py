@@ -0,0 +1,235 @@
+"""
+Digest Service
+Batch contact form submissions into periodic digest emails
+
+With DIGEST_MODE enabled, submissions are queued per recipient configuration
+and sent as one email when DIGEST_WINDOW_SECONDS have passed since the oldest
+queued submission, or as soon as DIGEST_MAX_SUBMISSIONS are queued. Priority
+submissions (subject or message containing a DIGEST_PRIORITY_KEYWORDS entry)
+bypass the queue and are sent immediately.
+
+The queue lives in this worker's memory and is flushed only by the flusher
+thread and at interpreter exit (atexit). A worker killed by the OOM killer,
+the gunicorn timeout or SIGKILL loses whatever is still queued.
+"""
+
+import atexit
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any, Deque, Dict, List, Mapping, Optional, Tuple
+from app.config import Config
+from app.exceptions import EmailServiceError, ConfigurationError
+from app.logger import get_logger
+from app.services.email_service import EmailService
+
+logger = get_logger(__name__)
+
+# Pause before retrying after a failed digest, so an unreachable relay is not hammered
+RETRY_DELAY_SECONDS = 60
+
+
+def _config_value(config: Mapping[str, Any], key: str) -> Any:
+    """Get a value from a (tenant) config mapping, falling back to Config."""
+    return config.get(key, getattr(Config, key))
+
+
+def _config_flag(config: Mapping[str, Any], key: str) -> bool:
+    """Get a boolean setting; tenant.json may hold "true"/"false" strings like the env."""
+    return str(_config_value(config, key)).lower() == 'true'
+
+
+def _config_int(config: Mapping[str, Any], key: str) -> int:
+    """Get an integer setting from a (tenant) config mapping."""
+    return int(_config_value(config, key))
+
+
+def _config_float(config: Mapping[str, Any], key: str) -> float:
+    """Get a numeric setting from a (tenant) config mapping."""
+    return float(_config_value(config, key))
+
+
+def is_priority_submission(submission: Mapping[str, str], config: Mapping[str, Any]) -> bool:
+    """
+    Return True if a submission should skip the digest and be sent immediately.
+
+    Priority is decided from DIGEST_PRIORITY_KEYWORDS, matched
+    case-insensitively against subject and message. Those are visitor text,
+    so anyone who writes a keyword such as "urgent" skips the digest; the
+    keywords route mail, they do not limit it.
+    """
+    keywords = _config_value(config, 'DIGEST_PRIORITY_KEYWORDS')
+    if isinstance(keywords, str):
+        keywords = keywords.split(',')
+    text = f"{submission['subject']}\n{submission['message']}".lower()
+    return any(keyword.strip().lower() in text for keyword in keywords if keyword.strip())
+
+
+class DigestQueue:
+    """Per-process queue of contact submissions awaiting a digest email"""
+
+    def __init__(self) -> None:
+        # key -> (config to send with, pending submissions oldest first)
+        self._batches: Dict[str, Tuple[Mapping[str, Any], Deque[Dict[str, Any]]]] = {}
+        self._condition = threading.Condition()
+        self._flusher: Optional[threading.Thread] = None
+        self.sent_digests: int = 0
+        self.sent_submissions: int = 0
+        self.dropped_submissions: int = 0
+        self.failed_digests: int = 0
+
+    def enqueue(self, submission: Mapping[str, str], config: Mapping[str, Any], key: str = '') -> None:
+        """
+        Queue a validated submission for the next digest.
+
+        Args:
+            submission: Validated contact form fields (name, email, subject, message)
+            config: Config mapping the digest will be sent with
+            key: Batch key; submissions for different recipients (tenants) are
+                never mixed in one digest
+        """
+        entry: Dict[str, Any] = dict(submission, received_at=datetime.now(timezone.utc), queued_at=time.monotonic())
+        with self._condition:
+            pending = self._batch(key, config)
+            if len(pending) == pending.maxlen:
+                self.dropped_submissions += 1
+                logger.warning(f"Digest queue {key or 'default'!r} full; dropping oldest submission")
+            pending.append(entry)
+            self._ensure_flusher()
+            self._condition.notify()
+        logger.info(f"Queued contact form submission from {submission['name']} for digest ({len(pending)} pending)")
+
+    def pending(self) -> int:
+        """Return the number of submissions waiting across all batches."""
+        with self._condition:
+            return sum(len(batch) for _, batch in self._batches.values())
+
+    def fullest_batch(self) -> Optional[Tuple[int, int]]:
+        """Return (pending, bound) of the batch closest to its DIGEST_MAX_PENDING bound, or None if idle."""
+        with self._condition:
+            fills = [(len(batch), batch.maxlen) for _, batch in self._batches.values() if batch]
+        return max(fills, key=lambda fill: fill[0] / fill[1], default=None)
+
+    def flush(self, force: bool = False) -> int:
+        """
+        Send every batch that is due (or all batches when force is set).
+
+        Returns:
+            Number of submissions sent
+        """
+        sent = 0
+        for key, config, submissions in self._take_due(force):
+            try:
+                EmailService(config).send_digest_email(submissions)
+            except (EmailServiceError, ConfigurationError) as send_error:
+                logger.error(f"Digest for {key or 'default'!r} failed, re-queueing {len(submissions)}: {send_error}")
+                self._requeue(key, config, submissions)
+                with self._condition:
+                    self.failed_digests += 1
+                continue
+            sent += len(submissions)
+            with self._condition:
+                self.sent_digests += 1
+                self.sent_submissions += len(submissions)
+        return sent
+
+    def _take_due(self, force: bool) -> List[Tuple[str, Mapping[str, Any], List[Dict[str, Any]]]]:
+        """Remove and return the batches that are due for sending."""
+        now = time.monotonic()
+        due = []
+        with self._condition:
+            for key, (config, pending) in list(self._batches.items()):
+                while pending and (force or self._is_due(config, pending, now)):
+                    size = min(len(pending), _config_int(config, 'DIGEST_MAX_SUBMISSIONS'))
+                    due.append((key, config, [pending.popleft() for _ in range(size)]))
+        return due
+
+    def _requeue(self, key: str, config: Mapping[str, Any], submissions: List[Dict[str, Any]]) -> None:
+        """Put unsent submissions back in front of the queue, restarting their window."""
+        with self._condition:
+            pending = self._batch(key, config)
+            retry_at = time.monotonic()
+            for entry in reversed(submissions):
+                if len(pending) == pending.maxlen:
+                    self.dropped_submissions += 1
+                    continue
+                pending.appendleft(dict(entry, queued_at=retry_at))
+
+    def _batch(self, key: str, config: Mapping[str, Any]) -> Deque[Dict[str, Any]]:
+        """Return the pending deque for a key, creating it bounded by DIGEST_MAX_PENDING."""
+        if key not in self._batches:
+            self._batches[key] = (config, deque(maxlen=_config_int(config, 'DIGEST_MAX_PENDING')))
+        return self._batches[key][1]
+
+    @staticmethod
+    def _is_due(config: Mapping[str, Any], pending: Deque[Dict[str, Any]], now: float) -> bool:
+        window = _config_float(config, 'DIGEST_WINDOW_SECONDS')
+        return (
+            len(pending) >= _config_int(config, 'DIGEST_MAX_SUBMISSIONS')
+            or now - pending[0]['queued_at'] >= window
+        )
+
+    def _next_deadline(self) -> Optional[float]:
+        """Seconds until the next batch is due (0 if one is due), None if idle."""
+        now = time.monotonic()
+        waits = [
+            0.0 if self._is_due(config, pending, now)
+            else _config_float(config, 'DIGEST_WINDOW_SECONDS') - (now - pending[0]['queued_at'])
+            for config, pending in self._batches.values() if pending
+        ]
+        return min(waits) if waits else None
+
+    def _ensure_flusher(self) -> None:
+        # Started lazily (after any pre-fork), so each worker process owns its flusher
+        if self._flusher is None or not self._flusher.is_alive():
+            self._flusher = threading.Thread(target=self._run, name='contact-digest', daemon=True)
+            self._flusher.start()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                wait = self._next_deadline()
+                while wait is None or wait > 0:
+                    self._condition.wait(timeout=wait)
+                    wait = self._next_deadline()
+            failed_before = self.failed_digests
+            try:
+                self.flush()
+            except Exception as flush_error:
+                logger.error(f"Digest flush failed: {flush_error}", exc_info=True)
+                failed_before = -1
+            if self.failed_digests != failed_before:
+                time.sleep(RETRY_DELAY_SECONDS)
+
+
+_digest_queue = DigestQueue()
+
+
+@atexit.register
+def _flush_on_exit() -> None:
+    """Send whatever is still queued when the worker shuts down."""
+    if _digest_queue.pending():
+        _digest_queue.flush(force=True)
+
+
+def get_digest_queue() -> DigestQueue:
+    """Return this process's digest queue."""
+    return _digest_queue
+
+
+def queue_for_digest(submission: Mapping[str, str], config: Mapping[str, Any], key: str = '') -> bool:
+    """
+    Queue a submission when digest mode applies to it.
+
+    Returns:
+        True if the submission was queued, False if it must be sent now
+        (digest mode disabled or priority submission)
+    """
+    if not _config_flag(config, 'DIGEST_MODE'):
+        return False
+    if is_priority_submission(submission, config):
+        logger.info(f"Priority contact form submission from {submission['name']}; sending immediately")
+        return False
+    _digest_queue.enqueue(submission, config, key)
+    return True
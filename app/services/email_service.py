@@ -4,16 +4,33 @@ Business logic for sending emails
 """
 
 import smtplib
-from typing import Optional, Union, Any, Dict
+from typing import Optional, Union, Any, Dict, List, Mapping, Sequence
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from datetime import datetime, timezone
 from app.exceptions import EmailServiceError, ConfigurationError
 from app.config import Config
 from app.logger import get_logger
+from app.services.validation_service import validate_emails
+
+try:
+    import aiosmtplib
+except ImportError:  # async email (ASGI contact handler) unavailable
+    aiosmtplib = None
 
 logger = get_logger(__name__)
 
+# Settings without which no contact form message can be sent
+REQUIRED_EMAIL_SETTINGS = ('SMTP_SERVER', 'SMTP_USERNAME', 'SMTP_PASSWORD', 'RECIPIENT_EMAIL')
+
+
+def is_email_configured(config: Mapping[str, Any]) -> bool:
+    """
+    Return True if a config (e.g. a tenant's, from tenant_config()) is
+    configured enough to send contact form messages.
+    """
+    return all(config.get(key) for key in REQUIRED_EMAIL_SETTINGS)
+
 
 class EmailService:
     """Service for sending emails via SMTP"""
@@ -42,6 +59,7 @@ class EmailService:
         self.smtp_username: str = self._get_config_value('SMTP_USERNAME') or ''
         self.smtp_password: str = self._get_config_value('SMTP_PASSWORD') or ''
         self.recipient_email: str = self._get_config_value('RECIPIENT_EMAIL') or ''
+        self.smtp_starttls: bool = str(self._get_config_value('SMTP_STARTTLS', True)).lower() == 'true'
 
         try:
             self.smtp_port: int = int(smtp_port_raw) if smtp_port_raw is not None else 0
@@ -103,6 +121,32 @@ class EmailService:
             logger.error(f"Unexpected error sending email: {error_message}", exc_info=True)
             raise EmailServiceError(error_message, original_error=unexpected_error)
 
+    def send_digest_email(self, submissions: Sequence[Dict[str, Any]]) -> bool:
+        """
+        Send several contact form submissions as one email
+
+        Args:
+            submissions: Submissions as queued by the digest service, oldest first
+
+        Returns:
+            True if email sent successfully
+
+        Raises:
+            EmailServiceError: If email sending fails
+        """
+        try:
+            logger.info(f"Sending contact digest with {len(submissions)} submission(s)")
+            self._send_message(self._create_digest_message(submissions))
+            logger.info(f"Successfully sent contact digest with {len(submissions)} submission(s)")
+            return True
+
+        except EmailServiceError:
+            raise
+        except Exception as unexpected_error:
+            error_message: str = f"Unexpected error while sending digest: {str(unexpected_error)}"
+            logger.error(f"Unexpected error sending digest: {error_message}", exc_info=True)
+            raise EmailServiceError(error_message, original_error=unexpected_error)
+
     def _create_message(
         self,
         name: str,
@@ -131,13 +175,7 @@ class EmailService:
         # Create email body
         email_body: str = f"""New contact form submission from your portfolio:
 
-Name: {name}
-Email: {email}
-Subject: {subject}
-
-Message:
-{message}
-
+{self._format_submission(name, email, subject, message)}
 ---
 Sent from portfolio contact form at {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')}
 """
@@ -146,6 +184,59 @@ Sent from portfolio contact form at {datetime.now(timezone.utc).strftime('%Y-%m-
 
         return email_message
 
+    def _create_digest_message(self, submissions: Sequence[Dict[str, Any]]) -> MIMEMultipart:
+        """
+        Create one email message covering several submissions
+
+        Args:
+            submissions: Submissions with name, email, subject, message and
+                received_at (aware datetime), oldest first
+
+        Returns:
+            MIMEMultipart message object
+        """
+        if len(submissions) == 1:
+            only = submissions[0]
+            return self._create_message(only['name'], only['email'], only['subject'], only['message'])
+
+        email_message: MIMEMultipart = MIMEMultipart()
+        email_message['From'] = self.smtp_username
+        email_message['To'] = self.recipient_email
+        email_message['Subject'] = f"Portfolio Contact Digest: {len(submissions)} messages"
+        # Replies go straight to the sender when every message came from one address
+        senders = {check.normalized for check in validate_emails(entry['email'] for entry in submissions)}
+        if len(senders) == 1 and None not in senders:
+            email_message['Reply-To'] = senders.pop()
+
+        sections: List[str] = [
+            f"[{number}/{len(submissions)}] Received {submission['received_at'].strftime('%Y-%m-%d %H:%M:%S UTC')}\n"
+            + self._format_submission(
+                submission['name'], submission['email'], submission['subject'], submission['message']
+            )
+            for number, submission in enumerate(submissions, start=1)
+        ]
+        email_body: str = (
+            f"{len(submissions)} new contact form submissions from your portfolio:\n\n"
+            + "\n========================================\n\n".join(sections)
+            + f"\n---\nDigest sent from portfolio contact form at "
+            f"{datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')}\n"
+        )
+
+        email_message.attach(MIMEText(email_body, 'plain'))
+
+        return email_message
+
+    @staticmethod
+    def _format_submission(name: str, email: str, subject: str, message: str) -> str:
+        """Format the fields of one submission for an email body."""
+        return f"""Name: {name}
+Email: {email}
+Subject: {subject}
+
+Message:
+{message}
+"""
+
     def _send_message(self, email_message: MIMEMultipart) -> None:
         """
         Send email message via SMTP
@@ -160,8 +251,9 @@ Sent from portfolio contact form at {datetime.now(timezone.utc).strftime('%Y-%m-
             logger.debug(f"Connecting to SMTP server {self.smtp_server}:{self.smtp_port}")
             with smtplib.SMTP(self.smtp_server, self.smtp_port, timeout=10) as smtp_server_connection:
                 smtp_server_connection.ehlo()
-                smtp_server_connection.starttls()
-                smtp_server_connection.ehlo()
+                if self.smtp_starttls:
+                    smtp_server_connection.starttls()
+                    smtp_server_connection.ehlo()
                 smtp_server_connection.login(self.smtp_username, self.smtp_password)
                 smtp_server_connection.send_message(email_message)
             logger.debug("Email sent successfully via SMTP")
@@ -191,3 +283,88 @@ Sent from portfolio contact form at {datetime.now(timezone.utc).strftime('%Y-%m-
                 f"SMTP error: {str(smtp_error)}",
                 original_error=smtp_error
             )
+
+
+class AsyncEmailService(EmailService):
+    """Email service that can also perform SMTP I/O on the asyncio event loop"""
+
+    async def send_contact_form_email_async(
+        self,
+        name: str,
+        email: str,
+        subject: str,
+        message: str
+    ) -> bool:
+        """
+        Send contact form submission email without blocking a thread
+
+        Args:
+            name: Sender's name
+            email: Sender's email
+            subject: Email subject
+            message: Email message body
+
+        Returns:
+            True if email sent successfully
+
+        Raises:
+            EmailServiceError: If email sending fails
+        """
+        try:
+            logger.info(f"Sending contact form email from {name} ({email})")
+            email_message: MIMEMultipart = self._create_message(name, email, subject, message)
+            await self._send_message_async(email_message)
+            logger.info(f"Successfully sent contact form email from {name} ({email})")
+            return True
+
+        except EmailServiceError:
+            raise
+        except Exception as unexpected_error:
+            error_message: str = f"Unexpected error while sending email: {str(unexpected_error)}"
+            logger.error(f"Unexpected error sending email: {error_message}", exc_info=True)
+            raise EmailServiceError(error_message, original_error=unexpected_error)
+
+    async def _send_message_async(self, email_message: MIMEMultipart) -> None:
+        """
+        Send email message via SMTP on the event loop
+
+        Args:
+            email_message: MIMEMultipart message object
+
+        Raises:
+            ConfigurationError: If aiosmtplib is not installed
+            EmailServiceError: If sending fails
+        """
+        if aiosmtplib is None:
+            raise ConfigurationError("Async email requires the aiosmtplib package.")
+        try:
+            logger.debug(f"Connecting to SMTP server {self.smtp_server}:{self.smtp_port} (async)")
+            await aiosmtplib.send(
+                email_message,
+                hostname=self.smtp_server,
+                port=self.smtp_port,
+                username=self.smtp_username,
+                password=self.smtp_password,
+                start_tls=self.smtp_starttls,
+                timeout=10
+            )
+            logger.debug("Email sent successfully via SMTP (async)")
+
+        except aiosmtplib.SMTPAuthenticationError as auth_error:
+            logger.error(f"SMTP authentication failed for {self.smtp_username}")
+            raise EmailServiceError(
+                "SMTP authentication failed. Please check your credentials.",
+                original_error=auth_error
+            )
+        except (aiosmtplib.SMTPConnectError, aiosmtplib.SMTPTimeoutError, OSError) as connection_error:
+            logger.error(f"Failed to connect to SMTP server {self.smtp_server}:{self.smtp_port} - {str(connection_error)}")
+            raise EmailServiceError(
+                f"Failed to connect to SMTP server {self.smtp_server}:{self.smtp_port}",
+                original_error=connection_error
+            )
+        except aiosmtplib.SMTPException as smtp_error:
+            logger.error(f"SMTP error: {str(smtp_error)}")
+            raise EmailServiceError(
+                f"SMTP error: {str(smtp_error)}",
+                original_error=smtp_error
+            )
@@ -0,0 +1,172 @@
+"""
+Validation Service
+Cached email address validation for the contact form and the digest tooling
+
+With deliverability checks off, email_validator's result depends only on the
+address, so results (normalized address or error) are kept in a bounded
+per-process LRU keyed by the submitted address. Obviously malformed input is
+rejected by precompiled checks before the full parser (IDNA encoding, Unicode
+normalization) runs; those checks give the same messages email_validator
+would. Many addresses can be checked in one call, each distinct one once.
+"""
+
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from email_validator import validate_email, EmailNotValidError
+from app.config import Config
+from app.exceptions import ValidationError
+
+# Input only the full parser can judge: non-ASCII (IDN, Unicode), whitespace,
+# quoted local parts, display names and comments
+_FULL_PARSE_ONLY = re.compile(r'[^\x21-\x7e]|["<>()\\\[]')
+_SIMPLE_LOCAL_PART = re.compile(r"[A-Za-z0-9!#$%&'*+/=?^_`{|}~-]+(?:\.[A-Za-z0-9!#$%&'*+/=?^_`{|}~-]+)*\Z")
+# A domain label that is fine except for lacking a period ('--' may be Punycode, checked first)
+_DOTLESS_DOMAIN = re.compile(r'(?!.*--)[A-Za-z0-9](?:[A-Za-z0-9-]{0,61}[A-Za-z0-9])?\Z')
+
+
+@dataclass(frozen=True)
+class EmailCheck:
+    """Result of validating one email address"""
+    email: str
+    normalized: Optional[str]
+    error: Optional[str]
+
+    @property
+    def valid(self) -> bool:
+        return self.error is None
+
+
+def fast_reject(email: str) -> Optional[str]:
+    """
+    Return email_validator's error for obviously malformed input, or None.
+
+    None means the address needs the full parser (it may still be invalid).
+    """
+    if _FULL_PARSE_ONLY.search(email):
+        return None
+    if '@' not in email:
+        return 'An email address must have an @-sign.'
+    if email.startswith('@'):
+        return 'There must be something before the @-sign.'
+    local_part, _, domain = email.partition('@')
+    # email_validator reports problems in the local part first
+    if len(local_part) > 64 or not _SIMPLE_LOCAL_PART.match(local_part):
+        return None
+    if not domain:
+        return 'There must be something after the @-sign.'
+    if _DOTLESS_DOMAIN.match(domain):
+        return 'The part after the @-sign is not valid. It should have a period.'
+    return None
+
+
+class EmailValidationCache:
+    """Bounded LRU of email validation results, in front of email_validator"""
+
+    def __init__(self, max_entries: int) -> None:
+        """
+        Args:
+            max_entries: Bound on cached results (0 disables caching)
+        """
+        self.max_entries: int = max_entries
+        # address -> (normalized, error), least recently used first
+        self._results: 'OrderedDict[str, Tuple[Optional[str], Optional[str]]]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits: int = 0
+        self.misses: int = 0
+        self.fast_rejects: int = 0
+
+    def check(self, email: str) -> EmailCheck:
+        """Validate one address (as submitted, already stripped)."""
+        return self.check_many([email])[0]
+
+    def check_many(self, emails: Iterable[str]) -> List[EmailCheck]:
+        """
+        Validate many addresses, in order.
+
+        Each distinct address is looked up or validated once, and the
+        cache lock is taken once for all lookups and once for all inserts.
+        """
+        emails = list(emails)
+        results: Dict[str, Tuple[Optional[str], Optional[str]]] = {}
+        with self._lock:
+            for email in dict.fromkeys(emails):
+                cached = self._results.get(email)
+                if cached is not None:
+                    self._results.move_to_end(email)
+                    results[email] = cached
+            self.hits += len(results)
+
+        computed: Dict[str, Tuple[Optional[str], Optional[str]]] = {}
+        fast_rejects = 0
+        for email in dict.fromkeys(emails):
+            if email in results:
+                continue
+            error = fast_reject(email)
+            if error is not None:
+                fast_rejects += 1
+                computed[email] = (None, error)
+                continue
+            try:
+                computed[email] = (validate_email(email, check_deliverability=False).normalized, None)
+            except EmailNotValidError as validation_error:
+                computed[email] = (None, str(validation_error))
+
+        if computed:
+            with self._lock:
+                self.misses += len(computed)
+                self.fast_rejects += fast_rejects
+                if self.max_entries > 0:
+                    self._results.update(computed)
+                    while len(self._results) > self.max_entries:
+                        self._results.popitem(last=False)
+            results.update(computed)
+        return [EmailCheck(email, *results[email]) for email in emails]
+
+    def stats(self) -> Dict[str, Any]:
+        """Return cache counters (per process) and size."""
+        with self._lock:
+            return {
+                'entries': len(self._results),
+                'max_entries': self.max_entries,
+                'hits': self.hits,
+                'misses': self.misses,
+                'fast_rejects': self.fast_rejects,
+            }
+
+
+_cache: Optional[EmailValidationCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_email_validation_cache() -> EmailValidationCache:
+    """Return the process-wide validation cache, created on first use."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = EmailValidationCache(Config.EMAIL_VALIDATION_CACHE_SIZE)
+    return _cache
+
+
+def validate_email_address(email: str) -> str:
+    """
+    Validate and normalize one email address.
+
+    Returns:
+        The normalized address
+
+    Raises:
+        ValidationError: If the address is invalid
+    """
+    result = get_email_validation_cache().check(email)
+    if not result.valid:
+        raise ValidationError(f'Invalid email address: {result.error}', field='email')
+    return result.normalized
+
+
+def validate_emails(emails: Iterable[str]) -> List[EmailCheck]:
+    """Validate many addresses in one call (e.g. every sender in a digest), in order."""
+    return get_email_validation_cache().check_many(emails)
@@ -0,0 +1,125 @@
+"""
+Production Serving
+
+Runs the app under Gunicorn: pre-forked worker processes, each with a pool
+of threads (gthread workers), sized from the CPU count. The app is created
+once in the master (with PRELOAD_APP the caches are warmed and frozen there)
+and shared copy-on-write by the workers.
+
+    python run.py --production
+
+Signals (sent to the master process):
+    HUP     graceful reload: start fresh workers, let old ones finish requests
+    USR2    re-exec the master for a code upgrade (then TERM the old master)
+    TERM    graceful shutdown within SERVER_GRACEFUL_TIMEOUT
+"""
+
+import math
+import os
+from typing import Any, Callable, Dict, Optional
+from flask import Flask
+from app.exceptions import ConfigurationError
+from app.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Target in-flight requests per CPU core. Page and API requests are served
+# from pre-encoded caches in microseconds, so threads are mostly there to
+# absorb the contact path, which waits on SMTP for up to its 10s timeout.
+CONCURRENCY_PER_CORE = 8
+
+
+def default_workers(cores: int) -> int:
+    """Worker processes for a core count (2 * cores + 1, the usual Gunicorn sizing)."""
+    return 2 * max(cores, 1) + 1
+
+
+def default_threads(cores: int, workers: int) -> int:
+    """Threads per worker so the server holds CONCURRENCY_PER_CORE requests per core."""
+    return max(2, math.ceil(CONCURRENCY_PER_CORE * max(cores, 1) / max(workers, 1)))
+
+
+def available_cores() -> int:
+    """Return the CPUs this process may run on (respects affinity/cgroup cpusets)."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:  # not available on macOS/Windows
+        return os.cpu_count() or 1
+
+
+def serving_options(environ: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+    """
+    Build Gunicorn settings from the environment.
+
+    WEB_CONCURRENCY and SERVER_THREADS override the core-based sizing.
+
+    Args:
+        environ: Environment mapping (defaults to os.environ)
+
+    Returns:
+        Dictionary of Gunicorn settings
+    """
+    env = os.environ if environ is None else environ
+    cores = available_cores()
+    workers = int(env.get('WEB_CONCURRENCY') or default_workers(cores))
+    threads = int(env.get('SERVER_THREADS') or default_threads(cores, workers))
+    host = env.get('FLASK_RUN_HOST', '0.0.0.0')
+    port = env.get('FLASK_RUN_PORT', '8000')
+
+    return {
+        'bind': f"{host}:{port}",
+        'workers': workers,
+        'threads': threads,
+        'worker_class': 'gthread',
+        # Build the app once in the master so workers share it copy-on-write
+        'preload_app': True,
+        # Keep idle client connections open a little longer than a typical
+        # proxy/browser pause between requests (the page loads several assets)
+        'keepalive': int(env.get('SERVER_KEEPALIVE', '5')),
+        # Recycle workers periodically to bound slow memory growth; the jitter
+        # keeps all workers from restarting at the same moment
+        'max_requests': int(env.get('SERVER_MAX_REQUESTS', '1000')),
+        'max_requests_jitter': int(env.get('SERVER_MAX_REQUESTS_JITTER', '100')),
+        # Above the SMTP timeout, so a slow relay does not get a worker killed
+        'timeout': int(env.get('SERVER_TIMEOUT', '30')),
+        'graceful_timeout': int(env.get('SERVER_GRACEFUL_TIMEOUT', '30')),
+        'accesslog': env.get('SERVER_ACCESS_LOG') or None,
+    }
+
+
+def serve(app_factory: Callable[[], Flask], options: Optional[Dict[str, Any]] = None) -> None:
+    """
+    Run the app under Gunicorn (blocks until the server shuts down).
+
+    Args:
+        app_factory: Callable returning the Flask app (called once, in the master)
+        options: Gunicorn settings (defaults to serving_options())
+
+    Raises:
+        ConfigurationError: If Gunicorn is not installed (it does not run on Windows)
+    """
+    try:
+        from gunicorn.app.base import BaseApplication
+    except ImportError as import_error:
+        raise ConfigurationError(
+            "Production serving requires the gunicorn package (pip install gunicorn)."
+        ) from import_error
+
+    settings = serving_options() if options is None else options
+
+    class PortfolioServer(BaseApplication):
+        """Gunicorn application configured from settings rather than a config file"""
+
+        def load_config(self) -> None:
+            for key, value in settings.items():
+                if value is not None:
+                    self.cfg.set(key, value)
+
+        def load(self) -> Flask:
+            return app_factory()
+
+    logger.info(
+        f"Starting production server on {settings['bind']} with {settings['workers']} workers "
+        f"x {settings['threads']} threads"
+    )
+    PortfolioServer().run()
@@ -0,0 +1,62 @@
+"""
+Template Compilation Cache
+
+Persists compiled Jinja templates as bytecode on disk, so a fresh worker
+loads them instead of parsing and compiling the template sources on its
+first render. The cache can be filled ahead of time with
+`python scripts/precompile_templates.py` (e.g. as a deploy build step).
+"""
+
+import os
+from typing import List
+from flask import Flask
+from jinja2 import FileSystemBytecodeCache
+from app.exceptions import ConfigurationError
+from app.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Bytecode files are named __jinja2_<hash>.cache inside the cache directory
+CACHE_FILE_PATTERN = '__jinja2_%s.cache'
+
+
+def configure_bytecode_cache(app: Flask) -> bool:
+    """
+    Attach a filesystem bytecode cache to the app's Jinja environment.
+
+    Uses TEMPLATE_CACHE_DIR (empty disables it). Entries are validated
+    against the template source checksum, so edited templates are recompiled.
+
+    Returns:
+        True if the cache is enabled
+    """
+    cache_dir = app.config.get('TEMPLATE_CACHE_DIR')
+    if not cache_dir:
+        return False
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+    except OSError as cache_error:
+        logger.warning(f"Template bytecode cache disabled, cannot create {cache_dir}: {cache_error}")
+        return False
+    app.jinja_env.bytecode_cache = FileSystemBytecodeCache(cache_dir, CACHE_FILE_PATTERN)
+    return True
+
+
+def precompile_templates(app: Flask) -> List[str]:
+    """
+    Compile every template into the bytecode cache.
+
+    Returns:
+        Names of the compiled templates
+
+    Raises:
+        ConfigurationError: If the bytecode cache is not enabled
+    """
+    if app.jinja_env.bytecode_cache is None:
+        raise ConfigurationError("Set TEMPLATE_CACHE_DIR to precompile templates.")
+    names = app.jinja_env.list_templates()
+    for name in names:
+        # Loading through the environment compiles the source and stores the bytecode
+        app.jinja_env.get_template(name)
+    logger.info(f"Precompiled {len(names)} templates into {app.config['TEMPLATE_CACHE_DIR']}")
+    return names
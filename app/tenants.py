@@ -0,0 +1,275 @@
+"""
+Multi-Tenant Serving
+
+Serve many portfolios from one process. Each tenant is a directory under
+TENANTS_DIR:
+
+    <TENANTS_DIR>/<slug>/
+        tenant.json       # {"hosts": ["jane.example.com"], "config": {"RECIPIENT_EMAIL": "..."}}
+        portfolio.json    # {"projects": [...], "skills": [...], "experience": [...], ...}
+        templates/        # optional overrides, e.g. index.html, partials/projects.html
+
+Requests are mapped to a tenant by Host header or by a /t/<slug>/ path
+prefix; anything else is served by the built-in portfolio.
+"""
+
+import json
+import os
+import re
+import threading
+from collections import ChainMap
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+from flask import Flask, current_app, has_request_context, request
+from jinja2 import BaseLoader, ChoiceLoader, Environment, TemplateNotFound
+from app.exceptions import ConfigurationError
+from app.logger import get_logger
+from app.models.models import (
+    Project, ProjectLink, SkillCategory, ExperienceItem,
+    EducationItem, Certification
+)
+from app.models.serializers import Serializers
+
+logger = get_logger(__name__)
+
+# WSGI environ key holding the Tenant resolved for the request
+TENANT_ENVIRON_KEY = 'portfolio.tenant'
+
+# Path prefix for slug-based routing: /t/<slug>/...
+TENANT_PATH_PREFIX = '/t/'
+
+_SLUG_PATTERN = re.compile(r'^[a-z0-9][a-z0-9_-]{0,63}$')
+
+
+@dataclass
+class Tenant:
+    """Tenant model"""
+    slug: str
+    path: str
+    hosts: List[str] = field(default_factory=list)
+    config: Dict[str, Any] = field(default_factory=dict)
+
+    def load_resources(self) -> Dict[str, Any]:
+        """
+        Load and normalize the tenant's portfolio data.
+
+        Records go through the portfolio models and serializers, so tenant
+        data is served in exactly the same shape as the built-in portfolio.
+
+        Raises:
+            ConfigurationError: If portfolio.json is missing or malformed
+        """
+        data_file = os.path.join(self.path, 'portfolio.json')
+        try:
+            with open(data_file, encoding='utf-8') as handle:
+                raw: Dict[str, Any] = json.load(handle)
+            return {
+                'projects': [
+                    Serializers.project_to_dict(Project(**{
+                        **item, 'links': [ProjectLink(**link) for link in item.get('links', [])]
+                    }))
+                    for item in raw.get('projects', [])
+                ],
+                'skills': [Serializers.skill_category_to_dict(SkillCategory(**item)) for item in raw.get('skills', [])],
+                'experience': [Serializers.experience_to_dict(ExperienceItem(**item)) for item in raw.get('experience', [])],
+                'education': [Serializers.education_to_dict(EducationItem(**item)) for item in raw.get('education', [])],
+                'certifications': [
+                    Serializers.certification_to_dict(Certification(**item)) for item in raw.get('certifications', [])
+                ],
+            }
+        except (OSError, ValueError, TypeError) as load_error:
+            raise ConfigurationError(f"Invalid portfolio data for tenant {self.slug!r}: {load_error}") from load_error
+
+    def modified_at(self) -> float:
+        """Return the modification time of portfolio.json (0.0 if it cannot be read)."""
+        try:
+            return os.path.getmtime(os.path.join(self.path, 'portfolio.json'))
+        except OSError:
+            return 0.0
+
+    def template_path(self, name: str) -> str:
+        """Return the filesystem path of a tenant template override."""
+        return os.path.join(self.path, 'templates', *name.split('/'))
+
+
+class TenantRegistry:
+    """Discovers tenants under a directory and resolves them by slug or host"""
+
+    def __init__(self, root: str) -> None:
+        """
+        Args:
+            root: Directory containing one sub-directory per tenant
+        """
+        self.root: str = root
+        self._tenants: Dict[str, Tenant] = {}
+        self._hosts: Optional[Dict[str, str]] = None
+        self._lock = threading.Lock()
+
+    def get(self, slug: str) -> Optional[Tenant]:
+        """Return the tenant with this slug, or None if there is none."""
+        if slug in self._tenants:
+            return self._tenants[slug]
+        tenant = self._load(slug) if _SLUG_PATTERN.match(slug) else None
+        if tenant is not None:
+            # Only hits are remembered, so probing random slugs cannot grow the registry
+            with self._lock:
+                self._tenants[slug] = tenant
+        return tenant
+
+    def for_host(self, host: str) -> Optional[Tenant]:
+        """Return the tenant serving a Host header value, or None."""
+        hosts = self._hosts
+        if hosts is None:
+            hosts = self.build_host_index()
+        slug = hosts.get(host.split(':', 1)[0].lower())
+        return self.get(slug) if slug else None
+
+    def build_host_index(self) -> Dict[str, str]:
+        """Scan every tenant.json once and index tenants by host name."""
+        hosts: Dict[str, str] = {}
+        for slug in self._slugs():
+            tenant = self.get(slug)
+            for host in tenant.hosts if tenant else []:
+                hosts[host.lower()] = slug
+        self._hosts = hosts
+        logger.info(f"Indexed {len(hosts)} tenant host names under {self.root}")
+        return hosts
+
+    def _slugs(self) -> Iterable[str]:
+        try:
+            with os.scandir(self.root) as entries:
+                return [entry.name for entry in entries if entry.is_dir() and _SLUG_PATTERN.match(entry.name)]
+        except OSError as scan_error:
+            logger.error(f"Cannot list tenants in {self.root}: {scan_error}")
+            return []
+
+    def _load(self, slug: str) -> Optional[Tenant]:
+        path = os.path.join(self.root, slug)
+        if not os.path.isfile(os.path.join(path, 'portfolio.json')):
+            return None
+        settings: Dict[str, Any] = {}
+        try:
+            with open(os.path.join(path, 'tenant.json'), encoding='utf-8') as handle:
+                settings = json.load(handle)
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as settings_error:
+            logger.error(f"Ignoring unreadable tenant.json for {slug!r}: {settings_error}")
+        return Tenant(
+            slug=slug,
+            path=path,
+            hosts=list(settings.get('hosts', [])),
+            config=dict(settings.get('config', {})),
+        )
+
+
+def resolve_tenant(
+    registry: TenantRegistry, path: str, host: str
+) -> Tuple[Optional[Tenant], str]:
+    """
+    Resolve the tenant a request addresses: by /t/<slug>/ path prefix, else by host.
+
+    Shared by the WSGI middleware and the ASGI contact handler.
+
+    Returns:
+        The tenant (None for the built-in portfolio) and the path with the
+        tenant prefix removed
+    """
+    if path.startswith(TENANT_PATH_PREFIX):
+        slug, _, rest = path[len(TENANT_PATH_PREFIX):].partition('/')
+        tenant = registry.get(slug)
+        if tenant is not None:
+            return tenant, '/' + rest
+    return registry.for_host(host), path
+
+
+def config_for_tenant(tenant: Optional[Tenant], app_config: Mapping[str, Any]) -> Mapping[str, Any]:
+    """Return the app config with a tenant's overrides applied."""
+    if tenant is None or not tenant.config:
+        return app_config
+    return ChainMap(tenant.config, app_config)
+
+
+class TenantMiddleware:
+    """WSGI middleware that resolves the tenant of each request"""
+
+    def __init__(self, wsgi_app: Callable[..., Any], registry: TenantRegistry) -> None:
+        self.wsgi_app = wsgi_app
+        self.registry: TenantRegistry = registry
+
+    def __call__(self, environ: Dict[str, Any], start_response: Callable[..., Any]) -> Any:
+        path: str = environ.get('PATH_INFO', '')
+        tenant, tenant_path = resolve_tenant(self.registry, path, environ.get('HTTP_HOST', ''))
+        if tenant_path != path:
+            # Move the prefix into SCRIPT_NAME so url_for() keeps generating tenant URLs
+            environ['SCRIPT_NAME'] = environ.get('SCRIPT_NAME', '') + TENANT_PATH_PREFIX + tenant.slug
+            environ['PATH_INFO'] = tenant_path
+        environ[TENANT_ENVIRON_KEY] = tenant
+        return self.wsgi_app(environ, start_response)
+
+
+class TenantTemplateLoader(BaseLoader):
+    """Jinja loader for tenant overrides, addressed as '@<slug>/<template>'"""
+
+    def __init__(self, registry: TenantRegistry) -> None:
+        self.registry: TenantRegistry = registry
+
+    def get_source(self, environment: Environment, template: str) -> Tuple[str, str, Callable[[], bool]]:
+        if not template.startswith('@'):
+            raise TemplateNotFound(template)
+        slug, _, name = template[1:].partition('/')
+        tenant = self.registry.get(slug)
+        if tenant is None or '..' in name.split('/'):
+            raise TemplateNotFound(template)
+        filename = tenant.template_path(name)
+        try:
+            with open(filename, encoding='utf-8') as handle:
+                source = handle.read()
+        except OSError:
+            raise TemplateNotFound(template)
+        mtime = os.path.getmtime(filename)
+        return source, filename, lambda: os.path.exists(filename) and os.path.getmtime(filename) == mtime
+
+    def list_templates(self) -> List[str]:
+        # Overrides are resolved on demand; enumerating every tenant would not scale
+        return []
+
+
+def current_tenant() -> Optional[Tenant]:
+    """Return the tenant of the current request, or None for the built-in portfolio."""
+    if not has_request_context():
+        return None
+    return request.environ.get(TENANT_ENVIRON_KEY)
+
+
+def tenant_templates(name: str) -> List[str]:
+    """Return template candidates for the current tenant, override first."""
+    tenant = current_tenant()
+    return [f'@{tenant.slug}/{name}', name] if tenant is not None else [name]
+
+
+def tenant_config() -> Mapping[str, Any]:
+    """Return the app config with the current tenant's overrides applied."""
+    return config_for_tenant(current_tenant(), current_app.config)
+
+
+def init_tenants(app: Flask) -> Optional[TenantRegistry]:
+    """
+    Enable multi-tenant serving when TENANTS_DIR is configured.
+
+    Installs the tenant-resolving WSGI middleware and the template loader for
+    tenant overrides, and builds the host index up front.
+
+    Returns:
+        The tenant registry, or None when multi-tenancy is disabled
+    """
+    tenants_dir = app.config.get('TENANTS_DIR')
+    if not tenants_dir:
+        return None
+
+    registry = TenantRegistry(os.path.abspath(tenants_dir))
+    registry.build_host_index()
+    app.wsgi_app = TenantMiddleware(app.wsgi_app, registry)
+    app.jinja_env.loader = ChoiceLoader([app.jinja_env.loader, TenantTemplateLoader(registry)])
+    app.extensions['tenant_registry'] = registry
+    return registry
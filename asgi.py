@@ -0,0 +1,18 @@
+"""
+Portfolio Website - ASGI Entry Point
+
+Serves the application under an ASGI server, with contact form submissions
+handled asynchronously:
+
+    uvicorn asgi:app --host 0.0.0.0 --port 8000 --workers 4
+"""
+
+from dotenv import load_dotenv
+
+load_dotenv()  # Load environment variables from .env
+
+from app import create_app
+from app.asgi import create_asgi_app
+
+# Initialize the ASGI application around the Flask app
+app = create_asgi_app(create_app())
@@ -2,9 +2,13 @@
 Portfolio Website - Main Application File
 
 This module contains the Flask application setup and routing for the portfolio website.
+
+    python run.py                 # development server (Werkzeug)
+    python run.py --production    # Gunicorn, multi-process and multi-threaded
 """
 
 import os
+import sys
 
 from dotenv import load_dotenv
 
@@ -16,6 +20,13 @@ from app import create_app
 app = create_app()
 
 if __name__ == "__main__":
+    if "--production" in sys.argv[1:]:
+        from app.serving import serve
+
+        # The app above was created (and preloaded) in this master process
+        serve(lambda: app)
+        sys.exit(0)
+
     debug = os.getenv("FLASK_DEBUG", "0") == "1" or (
         os.getenv("FLASK_ENV", "production").lower() == "development"
     )
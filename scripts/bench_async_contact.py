@@ -0,0 +1,172 @@
+"""
+Async Contact Benchmark
+
+Starts a local SMTP stand-in that answers every DATA command after a fixed
+delay (simulating a slow relay), then fires N concurrent contact form
+submissions at the ASGI app and, for comparison, at the sync Flask view
+through a thread pool. Reports wall time, peak thread count and how many
+messages the stand-in received.
+
+Usage:
+    python scripts/bench_async_contact.py [--submissions N] [--smtp-delay S] [--threads N]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlencode
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+FORM = urlencode({
+    'name': 'Load Test',
+    'email': 'load.test@example.com',
+    'subject': 'Benchmark',
+    'message': 'Hello from the async contact benchmark.',
+}).encode('ascii')
+
+
+class SMTPStandIn:
+    """Minimal SMTP server accepting any login and counting delivered messages"""
+
+    def __init__(self, delay: float) -> None:
+        self.delay = delay
+        self.delivered = 0
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        writer.write(b'220 localhost stand-in ready\r\n')
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+            command = line[:4].upper()
+            if command == b'EHLO':
+                writer.write(b'250-localhost\r\n250 AUTH PLAIN LOGIN\r\n')
+            elif command == b'AUTH':
+                writer.write(b'235 Authentication successful\r\n')
+            elif command == b'DATA':
+                writer.write(b'354 End data with <CR><LF>.<CR><LF>\r\n')
+                await writer.drain()
+                await reader.readuntil(b'\r\n.\r\n')
+                await asyncio.sleep(self.delay)
+                self.delivered += 1
+                writer.write(b'250 Queued\r\n')
+            elif command == b'QUIT':
+                writer.write(b'221 Bye\r\n')
+                await writer.drain()
+                break
+            else:
+                writer.write(b'250 OK\r\n')
+            await writer.drain()
+        writer.close()
+
+
+def _serve_smtp(stand_in: SMTPStandIn, ready: threading.Event, port_holder: list) -> None:
+    """Run the SMTP stand-in on its own event loop (shared by both modes)."""
+    loop = asyncio.new_event_loop()
+    server = loop.run_until_complete(asyncio.start_server(stand_in.handle, '127.0.0.1', 0))
+    port_holder.append(server.sockets[0].getsockname()[1])
+    ready.set()
+    loop.run_forever()
+
+
+async def _asgi_post(app, path: str) -> int:
+    """Send one form POST straight to the ASGI app and return the status code."""
+    scope = {
+        'type': 'http', 'asgi': {'version': '3.0'}, 'http_version': '1.1',
+        'method': 'POST', 'scheme': 'http', 'path': path, 'raw_path': path.encode(),
+        'query_string': b'', 'root_path': '', 'client': ('127.0.0.1', 50000),
+        'server': ('127.0.0.1', 8000),
+        'headers': [
+            (b'host', b'localhost'),
+            (b'content-type', b'application/x-www-form-urlencoded'),
+            (b'content-length', str(len(FORM)).encode()),
+        ],
+    }
+    sent = False
+    status = 0
+
+    async def receive():
+        nonlocal sent
+        if sent:
+            await asyncio.sleep(3600)
+        sent = True
+        return {'type': 'http.request', 'body': FORM, 'more_body': False}
+
+    async def send(message):
+        nonlocal status
+        if message['type'] == 'http.response.start':
+            status = message['status']
+
+    await app(scope, receive, send)
+    return status
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--submissions', type=int, default=200)
+    parser.add_argument('--smtp-delay', type=float, default=0.5, help='seconds the stand-in takes per message')
+    parser.add_argument('--threads', type=int, default=8, help='thread pool size for the sync comparison')
+    args = parser.parse_args()
+
+    stand_in = SMTPStandIn(args.smtp_delay)
+    ready, port_holder = threading.Event(), []
+    threading.Thread(target=_serve_smtp, args=(stand_in, ready, port_holder), daemon=True).start()
+    ready.wait()
+
+    sys.path.insert(0, PROJECT_ROOT)
+    os.environ.update(
+        SMTP_SERVER='127.0.0.1',
+        SMTP_PORT=str(port_holder[0]),
+        SMTP_USERNAME='bench',
+        SMTP_PASSWORD='bench',
+        SMTP_STARTTLS='false',
+        RECIPIENT_EMAIL='owner@example.com',
+        RATE_LIMIT_DEFAULTS='1000000 per minute',
+        # Every post is the same payload: with the dedupe window on, all but
+        # the first would be suppressed, and queued digests would not be sent
+        DEDUPE_WINDOW_SECONDS='0',
+        DIGEST_MODE='false',
+    )
+    from app import create_app
+    from app.asgi import create_asgi_app
+
+    flask_app = create_app()
+    asgi_app = create_asgi_app(flask_app)
+
+    async def run_async():
+        peak = threading.active_count()
+        tasks = [asyncio.ensure_future(_asgi_post(asgi_app, '/contact')) for _ in range(args.submissions)]
+        while not all(task.done() for task in tasks):
+            peak = max(peak, threading.active_count())
+            await asyncio.sleep(0.01)
+        return [task.result() for task in tasks], peak
+
+    started = time.perf_counter()
+    statuses, async_peak = asyncio.run(run_async())
+    async_elapsed = time.perf_counter() - started
+    async_delivered = stand_in.delivered
+    async_ok = statuses.count(200)
+
+    client = flask_app.test_client()
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.threads) as pool:
+        responses = list(pool.map(
+            lambda _: client.post('/contact', data=FORM, content_type='application/x-www-form-urlencoded').status_code,
+            range(args.submissions)
+        ))
+        sync_peak = threading.active_count()
+    sync_elapsed = time.perf_counter() - started
+
+    print(f"submissions         {args.submissions} (stand-in SMTP delay {args.smtp_delay:.2f}s)")
+    print(f"async (ASGI)        {async_elapsed:.2f}s, {async_ok} OK, {async_delivered} delivered, peak threads {async_peak}")
+    print(f"sync ({args.threads} threads)    {sync_elapsed:.2f}s, {responses.count(200)} OK, "
+          f"{stand_in.delivered - async_delivered} delivered, peak threads {sync_peak}")
+
+
+if __name__ == '__main__':
+    main()
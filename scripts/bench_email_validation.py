@@ -0,0 +1,105 @@
+"""
+Email Validation Benchmark
+
+Compares validating contact form addresses with a fresh email_validator call
+per submission (the previous behaviour) against the cached validation layer,
+one call per submission and in bulk. The workload repeats a pool of ASCII,
+internationalized and malformed addresses, like real traffic and bot replays.
+
+Usage:
+    python scripts/bench_email_validation.py [--submissions N] [--distinct N] [--repeat N]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Address shapes: (weight, factory taking an index)
+SHAPES = (
+    (6, lambda index: f'visitor{index}@example.com'),
+    (2, lambda index: f'Visitor.{index}@Example.ORG'),
+    (1, lambda index: f'josé{index}@bücher-{index}.de'),
+    (1, lambda index: f'user{index}@例え{index}.jp'),
+    (1, lambda index: f'no-at-sign-{index}.example.com'),
+    (1, lambda index: f'user{index}@localhost{index}'),
+    (1, lambda index: f'user {index}@example.com'),
+)
+
+
+def make_workload(submissions: int, distinct: int, seed: int = 7):
+    """Return `submissions` addresses drawn from `distinct` addresses of mixed shapes."""
+    rng = random.Random(seed)
+    factories = [factory for weight, factory in SHAPES for _ in range(weight)]
+    pool = [rng.choice(factories)(index) for index in range(distinct)]
+    return [rng.choice(pool) for _ in range(submissions)]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--submissions', type=int, default=20000)
+    parser.add_argument('--distinct', type=int, default=500)
+    parser.add_argument('--cache-size', type=int, default=10000)
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per variant; the fastest is reported')
+    args = parser.parse_args()
+
+    sys.path.insert(0, PROJECT_ROOT)
+    from email_validator import EmailNotValidError, validate_email
+    from app.services.validation_service import EmailValidationCache
+
+    workload = make_workload(args.submissions, args.distinct)
+
+    def per_call_uncached():
+        results = []
+        for email in workload:
+            try:
+                results.append(validate_email(email, check_deliverability=False).normalized)
+            except EmailNotValidError as validation_error:
+                results.append(str(validation_error))
+        return results
+
+    def per_call_cached(cache):
+        return [check.normalized or check.error for check in map(cache.check, workload)]
+
+    def bulk(cache):
+        return [check.normalized or check.error for check in cache.check_many(workload)]
+
+    runs = [
+        ('email_validator per call', per_call_uncached),
+        ('cache, cold, per call', lambda: per_call_cached(EmailValidationCache(args.cache_size))),
+        ('cache, no LRU, per call', lambda: per_call_cached(EmailValidationCache(0))),
+        ('cache, cold, bulk', lambda: bulk(EmailValidationCache(args.cache_size))),
+    ]
+    warm = EmailValidationCache(args.cache_size)
+    warm.check_many(workload)
+    fill = warm.stats()
+    runs += [
+        ('cache, warm, per call', lambda: per_call_cached(warm)),
+        ('cache, warm, bulk', lambda: bulk(warm)),
+    ]
+
+    print(f"{len(workload)} submissions, {len(set(workload))} distinct addresses")
+    print(f"{'variant':<28}{'total ms':>10}{'us/address':>12}{'speedup':>9}")
+    baseline = None
+    expected = None
+    for label, run in runs:
+        elapsed = float('inf')
+        for _ in range(args.repeat):
+            started = time.perf_counter()
+            results = run()
+            elapsed = min(elapsed, time.perf_counter() - started)
+        if expected is None:
+            baseline, expected = elapsed, results
+        elif results != expected:
+            raise SystemExit(f'{label}: results differ from email_validator')
+        print(f"{label:<28}{elapsed * 1000:>10.1f}{elapsed / len(workload) * 1e6:>12.2f}{baseline / elapsed:>8.1f}x")
+
+    print(f"\nCold fill: {fill['misses']} validations ({fill['fast_rejects']} fast rejects), "
+          f"{fill['entries']} cached of max {fill['max_entries']}")
+
+
+if __name__ == '__main__':
+    main()
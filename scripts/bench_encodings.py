@@ -0,0 +1,53 @@
+"""
+Encoding Benchmark
+
+Compares payload size and client-side parse time of the JSON, MessagePack
+and CBOR variants of every API resource in the data snapshot.
+
+Usage:
+    python scripts/bench_encodings.py [--repeat N]
+"""
+
+import argparse
+import json
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.data.encoding import CBOR_MEDIA_TYPE, JSON_MEDIA_TYPE, MSGPACK_MEDIA_TYPE, cbor2, msgpack  # noqa: E402
+from app.data.snapshot import DataSnapshot  # noqa: E402
+
+
+def _decoders():
+    """Return (label, media type, decoder) for every available format."""
+    decoders = [('json', JSON_MEDIA_TYPE, json.loads)]
+    if msgpack is not None:
+        decoders.append(('msgpack', MSGPACK_MEDIA_TYPE, lambda data: msgpack.unpackb(data, raw=False)))
+    if cbor2 is not None:
+        decoders.append(('cbor', CBOR_MEDIA_TYPE, cbor2.loads))
+    return decoders
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=20000)
+    args = parser.parse_args()
+
+    snapshot = DataSnapshot()
+    decoders = _decoders()
+    print(f"{'resource':<16}{'format':<10}{'bytes':>8}{'vs json':>9}{'parse us':>10}")
+    for key in snapshot.resources:
+        json_size = len(snapshot.payload(key, JSON_MEDIA_TYPE))
+        for label, media_type, decode in decoders:
+            payload = snapshot.payload(key, media_type)
+            seconds = timeit.timeit(lambda: decode(payload), number=args.repeat)
+            print(
+                f"{key:<16}{label:<10}{len(payload):>8}{len(payload) / json_size:>8.0%}"
+                f"{seconds / args.repeat * 1e6:>10.2f}"
+            )
+
+
+if __name__ == '__main__':
+    main()
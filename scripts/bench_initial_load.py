@@ -0,0 +1,86 @@
+"""
+Initial Load Benchmark
+
+Compares requests and bytes needed to paint the homepage when every section
+is fetched up front (the six /api/* JSON calls the page used to make on
+DOMContentLoaded) against lazy loading, where only the section fragments
+within the first viewport are requested.
+
+Each scenario loads the page twice, as a repeat visit within the rate limit
+window would (the second time revalidating with If-None-Match), against a
+fresh app using the configured rate limits. Any response other than 200/304
+is reported and fails the run.
+
+Usage:
+    python scripts/bench_initial_load.py [--visible N]
+"""
+
+import argparse
+import gzip
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import create_app  # noqa: E402
+from app.routes.fragments import SECTIONS  # noqa: E402
+
+PAGE_ASSETS = ('/', '/static/css/style.css', '/static/js/script.js')
+EAGER_API_CALLS = tuple(f'/api/{name}' for name in (*SECTIONS, 'stats'))
+
+
+def _measure(client, paths, etags):
+    """
+    Return (requests, raw bytes, gzip bytes, failed paths) to fetch every path.
+
+    Paths with a remembered ETag are revalidated with If-None-Match; new
+    ETags are remembered.
+    """
+    raw = compressed = 0
+    failed = []
+    for path in paths:
+        headers = {'If-None-Match': etags[path]} if path in etags else {}
+        response = client.get(path, headers=headers)
+        if response.status_code not in (200, 304):
+            failed.append(f'{path} -> {response.status_code}')
+        if response.headers.get('ETag'):
+            etags[path] = response.headers['ETag']
+        body = response.get_data()
+        raw += len(body)
+        compressed += len(gzip.compress(body))
+    return len(paths), raw, compressed, failed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        '--visible', type=int, default=0,
+        help='sections within the first viewport (plus preload margin) on page load',
+    )
+    args = parser.parse_args()
+
+    scenarios = (
+        ('eager api (all sections)', PAGE_ASSETS + EAGER_API_CALLS),
+        ('lazy fragments (initial)', PAGE_ASSETS + tuple(f'/fragments/{name}' for name in SECTIONS[:args.visible])),
+        ('lazy fragments (scrolled)', PAGE_ASSETS + tuple(f'/fragments/{name}' for name in SECTIONS)),
+    )
+    print(f"{'scenario':<28}{'view':>7}{'requests':>9}{'bytes':>9}{'gzip bytes':>12}")
+    failures = []
+    for label, paths in scenarios:
+        # A fresh app per scenario, so each starts with the full rate limit budget
+        client = create_app().test_client()
+        etags = {}
+        for view in ('first', 'repeat'):
+            requests, raw, compressed, failed = _measure(client, paths, etags)
+            print(f"{label:<28}{view:>7}{requests:>9}{raw:>9}{compressed:>12}")
+            failures.extend(f'{label} ({view} view): {path}' for path in failed)
+
+    if failures:
+        print('\nFailed requests:')
+        for failure in failures:
+            print(f'  {failure}')
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
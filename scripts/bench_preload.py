@@ -0,0 +1,108 @@
+"""
+Preload Benchmark
+
+Forks workers from a master that did (or did not) preload the app, the way
+gunicorn --preload does, and reports per-worker time-to-first-request, RSS
+and private (un-shared) memory.
+
+Usage:
+    python scripts/bench_preload.py [--workers N]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FIRST_REQUEST_PATHS = ('/', '/api/projects', '/api/skills', '/api/stats')
+
+
+def _private_bytes() -> int:
+    """Return private (dirty + clean) memory of this process in bytes, or -1."""
+    try:
+        total = 0
+        with open('/proc/self/smaps_rollup') as smaps:
+            for line in smaps:
+                if line.startswith(('Private_Clean:', 'Private_Dirty:')):
+                    total += int(line.split()[1]) * 1024
+        return total
+    except OSError:
+        return -1
+
+
+def _run_worker(app, write_fd: int) -> None:
+    """Serve the first requests in a forked worker and report measurements."""
+    from app.preload import get_rss_bytes
+
+    client = app.test_client()
+    started = time.perf_counter()
+    for path in FIRST_REQUEST_PATHS:
+        client.get(path)
+    first_ms = (time.perf_counter() - started) * 1000
+
+    started = time.perf_counter()
+    for path in FIRST_REQUEST_PATHS:
+        client.get(path)
+    warm_ms = (time.perf_counter() - started) * 1000
+
+    result = {
+        'first_ms': first_ms,
+        'warm_ms': warm_ms,
+        'rss': get_rss_bytes() or -1,
+        'private': _private_bytes(),
+    }
+    os.write(write_fd, (json.dumps(result) + '\n').encode())
+    os._exit(0)
+
+
+def _run_mode(workers: int) -> None:
+    """Child entry point: create the app, fork workers, print their results."""
+    sys.path.insert(0, PROJECT_ROOT)
+    from app import create_app
+
+    app = create_app()
+    read_fd, write_fd = os.pipe()
+    for _ in range(workers):
+        if os.fork() == 0:
+            os.close(read_fd)
+            _run_worker(app, write_fd)
+    os.close(write_fd)
+    for _ in range(workers):
+        os.wait()
+    with os.fdopen(read_fd) as results:
+        sys.stdout.write(results.read())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--child', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        _run_mode(args.workers)
+        return
+
+    print(f"{'mode':<12}{'first req ms':>14}{'warm req ms':>13}{'RSS MB':>10}{'private MB':>12}")
+    for label, preload in (('no preload', 'false'), ('preload', 'true')):
+        env = dict(os.environ, PRELOAD_APP=preload, FLASK_ENV='development')
+        output = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), '--child', '--workers', str(args.workers)],
+            env=env, cwd=PROJECT_ROOT, capture_output=True, text=True, check=True,
+        ).stdout
+        rows = [json.loads(line) for line in output.splitlines() if line.strip()]
+
+        def mean(key: str) -> float:
+            return sum(row[key] for row in rows) / len(rows)
+
+        print(
+            f"{label:<12}{mean('first_ms'):>14.2f}{mean('warm_ms'):>13.2f}"
+            f"{mean('rss') / 2**20:>10.1f}{mean('private') / 2**20:>12.2f}"
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,121 @@
+"""
+Serving Benchmark
+
+Starts the app with the Werkzeug dev server (python run.py) and with the
+production server (python run.py --production), drives each with the same
+concurrent keep-alive load over a mix of page, fragment and API requests,
+and reports throughput and latency percentiles.
+
+Usage:
+    python scripts/bench_serving.py [--clients N] [--seconds S]
+"""
+
+import argparse
+import http.client
+import os
+import random
+import socket
+import subprocess
+import sys
+import threading
+import time
+from typing import Dict, List
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PATHS = ['/', '/api/projects', '/api/skills', '/fragments/projects', '/fragments/experience', '/health']
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def _wait_for(port: int, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with socket.create_connection(('127.0.0.1', port), timeout=0.5):
+                return
+        except OSError:
+            time.sleep(0.1)
+    raise RuntimeError(f"server on port {port} did not start")
+
+
+def _client(port: int, stop_at: float, latencies: List[float], errors: List[int]) -> None:
+    """Issue requests over one keep-alive connection until stop_at."""
+    connection = http.client.HTTPConnection('127.0.0.1', port, timeout=30)
+    while time.monotonic() < stop_at:
+        started = time.perf_counter()
+        try:
+            connection.request('GET', random.choice(PATHS), headers={'Accept-Encoding': 'gzip'})
+            response = connection.getresponse()
+            response.read()
+            if response.status != 200:
+                errors.append(response.status)
+        except (OSError, http.client.HTTPException):
+            errors.append(0)
+            connection.close()
+            connection = http.client.HTTPConnection('127.0.0.1', port, timeout=30)
+            continue
+        latencies.append((time.perf_counter() - started) * 1000)
+    connection.close()
+
+
+def _run(mode: str, clients: int, seconds: float) -> Dict[str, float]:
+    port = _free_port()
+    env = dict(os.environ, FLASK_RUN_PORT=str(port), FLASK_DEBUG='0', FLASK_ENV='production',
+               LOG_LEVEL='WARNING', RATE_LIMIT_DEFAULTS='100000000 per minute')
+    command = [sys.executable, 'run.py'] + (['--production'] if mode == 'production' else [])
+    server = subprocess.Popen(command, cwd=PROJECT_ROOT, env=env,
+                              stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        _wait_for(port)
+        time.sleep(1)  # let every worker finish booting
+        latencies: List[float] = []
+        errors: List[int] = []
+        stop_at = time.monotonic() + seconds
+        threads = [threading.Thread(target=_client, args=(port, stop_at, latencies, errors)) for _ in range(clients)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        server.terminate()
+        server.wait(timeout=30)
+
+    latencies.sort()
+
+    def percentile(fraction: float) -> float:
+        return latencies[min(len(latencies) - 1, int(len(latencies) * fraction))] if latencies else 0.0
+
+    return {
+        'requests': len(latencies),
+        'rps': len(latencies) / seconds,
+        'p50': percentile(0.50),
+        'p99': percentile(0.99),
+        'errors': len(errors),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--clients', type=int, default=32, help='concurrent keep-alive connections')
+    parser.add_argument('--seconds', type=float, default=10.0)
+    args = parser.parse_args()
+
+    sys.path.insert(0, PROJECT_ROOT)
+    from app.serving import available_cores, serving_options
+
+    options = serving_options()
+    print(f"cores {available_cores()}, production sizing {options['workers']} workers x {options['threads']} threads, "
+          f"{args.clients} clients for {args.seconds:.0f}s")
+    print(f"{'server':<12} {'req/s':>9} {'p50 ms':>9} {'p99 ms':>9} {'errors':>7}")
+    for mode in ('dev', 'production'):
+        result = _run(mode, args.clients, args.seconds)
+        print(f"{mode:<12} {result['rps']:>9.0f} {result['p50']:>9.2f} {result['p99']:>9.2f} {result['errors']:>7}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,77 @@
+"""
+Template Cache Benchmark
+
+Measures first-render latency of the homepage in fresh processes (as a new
+worker would see it) without a bytecode cache, with an empty cache and with
+a precompiled cache.
+
+Usage:
+    python scripts/bench_template_cache.py [--runs N]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Runs in a fresh interpreter: time the first render of every template the page needs
+CHILD = """
+import json, time
+from app import create_app
+from app.data.snapshot import get_snapshot
+from app.routes.fragments import SECTIONS
+from flask import render_template
+app = create_app()
+snapshot = get_snapshot()
+with app.test_request_context('/'):
+    started = time.perf_counter()
+    render_template('index.html', stats=snapshot.resources['stats'])
+    index_done = time.perf_counter()
+    for section in SECTIONS:
+        render_template(f'partials/{section}.html', items=snapshot.resources[section])
+    finished = time.perf_counter()
+print(json.dumps({'index_ms': (index_done - started) * 1000, 'all_ms': (finished - started) * 1000}))
+"""
+
+
+def _first_render(cache_dir: str) -> dict:
+    env = dict(os.environ, PRELOAD_APP='false', TEMPLATE_CACHE_DIR=cache_dir, LOG_LEVEL='WARNING')
+    output = subprocess.run(
+        [sys.executable, '-c', CHILD], cwd=PROJECT_ROOT, env=env,
+        capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--runs', type=int, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as root:
+        precompiled = os.path.join(root, 'precompiled')
+        subprocess.run(
+            [sys.executable, os.path.join('scripts', 'precompile_templates.py')], cwd=PROJECT_ROOT,
+            env=dict(os.environ, TEMPLATE_CACHE_DIR=precompiled, LOG_LEVEL='WARNING'),
+            capture_output=True, check=True
+        )
+        modes = {
+            'no cache': lambda run: '',
+            'empty cache': lambda run: os.path.join(root, f'empty-{run}'),
+            'precompiled': lambda run: precompiled,
+        }
+        print(f"{'mode':<14} {'index.html ms':>14} {'page + partials ms':>19}   (median of {args.runs} fresh processes)")
+        for mode, cache_dir in modes.items():
+            results = [_first_render(cache_dir(run)) for run in range(args.runs)]
+            index_ms = statistics.median(result['index_ms'] for result in results)
+            all_ms = statistics.median(result['all_ms'] for result in results)
+            print(f"{mode:<14} {index_ms:>14.2f} {all_ms:>19.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+"""
+Multi-Tenant Benchmark
+
+Generates N tenants (copies of the built-in portfolio) in a temporary
+TENANTS_DIR, then requests random tenants and reports cold and warm latency,
+snapshot cache size and process RSS under a given memory budget.
+
+Usage:
+    python scripts/bench_tenants.py [--tenants N] [--requests N] [--budget-mb MB]
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _make_tenants(root: str, count: int) -> None:
+    """Write `count` tenant directories with the built-in portfolio data."""
+    from app.data.snapshot import load_default_resources
+
+    portfolio = json.dumps(load_default_resources())
+    for number in range(count):
+        path = os.path.join(root, f'tenant-{number}')
+        os.makedirs(path)
+        with open(os.path.join(path, 'portfolio.json'), 'w', encoding='utf-8') as handle:
+            handle.write(portfolio.replace('AccessVault', f'AccessVault {number}'))
+        with open(os.path.join(path, 'tenant.json'), 'w', encoding='utf-8') as handle:
+            json.dump({'hosts': [f'tenant-{number}.example.com']}, handle)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--tenants', type=int, default=2000)
+    parser.add_argument('--requests', type=int, default=10000)
+    parser.add_argument('--budget-mb', type=int, default=16)
+    args = parser.parse_args()
+
+    sys.path.insert(0, PROJECT_ROOT)
+    with tempfile.TemporaryDirectory() as root:
+        os.environ.update(
+            TENANTS_DIR=root,
+            TENANT_CACHE_MAX_BYTES=str(args.budget_mb * 1024 * 1024),
+            RATE_LIMIT_DEFAULTS='1000000 per minute',
+        )
+        from app import create_app
+        from app.data.snapshot import _tenant_stores
+        from app.preload import get_rss_bytes
+
+        _make_tenants(root, args.tenants)
+        client = create_app().test_client()
+
+        seen = set()
+        cold, warm = [], []
+        for _ in range(args.requests):
+            number = random.randrange(args.tenants)
+            started = time.perf_counter()
+            client.get('/api/projects', headers={'Host': f'tenant-{number}.example.com'})
+            elapsed = (time.perf_counter() - started) * 1000
+            (warm if number in seen else cold).append(elapsed)
+            seen.add(number)
+
+        def mean(values):
+            return sum(values) / len(values) if values else 0.0
+
+        print(f"tenants             {args.tenants}")
+        print(f"requests            {args.requests} ({len(cold)} first-visit)")
+        print(f"first-visit ms      {mean(cold):.2f}")
+        print(f"repeat-visit ms     {mean(warm):.2f}")
+        print(f"cached snapshots    {len(_tenant_stores)} ({_tenant_stores.nbytes / 2**20:.1f} MB, budget {args.budget_mb} MB)")
+        print(f"process RSS         {(get_rss_bytes() or 0) / 2**20:.1f} MB")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,31 @@
+"""
+Precompile Templates
+
+Build step that compiles every Jinja template into the bytecode cache
+(TEMPLATE_CACHE_DIR), so workers load compiled templates on first render.
+Run it after deploying new templates, before starting the server.
+
+Usage:
+    python scripts/precompile_templates.py
+"""
+
+import os
+import sys
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def main() -> None:
+    sys.path.insert(0, PROJECT_ROOT)
+    # Compiling is all this needs; skip the full warm-up
+    os.environ['PRELOAD_APP'] = 'false'
+    from app import create_app
+    from app.templating import precompile_templates
+
+    app = create_app()
+    names = precompile_templates(app)
+    print(f"Compiled {len(names)} templates into {app.config['TEMPLATE_CACHE_DIR']}")
+
+
+if __name__ == '__main__':
+    main()
@@ -132,230 +132,147 @@ animatableSelectors.forEach(selector => {
 });
 
 /**
- * API Functions
- * Fetch portfolio data from backend API and render dynamically
+ * Section Loading
+ * Data-driven sections are rendered on the server as HTML fragments and
+ * fetched only when they approach the viewport
  */
 
 /**
- * Fetch data from API endpoint
+ * Persistent section cache (localStorage), bounded to CACHE_MAX_BYTES.
+ * Entries are evicted least-recently-used first; the index tracks each
+ * entry's size and last use.
  */
-async function fetchAPI(endpoint) {
+const CACHE_PREFIX = 'portfolio:cache:';
+const CACHE_INDEX_KEY = 'portfolio:cache-index';
+const CACHE_MAX_BYTES = 512 * 1024;
+
+function readCacheIndex() {
     try {
-        const response = await fetch(`/api/${endpoint}`);
-        const data = await response.json();
-        if (data.success) {
-            return data.data;
-        }
-        throw new Error(data.message || 'Failed to fetch data');
-    } catch (error) {
-        console.error(`Error fetching ${endpoint}:`, error);
-        return null;
+        return JSON.parse(localStorage.getItem(CACHE_INDEX_KEY)) || {};
+    } catch {
+        return {};
     }
 }
 
-/**
- * Render projects dynamically
- */
-const API_ERROR_MSG = '<p style="text-align: center; color: var(--text-secondary);">Unable to load. Please refresh the page.</p>';
-
-async function renderProjects() {
-    const projectsGrid = document.querySelector('.projects-grid');
-    if (!projectsGrid) return;
-
-    const projects = await fetchAPI('projects');
-    if (!projects || projects.length === 0) {
-        projectsGrid.innerHTML = API_ERROR_MSG;
-        return;
+function writeCacheIndex(index) {
+    try {
+        localStorage.setItem(CACHE_INDEX_KEY, JSON.stringify(index));
+    } catch {
+        // Storage disabled: the cache simply stays empty
     }
-
-    projectsGrid.innerHTML = projects.map(project => {
-        const linksHTML = project.links.map(link => {
-            const iconClass = link.type === 'live' ? 'fas fa-external-link-alt' : 'fab fa-github';
-            const ariaLabel = link.type === 'live' ? 'View Project' : 'View Code';
-            return `<a href="${link.url}" target="_blank" rel="noopener noreferrer" class="project-link" aria-label="${ariaLabel}">
-                <i class="${iconClass}"></i>
-            </a>`;
-        }).join('');
-
-        const tagsHTML = project.tags.map(tag => `<span class="tag">${tag}</span>`).join('');
-
-        return `
-            <div class="project-card">
-                <div class="project-image">
-                    <div class="project-placeholder">
-                        <i class="${project.icon}"></i>
-                    </div>
-                </div>
-                <div class="project-content">
-                    <div class="project-header">
-                        <h3 class="project-title">${project.title}</h3>
-                        <div class="project-links">${linksHTML}</div>
-                    </div>
-                    <p class="project-description">${project.description}</p>
-                    <div class="project-tags">${tagsHTML}</div>
-                </div>
-            </div>
-        `;
-    }).join('');
-
-    // Re-observe new project cards for animations
-    document.querySelectorAll('.project-card').forEach(card => {
-        animationObserver.observe(card);
-    });
 }
 
-/**
- * Render skills dynamically
- */
-async function renderSkills() {
-    const skillsGrid = document.querySelector('.skills-grid');
-    if (!skillsGrid) return;
-
-    const skills = await fetchAPI('skills');
-    if (!skills || skills.length === 0) {
-        skillsGrid.innerHTML = API_ERROR_MSG;
-        return;
+function evictCacheEntry(index, name) {
+    try {
+        localStorage.removeItem(CACHE_PREFIX + name);
+    } catch {
+        // Ignore: entry is dropped from the index either way
     }
-
-    skillsGrid.innerHTML = skills.map(category => {
-        const skillsHTML = category.skills.map(skill => `<span class="skill-tag">${skill}</span>`).join('');
-        return `
-            <div class="skill-category">
-                <h3 class="category-title">${category.title}</h3>
-                <div class="skill-tags">${skillsHTML}</div>
-            </div>
-        `;
-    }).join('');
-
-    // Re-observe new skill categories for animations
-    document.querySelectorAll('.skill-category').forEach(category => {
-        animationObserver.observe(category);
-    });
+    delete index[name];
 }
 
-/**
- * Render experience dynamically
- */
-async function renderExperience() {
-    const experienceTimeline = document.querySelector('.experience-timeline');
-    if (!experienceTimeline) return;
-
-    const experience = await fetchAPI('experience');
-    if (!experience || experience.length === 0) {
-        experienceTimeline.innerHTML = API_ERROR_MSG;
-        return;
+function cacheGet(name) {
+    try {
+        const raw = localStorage.getItem(CACHE_PREFIX + name);
+        if (raw === null) return null;
+        const index = readCacheIndex();
+        index[name] = { size: raw.length, usedAt: Date.now() };
+        writeCacheIndex(index);
+        return JSON.parse(raw);
+    } catch {
+        return null;
     }
-
-    experienceTimeline.innerHTML = experience.map(exp => {
-        const descriptionHTML = exp.description.map(desc => `<li>${desc}</li>`).join('');
-        const tagsHTML = exp.tags.map(tag => `<span class="experience-tag">${tag}</span>`).join('');
-
-        return `
-            <div class="experience-item">
-                <div class="experience-dot"></div>
-                <div class="experience-content">
-                    <div class="experience-period">${exp.period}</div>
-                    <h3 class="experience-title">${exp.title}</h3>
-                    <div class="experience-company">${exp.company} – ${exp.location}</div>
-                    <ul class="experience-description">${descriptionHTML}</ul>
-                    <div class="experience-tags">${tagsHTML}</div>
-                </div>
-            </div>
-        `;
-    }).join('');
-
-    // Re-observe new experience items for animations
-    document.querySelectorAll('.experience-item').forEach(item => {
-        animationObserver.observe(item);
-    });
 }
 
-/**
- * Render education dynamically
- */
-async function renderEducation() {
-    const educationTimeline = document.querySelector('.education-timeline');
-    if (!educationTimeline) return;
-
-    const education = await fetchAPI('education');
-    if (!education || education.length === 0) {
-        educationTimeline.innerHTML = API_ERROR_MSG;
-        return;
+function cachePut(name, value) {
+    const serialized = JSON.stringify(value);
+    if (serialized.length > CACHE_MAX_BYTES) return;
+
+    const index = readCacheIndex();
+    delete index[name];
+    const byLeastRecentUse = Object.keys(index).sort((a, b) => index[a].usedAt - index[b].usedAt);
+    let total = Object.values(index).reduce((sum, entry) => sum + entry.size, 0);
+    while (total + serialized.length > CACHE_MAX_BYTES && byLeastRecentUse.length) {
+        const oldest = byLeastRecentUse.shift();
+        total -= index[oldest].size;
+        evictCacheEntry(index, oldest);
     }
 
-    educationTimeline.innerHTML = education.map(edu => `
-        <div class="education-item">
-            <div class="education-dot"></div>
-            <div class="education-content">
-                <div class="education-period">${edu.period}</div>
-                <h3 class="education-title">${edu.title}</h3>
-                <div class="education-institution">${edu.institution}</div>
-                <div class="education-location">${edu.location}</div>
-                <div class="education-grade">${edu.grade}</div>
-            </div>
-        </div>
-    `).join('');
-
-    // Re-observe new education items for animations
-    document.querySelectorAll('.education-item').forEach(item => {
-        animationObserver.observe(item);
-    });
+    // The browser quota may be smaller than our budget: evict until it fits
+    for (;;) {
+        try {
+            localStorage.setItem(CACHE_PREFIX + name, serialized);
+            index[name] = { size: serialized.length, usedAt: Date.now() };
+            break;
+        } catch {
+            if (!byLeastRecentUse.length) break;
+            evictCacheEntry(index, byLeastRecentUse.shift());
+        }
+    }
+    writeCacheIndex(index);
 }
 
+// URL prefix the page is served under (e.g. /t/<slug> for a tenant), '' at the root
+const BASE_PATH = document.body.dataset.basePath || '';
+
+const API_ERROR_MSG = '<p style="text-align: center; color: var(--text-secondary);">Unable to load. Please refresh the page.</p>';
+
 /**
- * Render certifications dynamically
+ * Insert a section's HTML and observe its new elements for animations
  */
-async function renderCertifications() {
-    const certificationsGrid = document.querySelector('.certifications-grid');
-    if (!certificationsGrid) return;
-
-    const certifications = await fetchAPI('certifications');
-    if (!certifications || certifications.length === 0) {
-        certificationsGrid.innerHTML = API_ERROR_MSG;
-        return;
-    }
-
-    certificationsGrid.innerHTML = certifications.map(cert => `
-        <div class="certification-card">
-            <div class="certification-icon">
-                <i class="${cert.icon}"></i>
-            </div>
-            <h3 class="certification-title">${cert.title}</h3>
-            <div class="certification-issuer">${cert.issuer}</div>
-            <div class="certification-description">${cert.description}</div>
-        </div>
-    `).join('');
-
-    // Re-observe new certification cards for animations
-    document.querySelectorAll('.certification-card').forEach(card => {
-        animationObserver.observe(card);
+function paintSection(container, html) {
+    container.innerHTML = html;
+    container.querySelectorAll(animatableSelectors.join(',')).forEach(element => {
+        animationObserver.observe(element);
     });
 }
 
 /**
- * Update statistics from API
+ * Load a section fragment, stale-while-revalidate: paint the cached HTML
+ * right away, then revalidate with its ETag and repaint only if it changed.
  */
-async function updateStats() {
-    const stats = await fetchAPI('stats');
-    if (!stats) return;
-
-    const statElements = {
-        'github_projects': document.querySelector('.stat-item:nth-child(1) .stat-number'),
-        'live_projects': document.querySelector('.stat-item:nth-child(2) .stat-number'),
-        'years_experience': document.querySelector('.stat-item:nth-child(3) .stat-number')
-    };
-
-    if (statElements.github_projects) {
-        statElements.github_projects.textContent = stats.github_projects;
-    }
-    if (statElements.live_projects) {
-        statElements.live_projects.textContent = stats.live_projects;
+async function loadSection(container) {
+    const name = container.dataset.fragment;
+    const cacheName = `fragment:${BASE_PATH}/${name}`;
+    const cached = cacheGet(cacheName);
+    if (cached) {
+        paintSection(container, cached.html);
     }
-    if (statElements.years_experience) {
-        statElements.years_experience.textContent = stats.years_experience;
+
+    try {
+        const headers = cached ? { 'If-None-Match': cached.etag } : {};
+        // Bypass the HTTP cache: revalidation is handled here
+        const response = await fetch(`${BASE_PATH}/fragments/${name}`, { headers, cache: 'no-store' });
+        if (response.status === 304 && cached) return;
+        if (!response.ok) {
+            throw new Error(`HTTP ${response.status}`);
+        }
+        const html = await response.text();
+        const etag = response.headers.get('ETag');
+        if (etag) cachePut(cacheName, { etag, html });
+        if (!cached || cached.html !== html) {
+            paintSection(container, html);
+        }
+    } catch (error) {
+        console.error(`Error loading ${name}:`, error);
+        if (!cached) container.innerHTML = API_ERROR_MSG;
     }
 }
 
+// Start loading a section once it is within this margin of the viewport
+const SECTION_OBSERVER_OPTIONS = {
+    rootMargin: '300px 0px'
+};
+
+const sectionObserver = new IntersectionObserver((entries, observer) => {
+    entries.forEach(entry => {
+        if (entry.isIntersecting) {
+            observer.unobserve(entry.target);
+            loadSection(entry.target);
+        }
+    });
+}, SECTION_OBSERVER_OPTIONS);
+
 // Contact form: AJAX submit, show success/error on same page
 function initContactForm() {
     const form = document.getElementById('contact-form');
@@ -398,18 +315,11 @@ function initContactForm() {
 }
 
 // Page Initialization
-document.addEventListener('DOMContentLoaded', async () => {
+document.addEventListener('DOMContentLoaded', () => {
     // Set initial active nav link
     updateActiveNavLink();
     initContactForm();
 
-    // Load data from API
-    await Promise.all([
-        renderProjects(),
-        renderSkills(),
-        renderExperience(),
-        renderEducation(),
-        renderCertifications(),
-        updateStats()
-    ]);
+    // Lazy-load data-driven sections as they approach the viewport
+    document.querySelectorAll('[data-fragment]').forEach(container => sectionObserver.observe(container));
 });